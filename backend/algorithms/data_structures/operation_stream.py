@@ -0,0 +1,331 @@
+"""
+High-Volume Stack/Queue Operation Streams
+Author: Aryan Pravin Sahu
+
+Runs long, run-length encoded operation lists ("push 5 x100000", "pop x500")
+against instrumented backends and yields small result records instead of
+per-step snapshots:
+
+- a dynamic array that doubles when full and halves when a quarter full
+  (a circular array for queues), reporting every resize and how many
+  elements it copied
+- a singly linked list (head/tail pointers for queues), which never copies
+  but pays one node object per element
+
+Each operation costs 1 plus the elements copied by any resize it triggers, so
+the summary's amortised cost per operation shows the O(1) amortised bound
+directly, next to the memory each backend needed.
+"""
+
+import re
+import sys
+import time
+
+STREAM_BACKENDS = ('array', 'linked')
+STREAM_OPERATIONS = {
+    'stack': {'add': 'push', 'remove': 'pop', 'peek': 'peek'},
+    'queue': {'add': 'enqueue', 'remove': 'dequeue', 'peek': 'front'},
+}
+MAX_STREAM_OPERATIONS = 2_000_000
+MAX_STREAM_ENTRIES = 10000
+MIN_ARRAY_CAPACITY = 4
+
+_OPERATION_PATTERN = re.compile(r'^\s*([a-z]+)(?:\s+(-?\d+(?:\.\d+)?))?(?:\s*[x×*]\s*(\d+))?\s*$')
+
+
+class _Node:
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value, next=None):
+        self.value = value
+        self.next = next
+
+
+NODE_BYTES = sys.getsizeof(_Node(None))
+
+
+class _Backend:
+    """Shared counters; on_resize(old_capacity, new_capacity, copied) is called on every resize"""
+
+    def __init__(self):
+        self.size = 0
+        self.resizes = 0
+        self.copies = 0
+        self.on_resize = None
+
+    def __len__(self):
+        return self.size
+
+
+class ArrayStack(_Backend):
+    def __init__(self):
+        super().__init__()
+        self.slots = [None] * MIN_ARRAY_CAPACITY
+
+    @property
+    def capacity(self):
+        return len(self.slots)
+
+    def _resize(self, capacity):
+        old = len(self.slots)
+        slots = [None] * capacity
+        slots[:self.size] = self.slots[:self.size]
+        self.slots = slots
+        self.resizes += 1
+        self.copies += self.size
+        if self.on_resize is not None:
+            self.on_resize(old, capacity, self.size)
+        return self.size
+
+    def add(self, value):
+        """Push; returns the elements copied by a resize (0 if none)"""
+        copied = self._resize(2 * len(self.slots)) if self.size == len(self.slots) else 0
+        self.slots[self.size] = value
+        self.size += 1
+        return copied
+
+    def remove(self):
+        """Pop; returns (value, copied)"""
+        if not self.size:
+            raise IndexError('pop from empty stack')
+        self.size -= 1
+        value = self.slots[self.size]
+        self.slots[self.size] = None
+        copied = 0
+        if len(self.slots) > MIN_ARRAY_CAPACITY and self.size <= len(self.slots) // 4:
+            copied = self._resize(len(self.slots) // 2)
+        return value, copied
+
+    def peek(self):
+        if not self.size:
+            raise IndexError('peek on empty stack')
+        return self.slots[self.size - 1]
+
+    def memory_bytes(self):
+        return sys.getsizeof(self.slots)
+
+
+class ArrayQueue(ArrayStack):
+    """Circular dynamic array; a resize unwraps the elements to start at slot 0"""
+
+    def __init__(self):
+        super().__init__()
+        self.head = 0
+
+    def _resize(self, capacity):
+        old = len(self.slots)
+        slots = [None] * capacity
+        for i in range(self.size):
+            slots[i] = self.slots[(self.head + i) % old]
+        self.slots = slots
+        self.head = 0
+        self.resizes += 1
+        self.copies += self.size
+        if self.on_resize is not None:
+            self.on_resize(old, capacity, self.size)
+        return self.size
+
+    def add(self, value):
+        copied = self._resize(2 * len(self.slots)) if self.size == len(self.slots) else 0
+        self.slots[(self.head + self.size) % len(self.slots)] = value
+        self.size += 1
+        return copied
+
+    def remove(self):
+        if not self.size:
+            raise IndexError('dequeue from empty queue')
+        value = self.slots[self.head]
+        self.slots[self.head] = None
+        self.head = (self.head + 1) % len(self.slots)
+        self.size -= 1
+        copied = 0
+        if len(self.slots) > MIN_ARRAY_CAPACITY and self.size <= len(self.slots) // 4:
+            copied = self._resize(len(self.slots) // 2)
+        return value, copied
+
+    def peek(self):
+        if not self.size:
+            raise IndexError('front of empty queue')
+        return self.slots[self.head]
+
+
+class LinkedStack(_Backend):
+    def __init__(self):
+        super().__init__()
+        self.head = None
+
+    capacity = None
+
+    def add(self, value):
+        self.head = _Node(value, self.head)
+        self.size += 1
+        return 0
+
+    def remove(self):
+        if self.head is None:
+            raise IndexError('pop from empty stack')
+        node = self.head
+        self.head = node.next
+        self.size -= 1
+        return node.value, 0
+
+    def peek(self):
+        if self.head is None:
+            raise IndexError('peek on empty stack')
+        return self.head.value
+
+    def memory_bytes(self):
+        return self.size * NODE_BYTES
+
+
+class LinkedQueue(LinkedStack):
+    def __init__(self):
+        super().__init__()
+        self.tail = None
+
+    def add(self, value):
+        node = _Node(value)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.size += 1
+        return 0
+
+    def remove(self):
+        value, copied = super().remove()
+        if self.head is None:
+            self.tail = None
+        return value, copied
+
+
+BACKENDS = {
+    ('stack', 'array'): ArrayStack,
+    ('stack', 'linked'): LinkedStack,
+    ('queue', 'array'): ArrayQueue,
+    ('queue', 'linked'): LinkedQueue,
+}
+
+
+def parse_run_length(entries, structure):
+    """
+    Normalise operations to (name, value, count) runs. Accepted entries:
+    [name, value], [name, value, count] or strings like 'push 5 x1000', 'pop x20', 'peek'.
+    Raises ValueError for unknown names, a push/enqueue without a value, bad counts
+    or too many operations in total.
+    """
+    names = set(STREAM_OPERATIONS[structure].values())
+    add_name = STREAM_OPERATIONS[structure]['add']
+    if len(entries) > MAX_STREAM_ENTRIES:
+        raise ValueError(f'At most {MAX_STREAM_ENTRIES} operation entries are allowed')
+    runs, total = [], 0
+    for entry in entries:
+        if isinstance(entry, str):
+            match = _OPERATION_PATTERN.match(entry.lower())
+            if match is None:
+                raise ValueError(f"Cannot parse operation '{entry}' (expected e.g. 'push 5 x1000')")
+            name, value, count = match.groups()
+            if value is not None:
+                value = float(value) if '.' in value else int(value)
+            count = int(count) if count is not None else 1
+        elif isinstance(entry, (list, tuple)) and len(entry) in (2, 3):
+            name, value = entry[0], entry[1]
+            count = entry[2] if len(entry) == 3 else 1
+        else:
+            raise ValueError('Each operation must be [name, value], [name, value, count] or a string')
+        if not isinstance(name, str) or name not in names:
+            raise ValueError(f"Unknown {structure} operation '{name}' (use {', '.join(sorted(names))})")
+        if name == add_name and value is None:
+            raise ValueError(f"'{add_name}' needs a value (e.g. '{add_name} 5 x1000')")
+        if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+            raise ValueError('Operation counts must be positive integers')
+        total += count
+        if total > MAX_STREAM_OPERATIONS:
+            raise ValueError(f'At most {MAX_STREAM_OPERATIONS} operations per stream')
+        runs.append((name, value, count))
+    return runs
+
+
+def run_stream(structure, backend, operations):
+    """
+    Execute run-length encoded operations; returns an iterator of records produced as they happen:
+    one 'header', a 'resize' record per array resize, one 'run' record per
+    entry (final size, capacity and memory after the run) and a closing 'summary'.
+    A resize record's op_index is the 0-based index of the operation that triggered it;
+    the summary's seconds cover only executing the operations, not consuming the records.
+    """
+    if (structure, backend) not in BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(STREAM_BACKENDS)}")
+    # Validate eagerly so bad input fails before the first record is streamed
+    return _records(structure, backend, parse_run_length(operations, structure))
+
+
+def _records(structure, backend, runs):
+    names = STREAM_OPERATIONS[structure]
+    container = BACKENDS[(structure, backend)]()
+    resizes = []
+    op_index = 0
+    container.on_resize = lambda old, new, copied: resizes.append({
+        'type': 'resize', 'op_index': op_index, 'from_capacity': old, 'to_capacity': new,
+        'copied': copied, 'memory_bytes': container.memory_bytes()
+    })
+
+    yield {'type': 'header', 'structure': structure, 'backend': backend,
+           'entries': len(runs), 'operations': sum(count for _, _, count in runs)}
+
+    total_cost = 0
+    peak_memory = container.memory_bytes()
+    elapsed = 0.0
+    for name, value, count in runs:
+        failed = 0
+        last = None
+        # Time each run on its own so the consumer's work between yields is not counted
+        started = time.perf_counter()
+        if name == names['add']:
+            add = container.add
+            for _ in range(count):
+                total_cost += 1 + add(value)
+                op_index += 1
+            last = value
+        elif name == names['remove']:
+            remove = container.remove
+            for _ in range(count):
+                total_cost += 1
+                try:
+                    last, copied = remove()
+                    total_cost += copied
+                except IndexError:
+                    failed += 1
+                op_index += 1
+        else:
+            op_index += count
+            total_cost += count
+            try:
+                last = container.peek()
+            except IndexError:
+                failed = count
+        elapsed += time.perf_counter() - started
+
+        # Memory only shrinks on a resize, so the peak is reached at the end of add runs
+        memory = container.memory_bytes()
+        peak_memory = max(peak_memory, memory, *(event['memory_bytes'] for event in resizes))
+        yield from resizes
+        resizes.clear()
+        yield {'type': 'run', 'op': name, 'count': count, 'failed': failed, 'last_value': last,
+               'op_index': op_index, 'size': len(container), 'capacity': container.capacity,
+               'memory_bytes': memory}
+
+    yield {
+        'type': 'summary',
+        'operations': op_index,
+        'total_cost': total_cost,
+        'amortized_cost_per_op': total_cost / op_index if op_index else 0.0,
+        'resizes': container.resizes,
+        'elements_copied': container.copies,
+        'final_size': len(container),
+        'final_memory_bytes': container.memory_bytes(),
+        'peak_memory_bytes': peak_memory,
+        'seconds': elapsed,
+        'ns_per_op': elapsed / op_index * 1e9 if op_index else 0.0
+    }
@@ -0,0 +1,232 @@
+"""
+Indexed Priority Queue (d-ary Min-Heap with Decrease-Key)
+Author: Aryan Pravin Sahu
+
+IndexedMinHeap keeps integer keys in an array-backed heap with a position
+index, so decrease-key is a sift-up from the key's known slot rather than a
+stale duplicate entry. The arity d trades sift-up depth (log_d n levels) for
+sift-down width (d - 1 comparisons per level): a 4-ary heap is shallower and
+its children share a cache line, which pays off when decrease-keys outnumber
+pops, as in Dijkstra on dense graphs.
+
+The module-level sift_down / heapify work in place on a plain list for
+algorithms such as heap sort; sift_down_events is the traced variant, yielding
+every comparison and swap for visualisation.
+"""
+
+import operator
+
+# sift_down_events events
+COMPARE = 'compare'
+SWAP = 'swap'
+SWAPPED = 'swapped'
+
+MAX_ARITY = 16
+
+
+def check_arity(arity):
+    if not isinstance(arity, int) or isinstance(arity, bool) or not 2 <= arity <= MAX_ARITY:
+        raise ValueError(f'arity must be an integer between 2 and {MAX_ARITY}')
+
+
+class IndexedMinHeap:
+    """
+    d-ary min-heap over integer keys 0..capacity-1 (binary by default).
+    A position index maps every key to its slot in the heap array, so
+    decrease-key is O(log_d n) and the heap never holds stale duplicate entries.
+    Ties on priority are broken by the smaller key.
+
+    With traced=True every slot assignment is recorded in `moves` as [key, slot]
+    ([key, None] when a key leaves the heap); drain_moves() hands them out.
+    """
+
+    def __init__(self, capacity, arity=2, traced=False):
+        check_arity(arity)
+        self.arity = arity
+        self.heap = []
+        self.priorities = [None] * capacity
+        self.position = [-1] * capacity
+        self.moves = [] if traced else None
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, key):
+        return self.position[key] != -1
+
+    def priority(self, key):
+        return self.priorities[key] if key in self else None
+
+    def peek(self):
+        """Return (key, priority) of the minimum without removing it"""
+        if not self.heap:
+            raise IndexError('peek from an empty heap')
+        key = self.heap[0]
+        return key, self.priorities[key]
+
+    def push(self, key, priority):
+        """Insert a key that is not yet in the heap"""
+        if key in self:
+            raise KeyError(f'Key {key} is already in the heap')
+        self.priorities[key] = priority
+        self.position[key] = len(self.heap)
+        self.heap.append(key)
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        """Remove and return (key, priority) with the smallest priority"""
+        if not self.heap:
+            raise IndexError('pop from an empty heap')
+        key = self.heap[0]
+        last = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        self.position[key] = -1
+        if self.moves is not None:
+            self.moves.append([key, None])
+        return key, self.priorities[key]
+
+    def decrease_key(self, key, priority):
+        """Lower the priority of a key already in the heap"""
+        if key not in self:
+            raise KeyError(f'Key {key} is not in the heap')
+        if priority > self.priorities[key]:
+            raise ValueError('decrease_key cannot increase a priority')
+        self.priorities[key] = priority
+        self._sift_up(self.position[key])
+
+    def push_or_decrease(self, key, priority):
+        """
+        Insert key, or lower its priority if it is already queued.
+        Returns the operation performed: 'push', 'decrease_key' or None (no improvement).
+        """
+        if key not in self:
+            self.push(key, priority)
+            return 'push'
+        if priority < self.priorities[key]:
+            self.decrease_key(key, priority)
+            return 'decrease_key'
+        return None
+
+    def heapify(self, items):
+        """
+        Add many (key, priority) pairs at once: append them all, then sift down
+        every internal slot from the bottom up, O(n + k) instead of O(k log n).
+        """
+        heap, position, priorities = self.heap, self.position, self.priorities
+        for key, priority in items:
+            if position[key] != -1:
+                raise KeyError(f'Key {key} is already in the heap')
+            priorities[key] = priority
+            position[key] = len(heap)
+            heap.append(key)
+        if self.moves is not None:
+            self.moves.extend([key, slot] for slot, key in enumerate(heap))
+        for index in range((len(heap) - 2) // self.arity, -1, -1):
+            self._sift_down(index)
+
+    def drain_moves(self):
+        """Return the recorded [key, slot] moves and start a new list (traced heaps only)"""
+        moves, self.moves = self.moves, []
+        return moves
+
+    def _less(self, a, b):
+        pa, pb = self.priorities[a], self.priorities[b]
+        return pa < pb or (pa == pb and a < b)
+
+    def _sift_up(self, index):
+        heap, position, moves = self.heap, self.position, self.moves
+        arity = self.arity
+        key = heap[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            if not self._less(key, heap[parent]):
+                break
+            heap[index] = heap[parent]
+            position[heap[index]] = index
+            if moves is not None:
+                moves.append([heap[index], index])
+            index = parent
+        heap[index] = key
+        position[key] = index
+        if moves is not None:
+            moves.append([key, index])
+
+    def _sift_down(self, index):
+        heap, position, moves = self.heap, self.position, self.moves
+        arity, less = self.arity, self._less
+        size = len(heap)
+        key = heap[index]
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            child = first
+            for other in range(first + 1, min(first + arity, size)):
+                if less(heap[other], heap[child]):
+                    child = other
+            if not less(heap[child], key):
+                break
+            heap[index] = heap[child]
+            position[heap[index]] = index
+            if moves is not None:
+                moves.append([heap[index], index])
+            index = child
+        heap[index] = key
+        position[key] = index
+        if moves is not None:
+            moves.append([key, index])
+
+
+def sift_down(array, index, size, arity=2, above=operator.lt):
+    """
+    Move array[index] down within array[:size] until no child belongs above it.
+    above(a, b) is True when a must sit above b: operator.lt gives a min-heap,
+    operator.gt a max-heap.
+    """
+    value = array[index]
+    while True:
+        first = arity * index + 1
+        if first >= size:
+            break
+        child = first
+        for other in range(first + 1, min(first + arity, size)):
+            if above(array[other], array[child]):
+                child = other
+        if not above(array[child], value):
+            break
+        array[index] = array[child]
+        index = child
+    array[index] = value
+
+
+def heapify(array, arity=2, above=operator.lt):
+    """Rearrange array into a d-ary heap in place in O(n), sifting down from the last parent"""
+    size = len(array)
+    for index in range((size - 2) // arity, -1, -1):
+        sift_down(array, index, size, arity, above)
+    return array
+
+
+def sift_down_events(array, index, size, arity=2, above=operator.lt):
+    """
+    Traced sift_down. Yields (COMPARE, best, child) before each comparison, where
+    best is the slot currently chosen to go on top, then (SWAP, index, best) just
+    before and (SWAPPED, index, best) just after each exchange. The array is
+    updated in place as the generator is consumed.
+    """
+    while True:
+        best = index
+        first = arity * index + 1
+        for child in range(first, min(first + arity, size)):
+            yield COMPARE, best, child
+            if above(array[child], array[best]):
+                best = child
+        if best == index:
+            return
+        yield SWAP, index, best
+        array[index], array[best] = array[best], array[index]
+        yield SWAPPED, index, best
+        index = best
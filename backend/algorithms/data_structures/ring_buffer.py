@@ -0,0 +1,234 @@
+"""
+Ring-Buffer and Deque-Backed Queues with Delta Traces
+Author: Aryan Pravin Sahu
+
+A fixed-capacity ring buffer keeps a head index (front slot) and a tail index
+(next free slot) that wrap modulo the capacity, so enqueue and dequeue are
+O(1) and never shift elements (list.pop(0) moves the whole queue). The
+unbounded variant wraps collections.deque and reports logical head/tail
+positions (elements dequeued / enqueued so far).
+
+Trace steps carry only what an operation changed: the element, the slot it
+was written to or read from, and the pointer that moved. expand_queue_trace
+replays them into the legacy snapshot format of QueueOperations.
+"""
+
+from collections import deque
+
+QUEUE_IMPLEMENTATIONS = ('deque', 'ring')
+QUEUE_OPERATIONS = ('enqueue', 'dequeue', 'front')
+MAX_RING_CAPACITY = 1024
+
+
+class QueueFullError(Exception):
+    """Enqueue on a ring buffer that is at capacity"""
+
+
+class QueueEmptyError(Exception):
+    """Dequeue or front on an empty queue"""
+
+
+class RingBufferQueue:
+    """Fixed-capacity FIFO queue over a circular slot array"""
+
+    def __init__(self, capacity):
+        if not 1 <= capacity <= MAX_RING_CAPACITY:
+            raise ValueError(f'capacity must be between 1 and {MAX_RING_CAPACITY}')
+        self.capacity = capacity
+        self.slots = [None] * capacity
+        self.head = 0
+        self.tail = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def enqueue(self, value):
+        """Write value at tail; returns the slot used"""
+        if self.size == self.capacity:
+            raise QueueFullError(f'Queue is full (capacity {self.capacity})')
+        slot = self.tail
+        self.slots[slot] = value
+        self.tail = (slot + 1) % self.capacity
+        self.size += 1
+        return slot
+
+    def dequeue(self):
+        """Remove the front element; returns (value, slot)"""
+        if not self.size:
+            raise QueueEmptyError('Queue is empty')
+        slot = self.head
+        value = self.slots[slot]
+        self.slots[slot] = None
+        self.head = (slot + 1) % self.capacity
+        self.size -= 1
+        return value, slot
+
+    def front(self):
+        """(value, slot) of the front element"""
+        if not self.size:
+            raise QueueEmptyError('Queue is empty')
+        return self.slots[self.head], self.head
+
+    def to_list(self):
+        """Elements front to rear"""
+        return [self.slots[(self.head + i) % self.capacity] for i in range(self.size)]
+
+
+class DequeQueue:
+    """
+    Unbounded FIFO queue backed by collections.deque. head and tail are logical
+    positions: the number of elements ever dequeued and ever enqueued.
+    """
+
+    def __init__(self):
+        self.items = deque()
+        self.head = 0
+        self.tail = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def size(self):
+        return len(self.items)
+
+    def enqueue(self, value):
+        self.items.append(value)
+        self.tail += 1
+        return self.tail - 1
+
+    def dequeue(self):
+        if not self.items:
+            raise QueueEmptyError('Queue is empty')
+        self.head += 1
+        return self.items.popleft(), self.head - 1
+
+    def front(self):
+        if not self.items:
+            raise QueueEmptyError('Queue is empty')
+        return self.items[0], self.head
+
+    def to_list(self):
+        return list(self.items)
+
+
+def make_queue(implementation='deque', capacity=None):
+    if implementation == 'ring':
+        return RingBufferQueue(capacity if capacity is not None else 8)
+    if implementation == 'deque':
+        if capacity is not None:
+            raise ValueError('capacity only applies to implementation=ring (the deque queue is unbounded)')
+        return DequeQueue()
+    raise ValueError(f"implementation must be one of {', '.join(QUEUE_IMPLEMENTATIONS)}")
+
+
+def parse_operations(operations, names=QUEUE_OPERATIONS):
+    """Normalise [[op, value], ...] / [(op, value), ...] input; raises ValueError when malformed"""
+    parsed = []
+    for entry in operations:
+        if not isinstance(entry, (list, tuple)) or len(entry) != 2 or entry[0] not in names:
+            raise ValueError(f"Each operation must be [name, value] with name in {', '.join(names)}")
+        parsed.append((entry[0], entry[1]))
+    return parsed
+
+
+def queue_trace(operations, implementation='deque', capacity=None, queue=None):
+    """
+    Compact queue trace. Each step holds the operation, the element and slot it
+    touched, and only the pointer it moved ('head' after a dequeue, 'tail' after
+    an enqueue); failed operations become 'overflow' / 'underflow' steps.
+    An existing queue can be passed in to continue from its current contents.
+    """
+    if queue is None:
+        queue = make_queue(implementation, capacity)
+    implementation = 'ring' if isinstance(queue, RingBufferQueue) else 'deque'
+    header = {
+        'structure': 'queue',
+        'implementation': implementation,
+        'capacity': getattr(queue, 'capacity', None),
+        'initial_queue': queue.to_list(),
+        'head': queue.head,
+        'tail': queue.tail
+    }
+    if implementation == 'ring':
+        header['initial_buffer'] = queue.slots.copy()
+    steps = []
+    for op, value in parse_operations(operations):
+        step = {'step': len(steps) + 1, 'operation': op}
+        try:
+            if op == 'enqueue':
+                step['value'] = value
+                step['slot'] = queue.enqueue(value)
+                step['tail'] = queue.tail
+            elif op == 'dequeue':
+                step['value'], step['slot'] = queue.dequeue()
+                step['head'] = queue.head
+            else:
+                step['value'], step['slot'] = queue.front()
+        except QueueFullError:
+            step.update(operation='overflow', value=value)
+        except QueueEmptyError:
+            step.update(operation='underflow' if op == 'dequeue' else 'front_empty', value=None)
+        steps.append(step)
+
+    header.update(total_steps=len(steps), final_size=len(queue), steps=steps)
+    return header
+
+
+def expand_queue_trace(trace):
+    """
+    Replay a compact trace into QueueOperations-style snapshots ('queue' front to
+    rear plus logical front/rear indices); ring-buffer traces also get the physical
+    'buffer', 'head' and 'tail'. Enqueue/dequeue expand into start and complete steps.
+    """
+    ring = trace['implementation'] == 'ring'
+    capacity = trace['capacity']
+    items = deque(trace['initial_queue'])
+    buffer = trace['initial_buffer'].copy() if ring else None
+    head, tail = trace['head'], trace['tail']
+    steps = []
+
+    def snapshot(operation, value, description):
+        size = len(items)
+        state = {
+            'step': len(steps),
+            'queue': list(items),
+            'operation': operation,
+            'value': value,
+            'front': 0 if size else -1,
+            'rear': size - 1 if size else -1,
+            'size': size,
+            'description': description
+        }
+        if ring:
+            state.update(buffer=buffer.copy(), head=head, tail=tail, capacity=capacity)
+        steps.append(state)
+
+    snapshot('initial', None, 'Empty queue - FIFO (First In, First Out) data structure')
+    for step in trace['steps']:
+        op, value = step['operation'], step['value']
+        if op == 'enqueue':
+            snapshot('enqueue_start', value, f'Enqueuing {value} to rear of queue')
+            items.append(value)
+            tail = step['tail']
+            if ring:
+                buffer[step['slot']] = value
+            snapshot('enqueue_complete', value, f'{value} enqueued successfully. New rear: {value}')
+        elif op == 'dequeue':
+            snapshot('dequeue_start', value, f'Dequeuing front element {value} from queue')
+            items.popleft()
+            head = step['head']
+            if ring:
+                buffer[step['slot']] = None
+            snapshot('dequeue_complete', value,
+                     f'{value} dequeued successfully. New front: {items[0] if items else "None"}')
+        elif op == 'front':
+            snapshot('front', value, f'Front element is {value}')
+        elif op == 'overflow':
+            snapshot('overflow', value, f'Cannot enqueue {value}: queue is full (Queue Overflow)')
+        elif op == 'underflow':
+            snapshot('underflow', None, 'Cannot dequeue from empty queue (Queue Underflow)')
+        else:
+            snapshot('front_empty', None, 'Cannot get front of empty queue')
+    return steps
@@ -3,6 +3,8 @@ Stack and Queue Data Structure Operations with Linear Visualization
 Author: Aryan Pravin Sahu
 """
 
+from algorithms.data_structures.ring_buffer import QUEUE_OPERATIONS, make_queue, queue_trace, expand_queue_trace
+
 class StackOperations:
     def __init__(self):
         self.stack = []
@@ -122,130 +124,22 @@ class StackOperations:
         return steps
 
 class QueueOperations:
-    def __init__(self):
-        self.queue = []
+    def __init__(self, implementation='deque', capacity=None):
+        # O(1) at both ends: deque-backed by default, or a fixed-capacity ring buffer
+        self.queue = make_queue(implementation, capacity)
     
     def operations_steps(self, operations):
         """
         Generate step-by-step queue operations
         operations: list of tuples (operation, value) e.g., [('enqueue', 5), ('dequeue', None)]
+        Unknown operation names are skipped.
         """
-        steps = []
-        
-        # Initial empty queue
-        steps.append({
-            'step': 0,
-            'queue': self.queue.copy(),
-            'operation': 'initial',
-            'value': None,
-            'front': -1,
-            'rear': -1,
-            'size': 0,
-            'description': 'Empty queue - FIFO (First In, First Out) data structure'
-        })
-        
-        step_count = 1
-        
-        for op, value in operations:
-            if op == 'enqueue':
-                # Show value being enqueued
-                steps.append({
-                    'step': step_count,
-                    'queue': self.queue.copy(),
-                    'operation': 'enqueue_start',
-                    'value': value,
-                    'front': 0 if self.queue else -1,
-                    'rear': len(self.queue) - 1 if self.queue else -1,
-                    'size': len(self.queue),
-                    'description': f'Enqueuing {value} to rear of queue'
-                })
-                step_count += 1
-                
-                # Perform enqueue
-                self.queue.append(value)
-                
-                steps.append({
-                    'step': step_count,
-                    'queue': self.queue.copy(),
-                    'operation': 'enqueue_complete',
-                    'value': value,
-                    'front': 0,
-                    'rear': len(self.queue) - 1,
-                    'size': len(self.queue),
-                    'description': f'{value} enqueued successfully. New rear: {value}'
-                })
-                step_count += 1
-                
-            elif op == 'dequeue':
-                if not self.queue:
-                    # Queue underflow
-                    steps.append({
-                        'step': step_count,
-                        'queue': self.queue.copy(),
-                        'operation': 'underflow',
-                        'value': None,
-                        'front': -1,
-                        'rear': -1,
-                        'size': 0,
-                        'description': 'Cannot dequeue from empty queue (Queue Underflow)'
-                    })
-                    step_count += 1
-                else:
-                    # Show value being dequeued
-                    dequeued_value = self.queue[0]
-                    steps.append({
-                        'step': step_count,
-                        'queue': self.queue.copy(),
-                        'operation': 'dequeue_start',
-                        'value': dequeued_value,
-                        'front': 0,
-                        'rear': len(self.queue) - 1,
-                        'size': len(self.queue),
-                        'description': f'Dequeuing front element {dequeued_value} from queue'
-                    })
-                    step_count += 1
-                    
-                    # Perform dequeue
-                    self.queue.pop(0)
-                    
-                    steps.append({
-                        'step': step_count,
-                        'queue': self.queue.copy(),
-                        'operation': 'dequeue_complete',
-                        'value': dequeued_value,
-                        'front': 0 if self.queue else -1,
-                        'rear': len(self.queue) - 1 if self.queue else -1,
-                        'size': len(self.queue),
-                        'description': f'{dequeued_value} dequeued successfully. New front: {self.queue[0] if self.queue else "None"}'
-                    })
-                    step_count += 1
-                    
-            elif op == 'front':
-                if not self.queue:
-                    steps.append({
-                        'step': step_count,
-                        'queue': self.queue.copy(),
-                        'operation': 'front_empty',
-                        'value': None,
-                        'front': -1,
-                        'rear': -1,
-                        'size': 0,
-                        'description': 'Cannot get front of empty queue'
-                    })
-                else:
-                    steps.append({
-                        'step': step_count,
-                        'queue': self.queue.copy(),
-                        'operation': 'front',
-                        'value': self.queue[0],
-                        'front': 0,
-                        'rear': len(self.queue) - 1,
-                        'size': len(self.queue),
-                        'description': f'Front element is {self.queue[0]}'
-                    })
-                step_count += 1
-        
-        return steps
+        known = [(op, value) for op, value in operations if op in QUEUE_OPERATIONS]
+        return expand_queue_trace(self.operations_trace(known))
+    
+    def operations_trace(self, operations):
+        """Compact trace: per step only the element, its slot and the pointer that moved"""
+        return queue_trace(operations, queue=self.queue)
 
 def get_sample_stack_operations():
     """Return sample stack operations for demonstration"""
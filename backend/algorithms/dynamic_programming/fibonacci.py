@@ -1,12 +1,59 @@
 """
 Fibonacci Sequence with Dynamic Programming
 Author: Aryan Pravin Sahu
+
+fibonacci_trace fills the DP table bottom-up and records only the cell each
+step fills; expand_fibonacci_trace rebuilds the legacy per-step snapshots.
+fibonacci_fast uses fast doubling, F(2k) = F(k)(2F(k+1) - F(k)) and
+F(2k+1) = F(k)^2 + F(k+1)^2, so huge n costs O(log n) big-integer
+multiplications instead of n additions. fibonacci_summary reports such
+results by digit count and digest, since converting a 200,000-digit integer
+to decimal is itself quadratic (and refused by Python's default limit).
+The top-down variant runs on the iterative memo tracer in memo_tracer.py.
 """
 
-def fibonacci_steps(n):
+import hashlib
+import math
+import time
+
+from algorithms.dynamic_programming.memo_tracer import BASE, CALL, MEMO_HIT, memo_trace
+
+MAX_FIBONACCI_N = 2_000_000
+MAX_FIBONACCI_TRACE_N = 1000
+MAX_FIBONACCI_STEPS_N = 100
+MAX_FIBONACCI_VALUE_DIGITS = 4000
+EDGE_DIGITS = 20
+
+def fibonacci_trace(n):
     """
-    Generate step-by-step Fibonacci calculation using dynamic programming
+    Compact bottom-up trace: the base cases once in the header, then one
+    {step, index, value} record per newly filled cell F(index).
+    """
+    trace = {
+        'algorithm': 'fibonacci',
+        'n': n,
+        'base_cases': {1: 1, 2: 1} if n > 2 else ({n: 1} if n > 0 else {}),
+        'total_steps': 0,
+        'steps': [],
+        'result': 0 if n <= 0 else 1
+    }
+    if n <= 2:
+        return trace
+
+    steps = trace['steps']
+    previous, current = 1, 1
+    for i in range(3, n + 1):
+        previous, current = current, previous + current
+        steps.append({'step': len(steps) + 1, 'index': i, 'value': current})
+    trace.update(total_steps=len(steps), result=current)
+    return trace
+
+def expand_fibonacci_trace(trace):
     """
+    Legacy fibonacci_steps format: every step repeats the whole dp_table, so the
+    expansion is O(n^2) in size; keep it for small n.
+    """
+    n = trace['n']
     steps = []
     
     if n <= 0:
@@ -31,10 +78,7 @@ def fibonacci_steps(n):
         })
         return steps
     
-    # Initialize DP table
-    dp = {}
-    dp[1] = 1
-    dp[2] = 1
+    dp = dict(trace['base_cases'])
     
     steps.append({
         'type': 'initialization',
@@ -45,8 +89,8 @@ def fibonacci_steps(n):
         'result': None
     })
     
-    # Calculate Fibonacci numbers iteratively
-    for i in range(3, n + 1):
+    for cell in trace['steps']:
+        i = cell['index']
         steps.append({
             'type': 'calculating',
             'message': f'Calculating F({i}) = F({i-1}) + F({i-2})',
@@ -56,7 +100,7 @@ def fibonacci_steps(n):
             'result': None
         })
         
-        dp[i] = dp[i-1] + dp[i-2]
+        dp[i] = cell['value']
         
         steps.append({
             'type': 'calculated',
@@ -78,88 +122,141 @@ def fibonacci_steps(n):
     
     return steps
 
-def fibonacci_recursive_steps(n, memo=None, steps=None, depth=0):
+def fibonacci_steps(n):
     """
-    Generate steps for recursive Fibonacci with memoization
+    Generate step-by-step Fibonacci calculation using dynamic programming
     """
-    if steps is None:
-        steps = []
-    if memo is None:
-        memo = {}
-    
-    indent = "  " * depth
-    
-    steps.append({
-        'type': 'function_call',
-        'message': f'{indent}Calling F({n})',
+    return expand_fibonacci_trace(fibonacci_trace(n))
+
+def fibonacci_pair(n):
+    """(F(n), F(n+1)) by fast doubling, walking the bits of n from the most significant"""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == '1' else (c, d)
+    return a, b
+
+def fibonacci_fast(n):
+    """F(n) in O(log n) multiplications; 0 for n <= 0 like fibonacci_simple"""
+    return fibonacci_pair(n)[0] if n > 0 else 0
+
+def decimal_digits(value):
+    """Number of decimal digits of a non-negative integer without converting it to a string"""
+    if value == 0:
+        return 1
+    # 2^(b-1) <= value < 2^b puts the digit count at k or k + 1 for k = floor(b log10 2)
+    k = int(value.bit_length() * math.log10(2))
+    return k + 1 if value >= 10 ** k else k
+
+def fibonacci_summary(n):
+    """
+    F(n) described without its full decimal expansion: digit and bit counts, the
+    leading and trailing digits, and a SHA-256 digest of its big-endian bytes.
+    The decimal value itself is included as a string when it is short enough.
+    """
+    if not isinstance(n, int) or isinstance(n, bool) or not 0 <= n <= MAX_FIBONACCI_N:
+        raise ValueError(f'n must be an integer between 0 and {MAX_FIBONACCI_N}')
+    started = time.perf_counter()
+    value = fibonacci_fast(n)
+    computed = time.perf_counter() - started
+
+    digits = decimal_digits(value)
+    short = digits <= MAX_FIBONACCI_VALUE_DIGITS
+    return {
+        'algorithm': 'fibonacci',
+        'method': 'fast_doubling',
         'n': n,
-        'memo': memo.copy(),
-        'depth': depth,
-        'result': None
-    })
-    
-    # Base cases
+        'digits': digits,
+        'bits': value.bit_length(),
+        'leading_digits': str(value) if digits <= EDGE_DIGITS else str(value // 10 ** (digits - EDGE_DIGITS)),
+        'trailing_digits': str(value % 10 ** EDGE_DIGITS).zfill(min(digits, EDGE_DIGITS)),
+        'digest': hashlib.sha256(value.to_bytes((value.bit_length() + 7) // 8 or 1, 'big')).hexdigest(),
+        'digest_of': 'sha256 of the big-endian unsigned bytes of F(n)',
+        'value': str(value) if short else None,
+        'compute_seconds': computed,
+        'total_seconds': time.perf_counter() - started
+    }
+
+def _fibonacci_base(n):
     if n <= 0:
-        steps.append({
-            'type': 'base_case',
-            'message': f'{indent}Base case: F({n}) = 0',
-            'n': n,
-            'memo': memo.copy(),
-            'depth': depth,
-            'result': 0
-        })
         return 0
-    
     if n == 1 or n == 2:
-        memo[n] = 1
-        steps.append({
-            'type': 'base_case',
-            'message': f'{indent}Base case: F({n}) = 1',
-            'n': n,
-            'memo': memo.copy(),
-            'depth': depth,
-            'result': 1
-        })
         return 1
-    
-    # Check if already computed
-    if n in memo:
+    return None
+
+def _fibonacci_recurrence(n):
+    fib1 = yield n - 1
+    fib2 = yield n - 2
+    return fib1 + fib2
+
+def fibonacci_recursive_trace(n, memo=None, summarize=False):
+    """
+    Top-down memoised F(n) as a compact call/return/memo-hit trace from the
+    iterative memo tracer, so large n never hits the recursion limit
+    """
+    trace = memo_trace(_fibonacci_recurrence, n, _fibonacci_base, memo=memo, summarize=summarize)
+    trace['problem'] = 'fibonacci'
+    return trace
+
+def expand_fibonacci_recursive_trace(trace, depth=0, memo=None):
+    """
+    Legacy fibonacci_recursive_steps format with a full memo snapshot per step.
+    Replays the memo into `memo` (a new dict by default); base cases F(1) and
+    F(2) are written to it as the original recursion did.
+    """
+    if memo is None:
+        memo = dict(trace['initial_memo'])
+    events = trace['steps']
+    steps = []
+    # Child values collected by every frame that is still computing
+    pending = []
+
+    def add(step_type, message, n, event_depth, result):
+        indent = "  " * (depth + event_depth)
         steps.append({
-            'type': 'memoized',
-            'message': f'{indent}Found in memo: F({n}) = {memo[n]}',
+            'type': step_type,
+            'message': f'{indent}{message}',
             'n': n,
             'memo': memo.copy(),
-            'depth': depth,
-            'result': memo[n]
+            'depth': depth + event_depth,
+            'result': result
         })
-        return memo[n]
-    
-    # Recursive calls
-    steps.append({
-        'type': 'recursive_call',
-        'message': f'{indent}Computing F({n}) = F({n-1}) + F({n-2})',
-        'n': n,
-        'memo': memo.copy(),
-        'depth': depth,
-        'result': None
-    })
-    
-    fib1 = fibonacci_recursive_steps(n-1, memo, steps, depth + 1)
-    fib2 = fibonacci_recursive_steps(n-2, memo, steps, depth + 1)
-    
-    result = fib1 + fib2
-    memo[n] = result
-    
-    steps.append({
-        'type': 'computed',
-        'message': f'{indent}F({n}) = {fib1} + {fib2} = {result}',
-        'n': n,
-        'memo': memo.copy(),
-        'depth': depth,
-        'result': result
-    })
-    
-    return result
+
+    for i, event in enumerate(events):
+        kind, n, event_depth = event['event'], event['state'], event['depth']
+        if kind == CALL:
+            add('function_call', f'Calling F({n})', n, event_depth, None)
+            if i + 1 == len(events) or events[i + 1]['event'] not in (BASE, MEMO_HIT):
+                add('recursive_call', f'Computing F({n}) = F({n-1}) + F({n-2})', n, event_depth, None)
+                pending.append([])
+            continue
+        value = event['value']
+        if kind == BASE:
+            if n > 0:
+                memo[n] = value
+            add('base_case', f'Base case: F({n}) = {value}', n, event_depth, value)
+        elif kind == MEMO_HIT:
+            add('memoized', f'Found in memo: F({n}) = {value}', n, event_depth, value)
+        else:
+            fib1, fib2 = pending.pop()
+            memo[n] = value
+            add('computed', f'F({n}) = {fib1} + {fib2} = {value}', n, event_depth, value)
+        if pending:
+            pending[-1].append(value)
+    return steps
+
+def fibonacci_recursive_steps(n, memo=None, steps=None, depth=0):
+    """
+    Generate steps for recursive Fibonacci with memoization
+    """
+    if steps is None:
+        steps = []
+    if memo is None:
+        memo = {}
+    trace = fibonacci_recursive_trace(n, dict(memo))
+    steps.extend(expand_fibonacci_recursive_trace(trace, depth, memo))
+    return trace['result']
 
 def fibonacci_simple(n):
     """
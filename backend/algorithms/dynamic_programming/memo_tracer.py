@@ -0,0 +1,172 @@
+"""
+Iterative Memoised Recursion Tracer
+Author: Aryan Pravin Sahu
+
+A top-down DP recurrence is written as a generator: it yields each
+subproblem state it needs and receives that subproblem's value back, then
+returns its own value. The tracer drives these generators from an explicit
+frame stack, so call depth is bounded by memory rather than the Python
+recursion limit, and the memo is a plain dict keyed by key(state).
+
+    def fibonacci(n):
+        a = yield n - 1
+        b = yield n - 2
+        return a + b
+
+    memo_trace(fibonacci, 30, base=lambda n: 1 if n <= 2 else None)
+
+Trace events carry only what changed: CALL (state, depth), BASE and MEMO_HIT
+(the value answered without recursing) and RETURN, whose 'memo' field is the
+single [key, value] entry it stored. Base cases are answered by base(state)
+and never enter the memo. With summarize=True the trace also counts how
+often each state was reused and how many calls plain recursion would have
+made for it.
+"""
+
+# Trace events
+CALL = 'call'
+BASE = 'base'
+MEMO_HIT = 'memo_hit'
+RETURN = 'return'
+
+MAX_MEMO_TRACE_EVENTS = 200_000
+MAX_REPEATED_STATES = 20
+
+
+def _identity(state):
+    return state
+
+
+def memo_solve(recurrence, root, base=None, key=None, memo=None):
+    """
+    Untraced evaluation of recurrence(root) with memoisation on an explicit stack.
+    base(state) returns the value of a base case, or None for states that recurse.
+    A memo dict may be passed in to reuse (and extend) earlier results.
+    """
+    key = key or _identity
+    memo = {} if memo is None else memo
+
+    def answer(state):
+        if base is not None:
+            value = base(state)
+            if value is not None:
+                return True, value
+        state_key = key(state)
+        if state_key in memo:
+            return True, memo[state_key]
+        return False, None
+
+    done, value = answer(root)
+    if done:
+        return value
+    stack = [(root, recurrence(root))]
+    value = None
+    while stack:
+        state, frame = stack[-1]
+        try:
+            child = frame.send(value)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+            memo[key(state)] = value
+            continue
+        done, value = answer(child)
+        if not done:
+            stack.append((child, recurrence(child)))
+            value = None
+    return value
+
+
+def memo_trace(recurrence, root, base=None, key=None, memo=None, summarize=False,
+               max_events=MAX_MEMO_TRACE_EVENTS):
+    """
+    Traced evaluation: a header with the initial memo, then one small event per
+    call, base case, memo hit and return. Raises ValueError after max_events events.
+    """
+    key = key or _identity
+    memo = {} if memo is None else memo
+    trace = {
+        'algorithm': 'memoized_recursion',
+        'root': root,
+        'initial_memo': [[state_key, value] for state_key, value in memo.items()],
+    }
+    events = []
+    # Per state key: times it was answered from the memo, calls made computing it,
+    # and calls plain (unmemoised) recursion would make for it
+    hits, subtree_calls, naive_calls = {}, {}, {}
+
+    def emit(event):
+        if len(events) >= max_events:
+            raise ValueError(f'Trace exceeds {max_events} events')
+        events.append({'step': len(events) + 1, **event})
+
+    def answer(state, depth):
+        """Emit CALL, then BASE or MEMO_HIT when the state needs no frame; returns (done, value, naive)"""
+        emit({'event': CALL, 'state': state, 'depth': depth})
+        if base is not None:
+            value = base(state)
+            if value is not None:
+                emit({'event': BASE, 'state': state, 'depth': depth, 'value': value})
+                return True, value, 1
+        state_key = key(state)
+        if state_key in memo:
+            emit({'event': MEMO_HIT, 'state': state, 'depth': depth, 'value': memo[state_key]})
+            hits[state_key] = hits.get(state_key, 0) + 1
+            return True, memo[state_key], naive_calls.get(state_key, 1)
+        return False, None, 0
+
+    # Frame: [state, generator, calls so far, naive calls so far]
+    max_depth = 0
+    done, value, naive = answer(root, 0)
+    stack = [] if done else [[root, recurrence(root), 1, 1]]
+    value = None if stack else value
+    while stack:
+        frame = stack[-1]
+        state, generator = frame[0], frame[1]
+        try:
+            child = generator.send(value)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+            state_key = key(state)
+            memo[state_key] = value
+            subtree_calls[state_key], naive_calls[state_key] = frame[2], frame[3]
+            emit({'event': RETURN, 'state': state, 'depth': len(stack), 'value': value,
+                  'memo': [state_key, value]})
+            if stack:
+                stack[-1][2] += frame[2]
+                stack[-1][3] += frame[3]
+            continue
+        depth = len(stack)
+        max_depth = max(max_depth, depth)
+        done, value, naive = answer(child, depth)
+        if done:
+            frame[2] += 1
+            frame[3] += naive
+        else:
+            stack.append([child, recurrence(child), 1, 1])
+            value = None
+
+    trace.update(result=value, total_steps=len(events), steps=events)
+    if summarize:
+        trace['summary'] = _summary(events, hits, subtree_calls, naive_calls, key(root), max_depth)
+    return trace
+
+
+def _summary(events, hits, subtree_calls, naive_calls, root_key, max_depth):
+    calls = sum(1 for event in events if event['event'] == CALL)
+    repeated = sorted(hits.items(), key=lambda item: (-item[1], -subtree_calls.get(item[0], 1)))
+    return {
+        'calls': calls,
+        'memo_hits': sum(hits.values()),
+        'base_cases': sum(1 for event in events if event['event'] == BASE),
+        'states_computed': len(subtree_calls),
+        'max_depth': max_depth,
+        # Plain recursion re-expands every memo hit into its whole subtree
+        'naive_calls': naive_calls.get(root_key, calls),
+        'repeated_subtrees': [
+            {'state': state_key, 'hits': count, 'subtree_calls': subtree_calls.get(state_key, 1),
+             'naive_calls': naive_calls.get(state_key, 1)}
+            for state_key, count in repeated[:MAX_REPEATED_STATES]
+        ]
+    }
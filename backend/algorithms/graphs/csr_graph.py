@@ -0,0 +1,144 @@
+"""
+Compressed Sparse Row (CSR) Graph Representation
+Author: Aryan Pravin Sahu
+"""
+
+import hashlib
+
+import numpy as np
+
+
+class CSRGraph:
+    """
+    Frozen adjacency structure backed by two NumPy arrays.
+    The neighbours of vertex v are targets[offsets[v]:offsets[v + 1]], sorted ascending;
+    weights (optional) is aligned with targets.
+    """
+
+    def __init__(self, num_vertices, offsets, targets, weights=None, directed=False):
+        self.num_vertices = num_vertices
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_edges(cls, num_vertices, sources, targets, weights=None, directed=False, dedupe=True):
+        """
+        Build a CSR graph from parallel source/target (and weight) arrays without per-edge Python work.
+        Undirected graphs store both directions of every edge.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+
+        if sources.size and (min(sources.min(), targets.min()) < 0 or
+                             max(sources.max(), targets.max()) >= num_vertices):
+            raise ValueError(f"Edge endpoints must be between 0 and {num_vertices - 1}")
+
+        if not directed:
+            # Orient every edge low -> high first so both directions of a duplicate keep the same weight
+            sources, targets = np.minimum(sources, targets), np.maximum(sources, targets)
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+
+        # Sort by (source, target); the first occurrence of a duplicate edge wins
+        order = np.lexsort((targets, sources))
+        sources, targets = sources[order], targets[order]
+        if weights is not None:
+            weights = weights[order]
+
+        if dedupe and sources.size:
+            keep = np.ones(sources.size, dtype=bool)
+            keep[1:] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+            sources, targets = sources[keep], targets[keep]
+            if weights is not None:
+                weights = weights[keep]
+
+        offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_vertices), out=offsets[1:])
+
+        return cls(num_vertices, offsets, targets, weights, directed)
+
+    @property
+    def num_edges(self):
+        """Number of stored (directed) adjacency entries"""
+        return int(self.targets.size)
+
+    def degree(self, vertex):
+        return int(self.offsets[vertex + 1] - self.offsets[vertex])
+
+    def neighbors(self, vertex):
+        """Sorted neighbour array of a vertex (a view, not a copy)"""
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def neighbor_weights(self, vertex):
+        return self.weights[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def to_adjacency_list(self):
+        """Plain {vertex: [neighbours]} dict for JSON serialization"""
+        bounds = self.offsets.tolist()
+        targets = self.targets.tolist()
+        return {v: targets[bounds[v]:bounds[v + 1]] for v in range(self.num_vertices)}
+
+    def fingerprint(self, include_weights=True):
+        """Content hash of the adjacency arrays (structure only when include_weights is False)"""
+        digest = hashlib.sha256()
+        digest.update(np.int64(self.num_vertices).tobytes())
+        digest.update(np.ascontiguousarray(self.offsets, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(self.targets, dtype=np.int64).tobytes())
+        if include_weights and self.weights is not None:
+            digest.update(np.ascontiguousarray(self.weights, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def sources(self):
+        """Source vertex of every adjacency entry (aligned with targets)"""
+        return np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(self.offsets))
+
+    def undirected_edges(self):
+        """
+        Every edge once as (u, v) with u < v, whichever directions are stored; self-loops
+        are dropped. Returns (us, vs, weights) with weights None for unweighted graphs,
+        otherwise the smallest weight of each vertex pair.
+        """
+        sources = self.sources()
+        lo, hi = np.minimum(sources, self.targets), np.maximum(sources, self.targets)
+        keep = lo != hi
+        keys = lo[keep] * self.num_vertices + hi[keep]
+        if self.weights is None:
+            keys = np.unique(keys)
+            return keys // self.num_vertices, keys % self.num_vertices, None
+
+        weights = self.weights[keep]
+        order = np.lexsort((weights, keys))
+        keys, weights = keys[order], weights[order]
+        first = np.ones(keys.size, dtype=bool)
+        first[1:] = keys[1:] != keys[:-1]
+        keys, weights = keys[first], weights[first]
+        return keys // self.num_vertices, keys % self.num_vertices, weights
+
+    def reversed(self):
+        """Graph with every edge flipped (the graph itself when undirected)"""
+        if not self.directed:
+            return self
+        return CSRGraph.from_edges(self.num_vertices, self.targets, self.sources(), self.weights,
+                                   directed=True, dedupe=False)
+
+    @classmethod
+    def from_weighted_dict(cls, graph):
+        """
+        Build a weighted directed CSR graph from {node: [(neighbor, weight), ...]}.
+        Returns (csr, nodes) where nodes[i] is the label of vertex i.
+        """
+        nodes = list(graph)
+        index = {node: i for i, node in enumerate(nodes)}
+        sources, targets, weights = [], [], []
+        for node, edges in graph.items():
+            for neighbor, weight in edges:
+                sources.append(index[node])
+                targets.append(index[neighbor])
+                weights.append(weight)
+        csr = cls.from_edges(len(nodes), sources, targets, weights, directed=True, dedupe=False)
+        return csr, nodes
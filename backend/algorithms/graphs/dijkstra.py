@@ -3,108 +3,180 @@ Dijkstra's Shortest Path Algorithm Implementation
 Author: Aryan Pravin Sahu
 """
 
-import heapq
-from collections import defaultdict
+import math
 
-def dijkstra_steps(graph, start_node):
+from algorithms.data_structures.priority_queue import IndexedMinHeap
+
+def json_distance(distance):
+    """Distances are emitted as 'Infinity' when unreachable, since JSON has no infinity literal"""
+    return 'Infinity' if math.isinf(distance) else distance
+
+def dijkstra_trace(graph, start_node, arity=2, trace_heap=False):
     """
-    Generate step-by-step Dijkstra's algorithm visualization data
+    Generate a compact Dijkstra trace. The graph and initial distances are sent once
+    in the header; each step carries only its distance update and heap operation.
+    arity picks the d-ary heap; with trace_heap each heap operation also lists the
+    [node, slot] moves it made in the heap array (slot None once a node is popped).
     """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    distances = [math.inf] * len(nodes)
+    previous = {}
+    visited = set()
+    heap = IndexedMinHeap(len(nodes), arity, traced=trace_heap)
     steps = []
+
+    def heap_operation(op, node, priority):
+        operation = {'op': op, 'node': node, 'priority': priority}
+        if trace_heap:
+            operation['moves'] = [[nodes[key], slot] for key, slot in heap.drain_moves()]
+        return operation
     
-    # Initialize distances and visited set
-    distances = {node: float('infinity') for node in graph}
-    distances[start_node] = 0
-    visited = set()
-    previous = {}
-    priority_queue = [(0, start_node)]
+    distances[index[start_node]] = 0
+    heap.push(index[start_node], 0)
     
     steps.append({
         'type': 'initialization',
         'message': f'Starting Dijkstra\'s algorithm from node {start_node}',
-        'distances': distances.copy(),
-        'visited': list(visited),
         'current_node': start_node,
-        'priority_queue': [(dist, node) for dist, node in priority_queue],
-        'previous': previous.copy(),
-        'examining_edge': None
+        'examining_edge': None,
+        'heap_operation': heap_operation('push', start_node, 0)
     })
     
-    while priority_queue:
-        current_distance, current_node = heapq.heappop(priority_queue)
-        
-        if current_node in visited:
-            continue
-            
+    while heap:
+        current, current_distance = heap.pop()
+        current_node = nodes[current]
         visited.add(current_node)
         
         steps.append({
             'type': 'visiting_node',
             'message': f'Visiting node {current_node} with distance {current_distance}',
-            'distances': distances.copy(),
-            'visited': list(visited),
             'current_node': current_node,
-            'priority_queue': [(dist, node) for dist, node in priority_queue if node not in visited],
-            'previous': previous.copy(),
-            'examining_edge': None
+            'examining_edge': None,
+            'heap_operation': heap_operation('pop', current_node, current_distance),
+            'visited_node': current_node
         })
         
         # Check all neighbors
         for neighbor, weight in graph[current_node]:
-            if neighbor not in visited:
+            if neighbor in visited:
+                continue
+            
+            steps.append({
+                'type': 'examining_edge',
+                'message': f'Examining edge from {current_node} to {neighbor} with weight {weight}',
+                'current_node': current_node,
+                'examining_edge': [current_node, neighbor, weight]
+            })
+            
+            new_distance = current_distance + weight
+            neighbor_index = index[neighbor]
+            
+            if new_distance < distances[neighbor_index]:
+                distances[neighbor_index] = new_distance
+                previous[neighbor] = current_node
+                operation = heap.push_or_decrease(neighbor_index, new_distance)
+                
                 steps.append({
-                    'type': 'examining_edge',
-                    'message': f'Examining edge from {current_node} to {neighbor} with weight {weight}',
-                    'distances': distances.copy(),
-                    'visited': list(visited),
+                    'type': 'distance_updated',
+                    'message': f'Updated distance to {neighbor}: {new_distance} (via {current_node})',
                     'current_node': current_node,
-                    'priority_queue': [(dist, node) for dist, node in priority_queue if node not in visited],
-                    'previous': previous.copy(),
-                    'examining_edge': (current_node, neighbor, weight)
+                    'examining_edge': [current_node, neighbor, weight],
+                    'distance_update': {'node': neighbor, 'distance': new_distance, 'previous': current_node},
+                    'heap_operation': heap_operation(operation, neighbor, new_distance)
+                })
+            else:
+                steps.append({
+                    'type': 'distance_not_updated',
+                    'message': f'Distance to {neighbor} not updated: {new_distance} >= '
+                               f'{json_distance(distances[neighbor_index])}',
+                    'current_node': current_node,
+                    'examining_edge': [current_node, neighbor, weight]
                 })
-                
-                new_distance = current_distance + weight
-                
-                if new_distance < distances[neighbor]:
-                    distances[neighbor] = new_distance
-                    previous[neighbor] = current_node
-                    heapq.heappush(priority_queue, (new_distance, neighbor))
-                    
-                    steps.append({
-                        'type': 'distance_updated',
-                        'message': f'Updated distance to {neighbor}: {new_distance} (via {current_node})',
-                        'distances': distances.copy(),
-                        'visited': list(visited),
-                        'current_node': current_node,
-                        'priority_queue': [(dist, node) for dist, node in priority_queue if node not in visited],
-                        'previous': previous.copy(),
-                        'examining_edge': (current_node, neighbor, weight)
-                    })
-                else:
-                    steps.append({
-                        'type': 'distance_not_updated',
-                        'message': f'Distance to {neighbor} not updated: {new_distance} >= {distances[neighbor]}',
-                        'distances': distances.copy(),
-                        'visited': list(visited),
-                        'current_node': current_node,
-                        'priority_queue': [(dist, node) for dist, node in priority_queue if node not in visited],
-                        'previous': previous.copy(),
-                        'examining_edge': (current_node, neighbor, weight)
-                    })
     
     steps.append({
         'type': 'completed',
         'message': 'Dijkstra\'s algorithm completed - shortest paths found',
-        'distances': distances.copy(),
-        'visited': list(visited),
         'current_node': None,
-        'priority_queue': [],
-        'previous': previous.copy(),
         'examining_edge': None
     })
     
+    return {
+        'algorithm': 'dijkstra',
+        'heap_arity': arity,
+        'graph': {node: [list(edge) for edge in edges] for node, edges in graph.items()},
+        'nodes': nodes,
+        'start_node': start_node,
+        'initial_distances': {node: json_distance(math.inf) for node in nodes} | {start_node: 0},
+        'final_distances': {node: json_distance(distances[i]) for i, node in enumerate(nodes)},
+        'final_previous': previous,
+        'total_steps': len(steps),
+        'steps': steps
+    }
+
+def dijkstra_steps(graph, start_node):
+    """
+    Generate step-by-step Dijkstra's algorithm visualization data
+    (full distances/previous/queue snapshot on every step, replayed from dijkstra_trace)
+    """
+    trace = dijkstra_trace(graph, start_node)
+    distances = {node: float('infinity') for node in graph}
+    visited = set()
+    previous = {}
+    queue = {}
+    steps = []
+    
+    for step in trace['steps']:
+        operation = step.get('heap_operation')
+        if operation:
+            if operation['op'] == 'pop':
+                del queue[operation['node']]
+            else:
+                queue[operation['node']] = operation['priority']
+                distances[operation['node']] = operation['priority']
+        if 'distance_update' in step:
+            update = step['distance_update']
+            previous[update['node']] = update['previous']
+        if 'visited_node' in step:
+            visited.add(step['visited_node'])
+        
+        edge = step['examining_edge']
+        steps.append({
+            'type': step['type'],
+            'message': step['message'],
+            'distances': distances.copy(),
+            'visited': list(visited),
+            'current_node': step['current_node'],
+            'priority_queue': sorted((dist, node) for node, dist in queue.items()),
+            'previous': previous.copy(),
+            'examining_edge': tuple(edge) if edge else None
+        })
+    
     return steps
 
+def validate_weighted_graph(graph, start_node):
+    """
+    Check a user-supplied weighted graph {node: [[neighbor, weight], ...]}.
+    Raises ValueError describing the first problem found.
+    """
+    if not isinstance(graph, dict) or not graph:
+        raise ValueError('graph must be a non-empty object mapping nodes to [[neighbor, weight], ...]')
+    if start_node not in graph:
+        raise ValueError(f'start node {start_node!r} is not in the graph')
+    
+    for node, edges in graph.items():
+        if not isinstance(edges, list):
+            raise ValueError(f'Edges of node {node!r} must be a list')
+        for edge in edges:
+            if not (isinstance(edge, (list, tuple)) and len(edge) == 2):
+                raise ValueError(f'Invalid edge {edge!r} from {node!r}: expected [neighbor, weight]')
+            neighbor, weight = edge
+            if not isinstance(neighbor, str) or neighbor not in graph:
+                raise ValueError(f'Edge from {node!r} points to unknown node {neighbor!r}')
+            if (isinstance(weight, bool) or not isinstance(weight, (int, float)) or
+                    not math.isfinite(weight) or weight < 0):
+                raise ValueError(f'Edge {node!r} -> {neighbor!r} needs a finite non-negative weight')
+
 def get_sample_graph():
     """
     Return a sample weighted graph for demonstration
@@ -131,31 +203,28 @@ def get_sample_positions():
         'F': {'x': 500, 'y': 300}
     }
 
-def dijkstra_simple(graph, start):
+def dijkstra_simple(graph, start, arity=2):
     """
-    Simple Dijkstra implementation without steps
+    Simple Dijkstra implementation without steps, on a d-ary indexed heap
     """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
     distances = {node: float('infinity') for node in graph}
     distances[start] = 0
-    visited = set()
     previous = {}
-    priority_queue = [(0, start)]
+    heap = IndexedMinHeap(len(nodes), arity)
+    heap.push(index[start], 0)
     
-    while priority_queue:
-        current_distance, current_node = heapq.heappop(priority_queue)
-        
-        if current_node in visited:
-            continue
-            
-        visited.add(current_node)
+    while heap:
+        current, current_distance = heap.pop()
+        current_node = nodes[current]
         
         for neighbor, weight in graph[current_node]:
-            if neighbor not in visited:
-                new_distance = current_distance + weight
-                if new_distance < distances[neighbor]:
-                    distances[neighbor] = new_distance
-                    previous[neighbor] = current_node
-                    heapq.heappush(priority_queue, (new_distance, neighbor))
+            new_distance = current_distance + weight
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                previous[neighbor] = current_node
+                heap.push_or_decrease(index[neighbor], new_distance)
     
     return distances, previous
 
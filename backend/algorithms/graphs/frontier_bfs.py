@@ -0,0 +1,100 @@
+"""
+Level-Synchronous BFS over CSR Graphs
+Author: Aryan Pravin Sahu
+
+Each BFS level is processed as one NumPy frontier array: the neighbours of the
+whole frontier are gathered in a single vectorised step and filtered against a
+boolean visited mask, so there is no per-vertex Python work.
+"""
+
+import numpy as np
+
+_UNSEEN = np.iinfo(np.int64).max
+
+
+def gather_neighbors(csr, frontier):
+    """
+    Neighbours of every frontier vertex, concatenated in frontier order.
+    Returns (neighbors, owners) where owners[i] is the frontier vertex neighbors[i] came from.
+    """
+    starts = csr.offsets[frontier]
+    counts = csr.offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    # Position of each gathered entry inside its vertex's slice, plus the slice start
+    block_starts = np.cumsum(counts) - counts
+    index = np.arange(total, dtype=np.int64) - np.repeat(block_starts, counts) + np.repeat(starts, counts)
+    return csr.targets[index], np.repeat(frontier, counts)
+
+
+def level_synchronous_bfs(csr, source):
+    """
+    BFS from source, one frontier per level.
+
+    Returns a dict with
+      distances   - int64 array of hop counts, -1 for unreachable vertices
+      parents     - int64 array of BFS-tree parents, -1 for the source and unreachable vertices
+      level_sizes - number of vertices on each level (level 0 is the source)
+      order       - vertices in visiting order
+
+    New vertices keep the order in which the frontier discovers them, so parents and
+    order are exactly those of the queue-based Graph.bfs_trace.
+    """
+    if not 0 <= source < csr.num_vertices:
+        raise ValueError(f'source must be a vertex between 0 and {csr.num_vertices - 1}')
+
+    distances = np.full(csr.num_vertices, -1, dtype=np.int64)
+    parents = np.full(csr.num_vertices, -1, dtype=np.int64)
+    visited = np.zeros(csr.num_vertices, dtype=bool)
+    # Scratch array for order-preserving dedup; entries are reset after each level
+    first_seen = np.full(csr.num_vertices, _UNSEEN, dtype=np.int64)
+
+    frontier = np.array([source], dtype=np.int64)
+    visited[source] = True
+    distances[source] = 0
+    level_sizes = [1]
+    levels = [frontier]
+
+    while frontier.size:
+        neighbors, owners = gather_neighbors(csr, frontier)
+        fresh = ~visited[neighbors]
+        neighbors, owners = neighbors[fresh], owners[fresh]
+        if not neighbors.size:
+            break
+
+        # First discovery wins: keep each new vertex once, in discovery order
+        positions = np.arange(neighbors.size, dtype=np.int64)
+        np.minimum.at(first_seen, neighbors, positions)
+        first = np.flatnonzero(first_seen[neighbors] == positions)
+        first_seen[neighbors] = _UNSEEN
+        frontier = neighbors[first]
+
+        visited[frontier] = True
+        distances[frontier] = len(level_sizes)
+        parents[frontier] = owners[first]
+        level_sizes.append(int(frontier.size))
+        levels.append(frontier)
+
+    return {
+        'distances': distances,
+        'parents': parents,
+        'level_sizes': level_sizes,
+        'order': np.concatenate(levels)
+    }
+
+
+def bfs_level_metrics(csr, source):
+    """JSON-ready summary of a level-synchronous BFS (no per-vertex arrays)"""
+    result = level_synchronous_bfs(csr, source)
+    return {
+        'algorithm': 'bfs',
+        'vertices': csr.num_vertices,
+        'edges': csr.num_edges,
+        'start_vertex': source,
+        'reached': int(result['order'].size),
+        'depth': len(result['level_sizes']) - 1,
+        'level_sizes': result['level_sizes']
+    }
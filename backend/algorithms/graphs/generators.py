@@ -0,0 +1,167 @@
+"""
+Synthetic Graph Generators for Stress Tests and Benchmarks
+Author: Aryan Pravin Sahu
+
+Every generator builds its edge arrays with NumPy and returns a CSRGraph directly,
+so graphs with millions of edges are produced without per-edge Python work.
+All generators are deterministic for a given seed. With weighted=True every
+edge gets an integer weight drawn uniformly from 1..max_weight.
+"""
+
+import numpy as np
+
+from algorithms.graphs.csr_graph import CSRGraph
+
+# Largest graph the generators will build (vertices)
+MAX_GENERATED_VERTICES = 2_000_000
+
+
+def _check_vertices(num_vertices):
+    if not isinstance(num_vertices, (int, np.integer)) or not 1 <= num_vertices <= MAX_GENERATED_VERTICES:
+        raise ValueError(f'num_vertices must be an integer between 1 and {MAX_GENERATED_VERTICES}')
+
+
+def _build(num_vertices, sources, targets, rng, weighted, max_weight, directed=False):
+    # Drop self-loops, then weight the surviving edges
+    keep = sources != targets
+    sources, targets = sources[keep], targets[keep]
+    weights = rng.integers(1, max_weight + 1, sources.size).astype(np.float64) if weighted else None
+    return CSRGraph.from_edges(num_vertices, sources, targets, weights, directed=directed)
+
+
+def erdos_renyi(num_vertices, average_degree=4.0, seed=None, weighted=False, max_weight=10, directed=False):
+    """
+    Random G(n, m) graph with m = n * average_degree / 2 edges (n * average_degree when directed)
+    drawn uniformly at random; duplicate edges and self-loops are dropped.
+    """
+    _check_vertices(num_vertices)
+    rng = np.random.default_rng(seed)
+    num_edges = int(num_vertices * average_degree / (1 if directed else 2))
+    sources = rng.integers(0, num_vertices, num_edges)
+    targets = rng.integers(0, num_vertices, num_edges)
+    return _build(num_vertices, sources, targets, rng, weighted, max_weight, directed)
+
+
+def random_geometric(num_vertices, radius=None, seed=None, weighted=False, max_weight=10):
+    """
+    Random geometric graph: points uniform in the unit square, joined when at most
+    radius apart. The default radius gives an expected degree of about 6.
+    Neighbour pairs are found by bucketing points into radius-sized cells and only
+    comparing points in adjacent cells. Returns (csr, coordinates).
+    """
+    _check_vertices(num_vertices)
+    rng = np.random.default_rng(seed)
+    if radius is None:
+        radius = float(np.sqrt(6.0 / (np.pi * num_vertices)))
+    coordinates = rng.random((num_vertices, 2))
+
+    cells_per_side = max(1, int(1.0 / radius))
+    cell_xy = np.minimum((coordinates * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell = cell_xy[:, 0] * cells_per_side + cell_xy[:, 1]
+    order = np.argsort(cell, kind='stable')
+    cell_offsets = np.zeros(cells_per_side * cells_per_side + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cell, minlength=cells_per_side * cells_per_side), out=cell_offsets[1:])
+
+    pair_sources, pair_targets = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nx, ny = cell_xy[:, 0] + dx, cell_xy[:, 1] + dy
+            inside = (nx >= 0) & (nx < cells_per_side) & (ny >= 0) & (ny < cells_per_side)
+            points = np.flatnonzero(inside)
+            neighbour_cell = nx[points] * cells_per_side + ny[points]
+            lo = cell_offsets[neighbour_cell]
+            counts = cell_offsets[neighbour_cell + 1] - lo
+
+            # Expand each point against every point of the neighbouring cell
+            block_starts = np.cumsum(counts) - counts
+            index = np.arange(int(counts.sum())) - np.repeat(block_starts, counts) + np.repeat(lo, counts)
+            u, v = np.repeat(points, counts), order[index]
+            keep = u < v
+            u, v = u[keep], v[keep]
+            close = np.sum((coordinates[u] - coordinates[v]) ** 2, axis=1) <= radius * radius
+            pair_sources.append(u[close])
+            pair_targets.append(v[close])
+
+    csr = _build(num_vertices, np.concatenate(pair_sources), np.concatenate(pair_targets),
+                 rng, weighted, max_weight)
+    return csr, coordinates
+
+
+def grid_graph(rows, cols, obstacle_ratio=0.0, seed=None, weighted=False, max_weight=10):
+    """
+    4-connected grid (a maze when obstacle_ratio > 0: that fraction of cells is
+    blocked at random, the two corners always stay open).
+    Returns (csr, coordinates) where vertex r * cols + c sits at (c, r).
+    """
+    _check_vertices(rows * cols)
+    rng = np.random.default_rng(seed)
+    open_cells = rng.random(rows * cols) >= obstacle_ratio
+    open_cells[0] = open_cells[-1] = True
+
+    cells = np.arange(rows * cols).reshape(rows, cols)
+    sources = np.concatenate([cells[:, :-1].ravel(), cells[:-1, :].ravel()])
+    targets = np.concatenate([cells[:, 1:].ravel(), cells[1:, :].ravel()])
+    keep = open_cells[sources] & open_cells[targets]
+
+    csr = _build(rows * cols, sources[keep], targets[keep], rng, weighted, max_weight)
+    coordinates = np.column_stack([(cells % cols).ravel(), (cells // cols).ravel()]).astype(np.float64)
+    return csr, coordinates
+
+
+def scale_free(num_vertices, average_degree=4.0, exponent=2.5, seed=None, weighted=False, max_weight=10):
+    """
+    Scale-free graph with a power-law degree distribution P(k) ~ k^-exponent.
+    Uses the Chung-Lu model: both endpoints of every edge are drawn with
+    probability proportional to a vertex's expected degree, which vectorises,
+    unlike sequential Barabasi-Albert preferential attachment.
+    """
+    _check_vertices(num_vertices)
+    if exponent <= 2:
+        raise ValueError('exponent must be greater than 2')
+    rng = np.random.default_rng(seed)
+    expected = np.arange(1, num_vertices + 1, dtype=np.float64) ** (-1.0 / (exponent - 1))
+    probabilities = expected / expected.sum()
+    num_edges = int(num_vertices * average_degree / 2)
+    sources = rng.choice(num_vertices, num_edges, p=probabilities)
+    targets = rng.choice(num_vertices, num_edges, p=probabilities)
+    # Shuffle labels so hubs are not always the lowest vertex ids
+    labels = rng.permutation(num_vertices)
+    return _build(num_vertices, labels[sources], labels[targets], rng, weighted, max_weight)
+
+
+def random_tree(num_vertices, seed=None, weighted=False, max_weight=10, directed=False):
+    """
+    Random recursive tree: vertex i > 0 attaches to a uniformly random earlier vertex,
+    so vertex 0 is the root and directed trees point from parent to child.
+    """
+    _check_vertices(num_vertices)
+    rng = np.random.default_rng(seed)
+    children = np.arange(1, num_vertices, dtype=np.int64)
+    parents = (rng.random(num_vertices - 1) * children).astype(np.int64)
+    return _build(num_vertices, parents, children, rng, weighted, max_weight, directed)
+
+
+# Generator name -> function taking (num_vertices, seed, weighted) and returning (csr, coordinates)
+GENERATORS = {
+    'erdos_renyi': lambda n, seed, weighted: (erdos_renyi(n, seed=seed, weighted=weighted), None),
+    'random_geometric': lambda n, seed, weighted: random_geometric(n, seed=seed, weighted=weighted),
+    'grid': lambda n, seed, weighted: _square_grid(n, 0.0, seed, weighted),
+    'maze': lambda n, seed, weighted: _square_grid(n, 0.25, seed, weighted),
+    'scale_free': lambda n, seed, weighted: (scale_free(n, seed=seed, weighted=weighted), None),
+    'tree': lambda n, seed, weighted: (random_tree(n, seed=seed, weighted=weighted), None),
+}
+
+
+def _square_grid(num_vertices, obstacle_ratio, seed, weighted):
+    side = max(1, int(np.sqrt(num_vertices)))
+    return grid_graph(side, side, obstacle_ratio, seed, weighted)
+
+
+def generate_graph(kind, num_vertices, seed=None, weighted=False):
+    """
+    Build a graph by generator name (see GENERATORS) with default parameters.
+    Grid and maze graphs round num_vertices down to a square. Returns (csr, coordinates or None).
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown graph generator '{kind}' (expected one of {', '.join(GENERATORS)})")
+    return GENERATORS[kind](num_vertices, seed, weighted)
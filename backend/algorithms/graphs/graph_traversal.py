@@ -3,25 +3,74 @@ Graph Traversal Algorithms (DFS/BFS) with Graph Visualization
 Author: Aryan Pravin Sahu
 """
 
+from array import array
 from collections import deque
 
+import numpy as np
+
+from algorithms.graphs.csr_graph import CSRGraph
+from algorithms.graphs.frontier_bfs import bfs_level_metrics
+
 class Graph:
     def __init__(self, vertices):
         self.vertices = vertices
-        self.adj_list = {i: [] for i in range(vertices)}
-        self.edges = []
+        self._sources = array('q')
+        self._targets = array('q')
+        self._edge_keys = set()
+        self._csr = None
     
     def add_edge(self, u, v, bidirectional=True):
-        """Add edge to the graph"""
-        self.adj_list[u].append(v)
-        self.edges.append((u, v))
+        """Add edge to the graph (edges that already exist are ignored)"""
+        self._add_directed_edge(u, v)
         if bidirectional:
-            self.adj_list[v].append(u)
-            if (v, u) not in self.edges:
-                self.edges.append((v, u))
+            self._add_directed_edge(v, u)
+    
+    def _add_directed_edge(self, u, v):
+        # Edges are keyed as a single int so dedup is an O(1) set lookup
+        key = u * self.vertices + v
+        if key not in self._edge_keys:
+            self._edge_keys.add(key)
+            self._sources.append(u)
+            self._targets.append(v)
+            self._csr = None
+    
+    @property
+    def edges(self):
+        return list(zip(self._sources, self._targets))
+    
+    @property
+    def adj_list(self):
+        return self.freeze().to_adjacency_list()
+    
+    def freeze(self):
+        """Return the CSR form of the graph (rebuilt only after new edges are added)"""
+        if self._csr is None:
+            self._csr = CSRGraph.from_edges(
+                self.vertices,
+                np.array(self._sources, dtype=np.int64),
+                np.array(self._targets, dtype=np.int64),
+                directed=True, dedupe=False
+            )
+        return self._csr
     
     def dfs_steps(self, start_vertex):
-        """Generate step-by-step DFS traversal"""
+        """Generate step-by-step DFS traversal (full snapshot per step)"""
+        return expand_traversal_trace(self.dfs_trace(start_vertex))
+    
+    def bfs_steps(self, start_vertex):
+        """Generate step-by-step BFS traversal (full snapshot per step)"""
+        return expand_traversal_trace(self.bfs_trace(start_vertex))
+    
+    def bfs_levels(self, start_vertex):
+        """Untraced level-synchronous BFS: per-level frontier sizes and depth, no steps"""
+        return bfs_level_metrics(self.freeze(), start_vertex)
+    
+    def dfs_trace(self, start_vertex):
+        """
+        Generate a compact DFS trace: the graph is serialized once in the header and
+        each step records only what changed ('push', 'pop', 'visit', 'path' vertices).
+        """
+        csr = self.freeze()
         steps = []
         visited = set()
         stack = [start_vertex]
@@ -30,34 +79,24 @@ class Graph:
         # Initial state
         steps.append({
             'step': 0,
-            'graph': self.serialize_graph(),
             'operation': 'dfs_start',
             'current_vertex': None,
-            'stack': stack.copy(),
-            'visited': list(visited),
-            'path': path.copy(),
             'exploring_edge': None,
             'description': f'Starting DFS from vertex {start_vertex}'
         })
         
-        step_count = 1
-        
         while stack:
             # Pop from stack
             current = stack.pop()
             
             steps.append({
-                'step': step_count,
-                'graph': self.serialize_graph(),
+                'step': len(steps),
                 'operation': 'pop_stack',
                 'current_vertex': current,
-                'stack': stack.copy(),
-                'visited': list(visited),
-                'path': path.copy(),
                 'exploring_edge': None,
+                'pop': current,
                 'description': f'Pop vertex {current} from stack'
             })
-            step_count += 1
             
             if current not in visited:
                 # Visit vertex
@@ -65,190 +104,161 @@ class Graph:
                 path.append(current)
                 
                 steps.append({
-                    'step': step_count,
-                    'graph': self.serialize_graph(),
+                    'step': len(steps),
                     'operation': 'visit_vertex',
                     'current_vertex': current,
-                    'stack': stack.copy(),
-                    'visited': list(visited),
-                    'path': path.copy(),
                     'exploring_edge': None,
+                    'visit': current,
+                    'path': current,
                     'description': f'Visit vertex {current} and mark as visited'
                 })
-                step_count += 1
                 
                 # Add neighbors to stack (in reverse order for correct DFS order)
-                neighbors = sorted(self.adj_list[current], reverse=True)
-                for neighbor in neighbors:
+                for neighbor in csr.neighbors(current)[::-1].tolist():
                     if neighbor not in visited:
                         # Show edge exploration
                         steps.append({
-                            'step': step_count,
-                            'graph': self.serialize_graph(),
+                            'step': len(steps),
                             'operation': 'explore_edge',
                             'current_vertex': current,
-                            'stack': stack.copy(),
-                            'visited': list(visited),
-                            'path': path.copy(),
-                            'exploring_edge': (current, neighbor),
+                            'exploring_edge': [current, neighbor],
                             'description': f'Explore edge ({current}, {neighbor})'
                         })
-                        step_count += 1
                         
                         stack.append(neighbor)
                         
                         steps.append({
-                            'step': step_count,
-                            'graph': self.serialize_graph(),
+                            'step': len(steps),
                             'operation': 'push_stack',
                             'current_vertex': current,
-                            'stack': stack.copy(),
-                            'visited': list(visited),
-                            'path': path.copy(),
                             'exploring_edge': None,
+                            'push': neighbor,
                             'description': f'Push vertex {neighbor} to stack'
                         })
-                        step_count += 1
             else:
                 # Already visited
                 steps.append({
-                    'step': step_count,
-                    'graph': self.serialize_graph(),
+                    'step': len(steps),
                     'operation': 'already_visited',
                     'current_vertex': current,
-                    'stack': stack.copy(),
-                    'visited': list(visited),
-                    'path': path.copy(),
                     'exploring_edge': None,
                     'description': f'Vertex {current} already visited, skip'
                 })
-                step_count += 1
         
         # DFS complete
         steps.append({
-            'step': step_count,
-            'graph': self.serialize_graph(),
+            'step': len(steps),
             'operation': 'dfs_complete',
             'current_vertex': None,
-            'stack': [],
-            'visited': list(visited),
-            'path': path.copy(),
             'exploring_edge': None,
             'description': f'DFS complete! Visited order: {path}'
         })
         
-        return steps
+        return self._trace_header('dfs', 'stack', start_vertex, steps)
     
-    def bfs_steps(self, start_vertex):
-        """Generate step-by-step BFS traversal"""
+    def bfs_trace(self, start_vertex):
+        """
+        Generate a compact BFS trace: the graph is serialized once in the header and
+        each step records only what changed ('push' = enqueue, 'pop' = dequeue, 'visit', 'path').
+        """
+        csr = self.freeze()
         steps = []
-        visited = set()
+        visited = {start_vertex}
+        levels = {start_vertex: 0}
         queue = deque([start_vertex])
         path = []
         
         # Initial state
         steps.append({
             'step': 0,
-            'graph': self.serialize_graph(),
             'operation': 'bfs_start',
             'current_vertex': None,
-            'queue': list(queue),
-            'visited': list(visited),
-            'path': path.copy(),
             'exploring_edge': None,
             'level': 0,
             'description': f'Starting BFS from vertex {start_vertex}'
         })
         
-        step_count = 1
-        visited.add(start_vertex)
-        current_level = 0
-        
         while queue:
             # Dequeue
             current = queue.popleft()
+            current_level = levels[current]
             path.append(current)
             
-            steps.append({
-                'step': step_count,
-                'graph': self.serialize_graph(),
+            dequeue_step = {
+                'step': len(steps),
                 'operation': 'dequeue',
                 'current_vertex': current,
-                'queue': list(queue),
-                'visited': list(visited),
-                'path': path.copy(),
                 'exploring_edge': None,
                 'level': current_level,
+                'pop': current,
+                'path': current,
                 'description': f'Dequeue vertex {current} from front of queue'
-            })
-            step_count += 1
+            }
+            if len(steps) == 1:
+                # The start vertex is marked visited as the traversal begins
+                dequeue_step['visit'] = start_vertex
+            steps.append(dequeue_step)
             
             # Visit vertex
             steps.append({
-                'step': step_count,
-                'graph': self.serialize_graph(),
+                'step': len(steps),
                 'operation': 'visit_vertex',
                 'current_vertex': current,
-                'queue': list(queue),
-                'visited': list(visited),
-                'path': path.copy(),
                 'exploring_edge': None,
                 'level': current_level,
                 'description': f'Visit vertex {current} at level {current_level}'
             })
-            step_count += 1
             
             # Add unvisited neighbors to queue
-            neighbors = sorted(self.adj_list[current])
-            for neighbor in neighbors:
+            for neighbor in csr.neighbors(current).tolist():
                 if neighbor not in visited:
                     # Show edge exploration
                     steps.append({
-                        'step': step_count,
-                        'graph': self.serialize_graph(),
+                        'step': len(steps),
                         'operation': 'explore_edge',
                         'current_vertex': current,
-                        'queue': list(queue),
-                        'visited': list(visited),
-                        'path': path.copy(),
-                        'exploring_edge': (current, neighbor),
+                        'exploring_edge': [current, neighbor],
                         'level': current_level,
                         'description': f'Explore edge ({current}, {neighbor})'
                     })
-                    step_count += 1
                     
                     visited.add(neighbor)
+                    levels[neighbor] = current_level + 1
                     queue.append(neighbor)
                     
                     steps.append({
-                        'step': step_count,
-                        'graph': self.serialize_graph(),
+                        'step': len(steps),
                         'operation': 'enqueue',
                         'current_vertex': current,
-                        'queue': list(queue),
-                        'visited': list(visited),
-                        'path': path.copy(),
                         'exploring_edge': None,
                         'level': current_level,
+                        'push': neighbor,
+                        'visit': neighbor,
                         'description': f'Enqueue vertex {neighbor} to back of queue'
                     })
-                    step_count += 1
         
         # BFS complete
         steps.append({
-            'step': step_count,
-            'graph': self.serialize_graph(),
+            'step': len(steps),
             'operation': 'bfs_complete',
             'current_vertex': None,
-            'queue': [],
-            'visited': list(visited),
-            'path': path.copy(),
             'exploring_edge': None,
-            'level': current_level,
+            'level': max(levels.values()),
             'description': f'BFS complete! Visited order: {path}'
         })
         
-        return steps
+        return self._trace_header('bfs', 'queue', start_vertex, steps)
+    
+    def _trace_header(self, algorithm, frontier, start_vertex, steps):
+        return {
+            'algorithm': algorithm,
+            'graph': self.serialize_graph(),
+            'start_vertex': start_vertex,
+            'frontier': frontier,
+            'initial': {frontier: [start_vertex], 'visited': [], 'path': []},
+            'total_steps': len(steps),
+            'steps': steps
+        }
     
     def serialize_graph(self):
         """Convert graph to serializable format for frontend"""
@@ -258,6 +268,63 @@ class Graph:
             'adjacency_list': self.adj_list
         }
 
+def expand_traversal_trace(trace):
+    """
+    Replay a compact DFS/BFS trace into full per-step snapshots
+    (graph, stack/queue, visited and path on every step).
+    """
+    frontier_key = trace['frontier']
+    graph_data = trace['graph']
+    frontier = deque(trace['initial'][frontier_key])
+    visited = set(trace['initial']['visited'])
+    path = list(trace['initial']['path'])
+    pop = frontier.pop if frontier_key == 'stack' else frontier.popleft
+    
+    snapshots = []
+    for step in trace['steps']:
+        if 'pop' in step:
+            pop()
+        if 'push' in step:
+            frontier.append(step['push'])
+        if 'visit' in step:
+            visited.add(step['visit'])
+        if 'path' in step:
+            path.append(step['path'])
+        
+        snapshot = {
+            'step': step['step'],
+            'graph': graph_data,
+            'operation': step['operation'],
+            'current_vertex': step['current_vertex'],
+            frontier_key: list(frontier),
+            'visited': list(visited),
+            'path': path.copy(),
+            'exploring_edge': tuple(step['exploring_edge']) if step['exploring_edge'] else None,
+        }
+        if 'level' in step:
+            snapshot['level'] = step['level']
+        snapshot['description'] = step['description']
+        snapshots.append(snapshot)
+    
+    return snapshots
+
+def create_custom_graph(vertices, edges, directed=False):
+    """
+    Build a graph from user input: vertex count and a list of [u, v] pairs.
+    Raises ValueError describing the first invalid entry.
+    """
+    if not isinstance(vertices, int) or isinstance(vertices, bool) or vertices <= 0:
+        raise ValueError('vertices must be a positive integer')
+    
+    graph = Graph(vertices)
+    for edge in edges:
+        if not (isinstance(edge, (list, tuple)) and len(edge) == 2 and
+                all(isinstance(x, int) and not isinstance(x, bool) and 0 <= x < vertices for x in edge)):
+            raise ValueError(f'Invalid edge {edge!r}: expected [u, v] with 0 <= u, v < {vertices}')
+        graph.add_edge(edge[0], edge[1], bidirectional=not directed)
+    
+    return graph
+
 def create_sample_graph():
     """Create a sample graph for demonstration"""
     # Create a graph with 6 vertices
@@ -290,6 +357,7 @@ if __name__ == "__main__":
     print(f"\nDFS from vertex {start_vertex}:")
     dfs_steps = graph.dfs_steps(start_vertex)
     print(f"Generated {len(dfs_steps)} DFS steps")
+    print(f"Compact trace: {graph.dfs_trace(start_vertex)['total_steps']} delta steps")
     
     print(f"\nBFS from vertex {start_vertex}:")
     bfs_steps = graph.bfs_steps(start_vertex)
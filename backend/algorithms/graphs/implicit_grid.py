@@ -0,0 +1,280 @@
+"""
+Implicit Grid / Maze Graphs with Bitset State
+Author: Aryan Pravin Sahu
+
+A rows x cols grid is never materialised as an adjacency structure: cell
+r * cols + c has its up/right/down/left neighbours computed from (row, col)
+arithmetic. Walls and visited flags are one bit per cell, and BFS/DFS parents
+are stored as 2-bit direction codes, so a 1000 x 1000 maze needs about half a
+megabyte of state plus 4 bytes per reached cell for the visiting order.
+"""
+
+import base64
+import sys
+from array import array
+
+import numpy as np
+
+# Parent direction codes: 0 = up, 1 = right, 2 = down, 3 = left
+MAX_GRID_CELLS = 4_000_000
+
+
+def _bitset(size):
+    return bytearray((size + 7) >> 3)
+
+
+class ImplicitGrid:
+    """
+    4-connected grid whose walls live in a packed bit array (bit i set = cell i blocked).
+    """
+
+    def __init__(self, rows, cols, walls=None):
+        if rows < 1 or cols < 1 or rows * cols > MAX_GRID_CELLS:
+            raise ValueError(f'Grids must have between 1 and {MAX_GRID_CELLS} cells')
+        self.rows = rows
+        self.cols = cols
+        self.num_cells = rows * cols
+        self.walls = walls if walls is not None else _bitset(self.num_cells)
+        if len(self.walls) != (self.num_cells + 7) >> 3:
+            raise ValueError('walls must hold one bit per cell')
+
+    @classmethod
+    def random_maze(cls, rows, cols, wall_ratio=0.3, seed=None, keep_open=(), corridor=False):
+        """
+        Grid with a random fraction of blocked cells; cells in keep_open stay passable.
+        With corridor=True a random right/down path from the top-left to the
+        bottom-right cell is kept open too, so those two cells are always connected.
+        """
+        rng = np.random.default_rng(seed)
+        blocked = rng.random(rows * cols) < wall_ratio
+        blocked[list(keep_open)] = False
+        if corridor:
+            # Shuffle rows - 1 down moves among cols - 1 right moves
+            moves = rng.permutation(np.r_[np.full(rows - 1, cols), np.ones(cols - 1, dtype=np.int64)])
+            blocked[np.r_[0, np.cumsum(moves)].astype(np.int64)] = False
+        return cls(rows, cols, bytearray(np.packbits(blocked, bitorder='little').tobytes()))
+
+    @classmethod
+    def from_strings(cls, lines, wall='#'):
+        """Small grids from text rows, e.g. ['..#', '.#.', '...'] ('#' = wall)"""
+        if not lines or len({len(line) for line in lines}) != 1:
+            raise ValueError('Maze rows must be non-empty and of equal length')
+        grid = cls(len(lines), len(lines[0]))
+        for r, line in enumerate(lines):
+            for c, char in enumerate(line):
+                if char == wall:
+                    grid.set_wall(r * grid.cols + c)
+        return grid
+
+    def cell(self, row, col):
+        return row * self.cols + col
+
+    def position(self, cell):
+        """(row, col) of a cell index"""
+        return divmod(cell, self.cols)
+
+    def is_wall(self, cell):
+        return self.walls[cell >> 3] >> (cell & 7) & 1
+
+    def set_wall(self, cell, blocked=True):
+        if blocked:
+            self.walls[cell >> 3] |= 1 << (cell & 7)
+        else:
+            self.walls[cell >> 3] &= ~(1 << (cell & 7)) & 0xFF
+
+    def neighbors(self, cell):
+        """Open neighbours of a cell in up, right, down, left order"""
+        row, col = divmod(cell, self.cols)
+        result = []
+        for direction, neighbor in self._candidates(row, col, cell):
+            if not self.is_wall(neighbor):
+                result.append(neighbor)
+        return result
+
+    def _candidates(self, row, col, cell):
+        if row > 0:
+            yield 0, cell - self.cols
+        if col < self.cols - 1:
+            yield 1, cell + 1
+        if row < self.rows - 1:
+            yield 2, cell + self.cols
+        if col > 0:
+            yield 3, cell - 1
+
+    def _check_cell(self, cell, name):
+        if not isinstance(cell, int) or isinstance(cell, bool) or not 0 <= cell < self.num_cells:
+            raise ValueError(f'{name} must be a cell index between 0 and {self.num_cells - 1}')
+        if self.is_wall(cell):
+            raise ValueError(f'{name} cell {cell} is a wall')
+
+    def bfs(self, start, goal=None):
+        """
+        Breadth-first search from start, stopping early once goal is dequeued.
+        Returns a result dict (see _result) with per-level boundaries in the visiting order.
+        """
+        self._check_cell(start, 'start')
+        if goal is not None:
+            self._check_cell(goal, 'goal')
+        rows, cols, walls = self.rows, self.cols, self.walls
+        visited = _bitset(self.num_cells)
+        parents = bytearray((self.num_cells + 3) >> 2)
+
+        order = array('i', [start])
+        visited[start >> 3] |= 1 << (start & 7)
+        level_ends = []
+        level_end = 1
+        head = 0
+        found = False
+
+        while head < len(order):
+            if head == level_end:
+                level_ends.append(level_end)
+                level_end = len(order)
+            cell = order[head]
+            head += 1
+            if cell == goal:
+                found = True
+                break
+
+            row, col = divmod(cell, cols)
+            for move in range(4):
+                if move == 0:
+                    neighbor = cell - cols if row > 0 else -1
+                elif move == 1:
+                    neighbor = cell + 1 if col < cols - 1 else -1
+                elif move == 2:
+                    neighbor = cell + cols if row < rows - 1 else -1
+                else:
+                    neighbor = cell - 1 if col > 0 else -1
+                if neighbor < 0:
+                    continue
+                byte, bit = neighbor >> 3, 1 << (neighbor & 7)
+                if walls[byte] & bit or visited[byte] & bit:
+                    continue
+                visited[byte] |= bit
+                # The parent code is the direction back to cell (opposite of the move)
+                parents[neighbor >> 2] |= ((move + 2) & 3) << ((neighbor & 3) << 1)
+                order.append(neighbor)
+
+        level_ends.append(len(order) if not found else level_end)
+        return self._result('bfs', start, goal, order, parents, found, level_ends=level_ends,
+                            expanded=head, visited=visited)
+
+    def dfs(self, start, goal=None):
+        """
+        Depth-first search (neighbours tried up, right, down, left) with an explicit
+        stack of encoded (cell, next direction) entries, so depth is bounded only by memory.
+        """
+        self._check_cell(start, 'start')
+        if goal is not None:
+            self._check_cell(goal, 'goal')
+        rows, cols, walls = self.rows, self.cols, self.walls
+        visited = _bitset(self.num_cells)
+        parents = bytearray((self.num_cells + 3) >> 2)
+
+        order = array('i', [start])
+        visited[start >> 3] |= 1 << (start & 7)
+        stack = array('i', [start << 2])
+        found = start == goal
+
+        while stack and not found:
+            entry = stack[-1]
+            cell, move = entry >> 2, entry & 3
+            row, col = divmod(cell, cols)
+            advanced = False
+            while move < 4:
+                if move == 0:
+                    neighbor = cell - cols if row > 0 else -1
+                elif move == 1:
+                    neighbor = cell + 1 if col < cols - 1 else -1
+                elif move == 2:
+                    neighbor = cell + cols if row < rows - 1 else -1
+                else:
+                    neighbor = cell - 1 if col > 0 else -1
+                move += 1
+                if neighbor < 0:
+                    continue
+                byte, bit = neighbor >> 3, 1 << (neighbor & 7)
+                if walls[byte] & bit or visited[byte] & bit:
+                    continue
+                visited[byte] |= bit
+                parents[neighbor >> 2] |= ((move + 1) & 3) << ((neighbor & 3) << 1)
+                order.append(neighbor)
+                advanced = True
+                break
+
+            if move < 4:
+                stack[-1] = (cell << 2) | move
+            else:
+                stack.pop()
+            if advanced:
+                stack.append(neighbor << 2)
+                found = neighbor == goal
+
+        return self._result('dfs', start, goal, order, parents, found, expanded=len(order), visited=visited)
+
+    def _parent(self, parents, cell):
+        direction = parents[cell >> 2] >> ((cell & 3) << 1) & 3
+        return cell + (-self.cols, 1, self.cols, -1)[direction]
+
+    def _result(self, algorithm, start, goal, order, parents, found, level_ends=None, expanded=0, visited=None):
+        path = array('i')
+        if found:
+            cell = goal
+            path.append(cell)
+            while cell != start:
+                cell = self._parent(parents, cell)
+                path.append(cell)
+            path.reverse()
+        result = {
+            'algorithm': algorithm,
+            'start': start,
+            'goal': goal,
+            'found': found,
+            'order': order,
+            'path': path,
+            'expanded': expanded,
+            'state_bytes': len(self.walls) + len(visited) + len(parents) + order.itemsize * len(order)
+        }
+        if level_ends is not None:
+            result['level_ends'] = level_ends
+        return result
+
+    def memory_bytes(self):
+        """Bytes used by the grid itself (the wall bitset)"""
+        return sys.getsizeof(self.walls)
+
+    def trace(self, algorithm, start, goal=None, encoding='list'):
+        """
+        Compact traversal trace: the walls are sent once as a bitset and the steps are
+        just the cell indices in visiting order (BFS adds level boundaries).
+        encoding='base64' packs cell lists as little-endian uint32 for large grids.
+        """
+        if algorithm not in ('bfs', 'dfs'):
+            raise ValueError("algorithm must be 'bfs' or 'dfs'")
+        result = self.bfs(start, goal) if algorithm == 'bfs' else self.dfs(start, goal)
+
+        def encode_cells(cells):
+            if encoding == 'base64':
+                return base64.b64encode(np.asarray(cells, dtype='<u4').tobytes()).decode('ascii')
+            return cells.tolist()
+
+        trace = {
+            'algorithm': algorithm,
+            'mode': 'implicit_grid',
+            'rows': self.rows,
+            'cols': self.cols,
+            'walls': base64.b64encode(bytes(self.walls)).decode('ascii'),
+            'walls_bit_order': 'little',
+            'encoding': encoding,
+            'start': start,
+            'goal': goal,
+            'found': result['found'],
+            'total_steps': len(result['order']),
+            'visit_order': encode_cells(result['order']),
+            'path': encode_cells(result['path']),
+            'state_bytes': result['state_bytes']
+        }
+        if 'level_ends' in result:
+            trace['level_ends'] = result['level_ends']
+        return trace
@@ -0,0 +1,285 @@
+"""
+Server-Side Graph Layout Engine
+Author: Aryan Pravin Sahu
+
+Layouts are computed once per graph structure and cached, so every viewer of the
+same graph gets the same positions without running a layout in the browser.
+Positions use the {node: {'x': .., 'y': ..}} format of get_sample_positions().
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from algorithms.graphs.frontier_bfs import level_synchronous_bfs
+from algorithms.graphs.topological_sort import topological_layers
+
+# Above this many vertices repulsion uses the grid approximation instead of all pairs
+EXACT_REPULSION_LIMIT = 400
+# Largest graph the engine will lay out
+MAX_LAYOUT_VERTICES = 10000
+# Layouts computed inside an API request: larger graphs get no layout (the client
+# places them) and force iterations are capped, keeping a cache miss well under a second
+INLINE_LAYOUT_VERTICES = 2000
+INLINE_LAYOUT_ITERATIONS = 50
+# Default canvas the positions are scaled to
+CANVAS_WIDTH = 600
+CANVAS_HEIGHT = 400
+CANVAS_MARGIN = 40
+
+
+def _pair_weights_repulsion(positions, sources, weights):
+    """
+    Repulsion of every position from a set of sources with the given masses:
+    sum_j m_j * (p_i - s_j) / |p_i - s_j|^2, written as matrix products per axis.
+    """
+    dx = positions[:, 0, None] - sources[None, :, 0]
+    dy = positions[:, 1, None] - sources[None, :, 1]
+    inverse = weights / np.maximum(dx * dx + dy * dy, 1e-9)
+    total = inverse.sum(axis=1)
+    return np.column_stack([
+        positions[:, 0] * total - inverse @ sources[:, 0],
+        positions[:, 1] * total - inverse @ sources[:, 1]
+    ])
+
+
+def _exact_repulsion(positions, k_squared, chunk=1024):
+    """Sum of k^2 * (p_i - p_j) / |p_i - p_j|^2 over all pairs, in row chunks"""
+    force = np.empty_like(positions)
+    masses = np.ones(len(positions))
+    for start in range(0, len(positions), chunk):
+        rows = positions[start:start + chunk]
+        # A vertex's distance to itself is clamped, and its own term is exactly zero
+        force[start:start + chunk] = k_squared * _pair_weights_repulsion(rows, positions, masses)
+    return force
+
+
+def _grid_repulsion(positions, k_squared, cells_per_side, chunk=2048):
+    """
+    Approximate repulsion: vertices in other grid cells are replaced by their cell's
+    centroid weighted by the cell's vertex count; vertices sharing a cell repel exactly.
+    """
+    n = len(positions)
+    low = positions.min(axis=0)
+    span = np.maximum(positions.max(axis=0) - low, 1e-9)
+    cell_xy = np.minimum(((positions - low) / span * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell = cell_xy[:, 0] * cells_per_side + cell_xy[:, 1]
+
+    counts = np.bincount(cell, minlength=cells_per_side * cells_per_side)
+    occupied = np.flatnonzero(counts)
+    centroids = np.column_stack([
+        np.bincount(cell, weights=positions[:, 0], minlength=counts.size)[occupied],
+        np.bincount(cell, weights=positions[:, 1], minlength=counts.size)[occupied]
+    ]) / counts[occupied, None]
+    masses = counts[occupied].astype(np.float64)
+    cell_slot = np.full(counts.size, -1, dtype=np.int64)
+    cell_slot[occupied] = np.arange(occupied.size)
+
+    force = np.empty_like(positions)
+    for start in range(0, n, chunk):
+        rows = positions[start:start + chunk]
+        force[start:start + chunk] = _pair_weights_repulsion(rows, centroids, masses)
+    # The vertex's own cell is handled exactly below, so take its centroid term back out
+    own = centroids[cell_slot[cell]]
+    delta = positions - own
+    force -= delta * (masses[cell_slot[cell]] / np.maximum(np.einsum('ij,ij->i', delta, delta), 1e-9))[:, None]
+    force *= k_squared
+
+    # Exact repulsion between vertices of the same cell
+    order = np.argsort(cell, kind='stable')
+    cell_offsets = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=cell_offsets[1:])
+    same = counts[cell]
+    block_starts = np.cumsum(same) - same
+    index = np.arange(int(same.sum())) - np.repeat(block_starts, same) + np.repeat(cell_offsets[cell], same)
+    u, v = np.repeat(np.arange(n), same), order[index]
+    keep = u != v
+    u, v = u[keep], v[keep]
+    delta = positions[u] - positions[v]
+    distance_squared = np.maximum(np.einsum('ij,ij->i', delta, delta), 1e-9)
+    pair_force = k_squared * delta / distance_squared[:, None]
+    force[:, 0] += np.bincount(u, weights=pair_force[:, 0], minlength=n)
+    force[:, 1] += np.bincount(u, weights=pair_force[:, 1], minlength=n)
+    return force
+
+
+def default_iterations(n):
+    return 100 if n <= EXACT_REPULSION_LIMIT else 40
+
+
+def force_directed_layout(csr, iterations=None, seed=0):
+    """
+    Fruchterman-Reingold layout in the unit square, vectorised over vertices and edges.
+    Repulsion is exact for small graphs and grid-approximated above EXACT_REPULSION_LIMIT.
+    Returns an (n, 2) coordinate array.
+    """
+    n = csr.num_vertices
+    rng = np.random.default_rng(seed)
+    positions = rng.random((n, 2))
+    if n == 1:
+        return positions
+
+    if iterations is None:
+        iterations = default_iterations(n)
+    k = np.sqrt(1.0 / n)
+    u, v, _ = csr.undirected_edges()
+    cells_per_side = int(min(64, max(4, np.sqrt(n) / 2)))
+    temperature = 0.1
+
+    for iteration in range(iterations):
+        if n <= EXACT_REPULSION_LIMIT:
+            force = _exact_repulsion(positions, k * k)
+        else:
+            force = _grid_repulsion(positions, k * k, cells_per_side)
+
+        # Attraction d^2 / k along every edge, applied to both endpoints
+        delta = positions[u] - positions[v]
+        pull = delta * (np.sqrt(np.einsum('ij,ij->i', delta, delta)) / k)[:, None]
+        for axis in (0, 1):
+            force[:, axis] -= np.bincount(u, weights=pull[:, axis], minlength=n)
+            force[:, axis] += np.bincount(v, weights=pull[:, axis], minlength=n)
+
+        # Move at most `temperature` per step, cooling linearly
+        length = np.maximum(np.sqrt(np.einsum('ij,ij->i', force, force)), 1e-9)
+        step = temperature * (1.0 - iteration / iterations)
+        positions += force * (np.minimum(length, step) / length)[:, None]
+
+    return positions
+
+
+def _tree_layers(csr, root=0):
+    """BFS depth of every vertex when the (symmetric) graph is a spanning tree, else None"""
+    n = csr.num_vertices
+    u, _, _ = csr.undirected_edges()
+    if u.size != n - 1:
+        return None
+    distances = level_synchronous_bfs(csr, root)['distances']
+    return distances if (distances >= 0).all() else None
+
+
+def layered_layout(csr, layers, sweeps=4):
+    """
+    Layered (Sugiyama-style) layout: y is the layer, and vertices inside a layer are
+    ordered by the barycenter of their neighbours in the layer above, with a few
+    down/up sweeps. Returns an (n, 2) coordinate array in the unit square.
+    """
+    n = csr.num_vertices
+    u, v, _ = csr.undirected_edges()
+    depth = int(layers.max()) + 1
+    order = np.argsort(layers, kind='stable')
+    layer_offsets = np.zeros(depth + 1, dtype=np.int64)
+    np.cumsum(np.bincount(layers, minlength=depth), out=layer_offsets[1:])
+
+    # Rank of each vertex inside its layer, normalised to (0, 1)
+    rank = np.empty(n, dtype=np.float64)
+    for d in range(depth):
+        members = order[layer_offsets[d]:layer_offsets[d + 1]]
+        rank[members] = (np.arange(members.size) + 0.5) / members.size
+
+    upper = np.where(layers[u] < layers[v], u, v)
+    lower = np.where(layers[u] < layers[v], v, u)
+    between = layers[upper] != layers[lower]
+    upper, lower = upper[between], lower[between]
+
+    for sweep in range(sweeps):
+        # Alternate top-down (place by parents) and bottom-up (place by children)
+        anchor, moving = (upper, lower) if sweep % 2 == 0 else (lower, upper)
+        totals = np.bincount(moving, weights=rank[anchor], minlength=n)
+        degree = np.bincount(moving, minlength=n)
+        barycenter = np.where(degree > 0, totals / np.maximum(degree, 1), rank)
+        for d in range(depth):
+            members = order[layer_offsets[d]:layer_offsets[d + 1]]
+            members = members[np.argsort(barycenter[members], kind='stable')]
+            order[layer_offsets[d]:layer_offsets[d + 1]] = members
+            rank[members] = (np.arange(members.size) + 0.5) / members.size
+
+    y = (layers + 0.5) / depth
+    return np.column_stack([rank, y])
+
+
+def compute_layout(csr, method='auto', seed=0, iterations=None):
+    """
+    Lay out a CSR graph; method is 'force', 'layered' or 'auto' (layered for
+    DAGs and trees, force-directed otherwise). iterations overrides the force
+    layout's default. Returns (coordinates, method used).
+    """
+    if csr.num_vertices > MAX_LAYOUT_VERTICES:
+        raise ValueError(f'Layouts are limited to {MAX_LAYOUT_VERTICES} vertices')
+    if method not in ('auto', 'force', 'layered'):
+        raise ValueError(f"Unknown layout method '{method}' (expected 'auto', 'force' or 'layered')")
+
+    if method in ('auto', 'layered'):
+        layers = _tree_layers(csr) if _is_symmetric(csr) else topological_layers(csr)
+        if layers is not None:
+            return layered_layout(csr, layers), 'layered'
+        if method == 'layered':
+            raise ValueError('Layered layout needs a tree or a directed acyclic graph')
+    return force_directed_layout(csr, iterations, seed), 'force'
+
+
+def _is_symmetric(csr):
+    sources = csr.sources()
+    forward = np.sort(sources * csr.num_vertices + csr.targets)
+    backward = np.sort(csr.targets * csr.num_vertices + sources)
+    return np.array_equal(forward, backward)
+
+
+def to_positions(coordinates, labels=None, width=CANVAS_WIDTH, height=CANVAS_HEIGHT, margin=CANVAS_MARGIN):
+    """Scale unit coordinates to the canvas as {label: {'x': .., 'y': ..}}"""
+    low = coordinates.min(axis=0)
+    span = coordinates.max(axis=0) - low
+    # Axes without spread (a path drawn as a single column) are centred
+    scaled = np.where(span > 0, (coordinates - low) / np.where(span > 0, span, 1.0), 0.5)
+    scaled[:, 0] = margin + scaled[:, 0] * (width - 2 * margin)
+    scaled[:, 1] = margin + scaled[:, 1] * (height - 2 * margin)
+    scaled = np.round(scaled, 1).tolist()
+    labels = labels if labels is not None else range(len(scaled))
+    return {label: {'x': x, 'y': y} for label, (x, y) in zip(labels, scaled)}
+
+
+class LayoutCache:
+    """
+    LRU cache of layouts keyed by (graph structure fingerprint, method, iterations).
+    Edge weights do not affect the layout, so they are left out of the key.
+    """
+
+    def __init__(self, max_layouts=256):
+        self.max_layouts = max_layouts
+        self._layouts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_layout(self, csr, labels=None, method='auto', iterations=None):
+        """Canvas positions for the graph, computed at most once per structure"""
+        key = (csr.fingerprint(include_weights=False), method, iterations)
+        cached = self._layouts.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._layouts.move_to_end(key)
+        else:
+            self.misses += 1
+            coordinates, used = compute_layout(csr, method, iterations=iterations)
+            cached = (coordinates, used)
+            self._layouts[key] = cached
+            while len(self._layouts) > self.max_layouts:
+                self._layouts.popitem(last=False)
+
+        coordinates, used = cached
+        return {'method': used, 'positions': to_positions(coordinates, labels)}
+
+    def inline_layout(self, csr, labels=None):
+        """
+        Layout for embedding in an API response: None above INLINE_LAYOUT_VERTICES,
+        otherwise get_layout with force iterations capped at INLINE_LAYOUT_ITERATIONS
+        """
+        if csr.num_vertices > INLINE_LAYOUT_VERTICES:
+            return None
+        iterations = min(default_iterations(csr.num_vertices), INLINE_LAYOUT_ITERATIONS)
+        return self.get_layout(csr, labels, iterations=iterations)
+
+    def stats(self):
+        return {'layouts': len(self._layouts), 'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide cache used by the API
+layout_cache = LayoutCache()
@@ -0,0 +1,220 @@
+"""
+Minimum Spanning Trees: Kruskal (Union-Find) and Prim (Indexed Heap)
+Author: Aryan Pravin Sahu
+
+Both algorithms treat the graph as undirected and return a minimum spanning
+forest when the graph is disconnected (Prim: the tree of the start's component).
+"""
+
+import numpy as np
+
+from algorithms.data_structures.priority_queue import IndexedMinHeap
+from algorithms.graphs.csr_graph import CSRGraph
+from algorithms.graphs.dijkstra import json_distance
+from algorithms.graphs.union_find import UnionFind
+
+
+def _weighted_edges(csr):
+    us, vs, weights = csr.undirected_edges()
+    if weights is None:
+        weights = np.ones(us.size)
+    return us, vs, weights
+
+
+def _symmetric(csr):
+    """Undirected CSR with unit weights filled in, for neighbour scans"""
+    us, vs, weights = _weighted_edges(csr)
+    return CSRGraph.from_edges(csr.num_vertices, us, vs, weights, directed=False, dedupe=False)
+
+
+def _plain(value):
+    """Weights are stored as floats; report whole numbers as ints"""
+    return int(value) if float(value).is_integer() else value
+
+
+def kruskal(csr):
+    """
+    Kruskal's algorithm: scan edges by increasing weight and keep those joining two
+    different union-find sets. Returns (total_weight, [(u, v, weight), ...]).
+    """
+    us, vs, weights = _weighted_edges(csr)
+    order = np.argsort(weights, kind='stable')
+    sets = UnionFind(csr.num_vertices)
+    tree, total = [], 0
+    for u, v, weight in zip(us[order].tolist(), vs[order].tolist(), weights[order].tolist()):
+        if sets.union(u, v):
+            tree.append((u, v, _plain(weight)))
+            total += weight
+            if sets.components == 1:
+                break
+    return _plain(total), tree
+
+
+def kruskal_trace(csr, labels=None):
+    """Compact Kruskal trace: each step records the edge considered, the find() roots and any union"""
+    labels = list(labels) if labels is not None else list(range(csr.num_vertices))
+    us, vs, weights = _weighted_edges(csr)
+    order = np.argsort(weights, kind='stable')
+    sets = UnionFind(csr.num_vertices)
+    tree, total = [], 0
+    steps = [{
+        'type': 'initialization',
+        'message': f'Sorted {us.size} edges by weight; every vertex starts in its own set',
+        'edge': None
+    }]
+
+    for u, v, weight in zip(us[order].tolist(), vs[order].tolist(), weights[order].tolist()):
+        edge = [labels[u], labels[v], _plain(weight)]
+        root_u, compressed_u = sets.find_traced(u)
+        root_v, compressed_v = sets.find_traced(v)
+        step = {
+            'edge': edge,
+            'find': {'roots': [labels[root_u], labels[root_v]]}
+        }
+        compressed = compressed_u + compressed_v
+        parent_updates = {labels[x]: labels[sets.parent[x]] for x in compressed}
+
+        merged = sets.link(root_u, root_v)
+        if merged:
+            child, parent = merged
+            parent_updates[labels[child]] = labels[parent]
+            tree.append(edge)
+            total += weight
+            step.update({
+                'type': 'add_edge',
+                'message': f'Add edge {edge[0]}-{edge[1]} (weight {edge[2]}): it joins two components',
+                'tree_edge': edge,
+                'rank_update': {'node': labels[parent], 'rank': sets.rank[parent]}
+            })
+        else:
+            step.update({
+                'type': 'skip_edge',
+                'message': f'Skip edge {edge[0]}-{edge[1]} (weight {edge[2]}): it would form a cycle'
+            })
+        if parent_updates:
+            step['parent_updates'] = parent_updates
+        steps.append(step)
+        if sets.components == 1:
+            break
+
+    steps.append({
+        'type': 'completed',
+        'message': f'Minimum spanning {"tree" if sets.components == 1 else "forest"} '
+                   f'with total weight {_plain(total)}',
+        'edge': None
+    })
+    return {
+        'algorithm': 'kruskal',
+        'nodes': labels,
+        'edges': [[labels[u], labels[v], _plain(w)] for u, v, w in zip(us.tolist(), vs.tolist(), weights.tolist())],
+        'tree_edges': tree,
+        'total_weight': _plain(total),
+        'components': sets.components,
+        'total_steps': len(steps),
+        'steps': steps
+    }
+
+
+def prim(csr, start=0):
+    """
+    Prim's algorithm on an indexed min-heap keyed by the cheapest edge into the tree.
+    Returns (total_weight, [(parent, vertex, weight), ...]) for start's component.
+    """
+    graph = _symmetric(csr)
+    offsets, targets, weights = graph.offsets.tolist(), graph.targets.tolist(), graph.weights.tolist()
+    in_tree = bytearray(graph.num_vertices)
+    best_parent = {}
+    heap = IndexedMinHeap(graph.num_vertices)
+    heap.push(start, 0)
+    tree, total = [], 0
+
+    while heap:
+        vertex, weight = heap.pop()
+        in_tree[vertex] = 1
+        if vertex != start:
+            tree.append((best_parent[vertex], vertex, _plain(weight)))
+            total += weight
+        lo, hi = offsets[vertex], offsets[vertex + 1]
+        for neighbor, edge_weight in zip(targets[lo:hi], weights[lo:hi]):
+            if not in_tree[neighbor] and heap.push_or_decrease(neighbor, edge_weight):
+                best_parent[neighbor] = vertex
+    return _plain(total), tree
+
+
+def prim_trace(csr, start=0, labels=None):
+    """Compact Prim trace in the dijkstra_trace style: heap operations and key updates only"""
+    labels = list(labels) if labels is not None else list(range(csr.num_vertices))
+    graph = _symmetric(csr)
+    offsets, targets, weights = graph.offsets.tolist(), graph.targets.tolist(), graph.weights.tolist()
+    in_tree = bytearray(graph.num_vertices)
+    best_parent = {}
+    heap = IndexedMinHeap(graph.num_vertices)
+    heap.push(start, 0)
+    tree, total = [], 0
+    steps = [{
+        'type': 'initialization',
+        'message': f'Starting Prim\'s algorithm from node {labels[start]}',
+        'current_node': labels[start],
+        'examining_edge': None,
+        'heap_operation': {'op': 'push', 'node': labels[start], 'priority': 0}
+    }]
+
+    while heap:
+        vertex, weight = heap.pop()
+        in_tree[vertex] = 1
+        step = {
+            'type': 'add_node',
+            'message': f'Add node {labels[vertex]} to the tree',
+            'current_node': labels[vertex],
+            'examining_edge': None,
+            'heap_operation': {'op': 'pop', 'node': labels[vertex], 'priority': _plain(weight)},
+            'visited_node': labels[vertex]
+        }
+        if vertex != start:
+            edge = [labels[best_parent[vertex]], labels[vertex], _plain(weight)]
+            tree.append(edge)
+            total += weight
+            step['tree_edge'] = edge
+            step['message'] += f' via edge {edge[0]}-{edge[1]} (weight {edge[2]})'
+        steps.append(step)
+
+        lo, hi = offsets[vertex], offsets[vertex + 1]
+        for neighbor, edge_weight in zip(targets[lo:hi], weights[lo:hi]):
+            if in_tree[neighbor]:
+                continue
+            operation = heap.push_or_decrease(neighbor, edge_weight)
+            edge = [labels[vertex], labels[neighbor], _plain(edge_weight)]
+            if operation:
+                best_parent[neighbor] = vertex
+                steps.append({
+                    'type': 'key_updated',
+                    'message': f'Cheapest edge to {labels[neighbor]} is now {edge[0]}-{edge[1]} (weight {edge[2]})',
+                    'current_node': labels[vertex],
+                    'examining_edge': edge,
+                    'key_update': {'node': labels[neighbor], 'key': edge[2], 'parent': labels[vertex]},
+                    'heap_operation': {'op': operation, 'node': labels[neighbor], 'priority': edge[2]}
+                })
+            else:
+                steps.append({
+                    'type': 'key_not_updated',
+                    'message': f'Edge {edge[0]}-{edge[1]} (weight {edge[2]}) is not cheaper than '
+                               f'{json_distance(heap.priority(neighbor))}',
+                    'current_node': labels[vertex],
+                    'examining_edge': edge
+                })
+
+    steps.append({
+        'type': 'completed',
+        'message': f'Prim\'s algorithm completed - tree weight {_plain(total)}',
+        'current_node': None,
+        'examining_edge': None
+    })
+    return {
+        'algorithm': 'prim',
+        'nodes': labels,
+        'start_node': labels[start],
+        'tree_edges': tree,
+        'total_weight': _plain(total),
+        'total_steps': len(steps),
+        'steps': steps
+    }
@@ -0,0 +1,411 @@
+"""
+Point-to-Point Shortest Paths: A* Search and Bidirectional Dijkstra
+Author: Aryan Pravin Sahu
+
+Untraced functions work on integer vertices of a weighted CSRGraph and return
+(distance, path, nodes_expanded). Traced functions take the same
+{node: [(neighbor, weight), ...]} dicts as dijkstra.py and return a compact trace.
+"""
+
+import math
+
+import numpy as np
+
+from algorithms.data_structures.priority_queue import IndexedMinHeap
+from algorithms.graphs.csr_graph import CSRGraph
+from algorithms.graphs.dijkstra import json_distance
+
+def _metric_distances(metric, dx, dy):
+    if metric == 'manhattan':
+        return np.abs(dx) + np.abs(dy)
+    if metric == 'euclidean':
+        return np.hypot(dx, dy)
+    raise ValueError(f"Unknown heuristic '{metric}' (expected 'manhattan', 'euclidean' or 'zero')")
+
+def admissible_scale(csr, coordinates, metric):
+    """
+    Largest factor s such that s * metric(u, v) <= weight(u, v) on every edge.
+    Scaling the heuristic by s keeps it admissible and consistent for any layout
+    (by the triangle inequality), e.g. pixel positions with unrelated edge weights.
+    """
+    sources = csr.sources()
+    dx = coordinates[csr.targets, 0] - coordinates[sources, 0]
+    dy = coordinates[csr.targets, 1] - coordinates[sources, 1]
+    lengths = _metric_distances(metric, dx, dy)
+    weights = csr.weights if csr.weights is not None else np.ones(csr.num_edges)
+    positive = lengths > 0
+    if not positive.any():
+        return 1.0
+    return float(np.min(weights[positive] / lengths[positive]))
+
+def make_heuristic(metric, coordinates, target, scale=1.0):
+    """
+    Heuristic h(v) estimating the remaining cost from v to target.
+    coordinates is an (n, 2) array of vertex positions; metric is 'manhattan', 'euclidean' or 'zero'.
+    """
+    if metric == 'zero' or coordinates is None:
+        return lambda v: 0
+
+    xs = coordinates[:, 0].tolist()
+    ys = coordinates[:, 1].tolist()
+    tx, ty = xs[target], ys[target]
+
+    if metric == 'manhattan':
+        return lambda v: scale * (abs(xs[v] - tx) + abs(ys[v] - ty))
+    if metric == 'euclidean':
+        return lambda v: scale * math.hypot(xs[v] - tx, ys[v] - ty)
+    _metric_distances(metric, 0, 0)
+
+def positions_to_coordinates(positions, nodes):
+    """(n, 2) coordinate array from {node: {'x': .., 'y': ..}} (as in get_sample_positions)"""
+    return np.array([[positions[node]['x'], positions[node]['y']] for node in nodes], dtype=np.float64)
+
+def _edge_lists(csr):
+    offsets = csr.offsets.tolist()
+    weights = csr.weights if csr.weights is not None else np.ones(csr.num_edges)
+    return offsets, csr.targets, weights
+
+def _walk_back(previous, source, node):
+    path = [node]
+    while path[-1] != source:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
+
+def astar(csr, source, target, heuristic=None, stop_at_target=True, arity=2):
+    """
+    A* search from source to target. heuristic must be consistent (e.g. from make_heuristic);
+    None means zero, i.e. Dijkstra. With stop_at_target=False the whole reachable
+    graph is settled, which is what plain dijkstra_simple does. arity selects the
+    d-ary heap used for the open set.
+    Returns (distance, path, nodes_expanded).
+    """
+    heuristic = heuristic or (lambda v: 0)
+    offsets, targets, weights = _edge_lists(csr)
+    distance = {source: 0}
+    previous = {}
+    settled = bytearray(csr.num_vertices)
+    heap = IndexedMinHeap(csr.num_vertices, arity)
+    heap.push(source, heuristic(source))
+    expanded = 0
+
+    while heap:
+        current, _ = heap.pop()
+        settled[current] = 1
+        expanded += 1
+        if current == target and stop_at_target:
+            break
+
+        current_distance = distance[current]
+        lo, hi = offsets[current], offsets[current + 1]
+        for neighbor, weight in zip(targets[lo:hi].tolist(), weights[lo:hi].tolist()):
+            if settled[neighbor]:
+                continue
+            new_distance = current_distance + weight
+            if new_distance < distance.get(neighbor, math.inf):
+                distance[neighbor] = new_distance
+                previous[neighbor] = current
+                heap.push_or_decrease(neighbor, new_distance + heuristic(neighbor))
+
+    if target not in distance:
+        return math.inf, [], expanded
+    return distance[target], _walk_back(previous, source, target), expanded
+
+def dijkstra_point_to_point(csr, source, target, stop_at_target=True, arity=2):
+    """Dijkstra on a CSR graph (A* with a zero heuristic); returns (distance, path, nodes_expanded)"""
+    return astar(csr, source, target, None, stop_at_target, arity)
+
+def bidirectional_dijkstra(csr, source, target, reverse_csr=None):
+    """
+    Dijkstra grown from both endpoints at once, always advancing the side with the
+    smaller tentative distance. Stops once the two frontiers' minimum keys sum to
+    at least the best meeting distance seen. Returns (distance, path, nodes_expanded).
+    """
+    if source == target:
+        return 0, [source], 0
+
+    sides = []
+    for graph, start in ((csr, source), (reverse_csr or csr.reversed(), target)):
+        heap = IndexedMinHeap(csr.num_vertices)
+        heap.push(start, 0)
+        sides.append({
+            'edges': _edge_lists(graph),
+            'distance': {start: 0},
+            'previous': {},
+            'settled': bytearray(csr.num_vertices),
+            'heap': heap
+        })
+
+    # The best path found so far is source ~> meeting[0] -> meeting[1] ~> target
+    best, meeting, expanded = math.inf, None, 0
+    forward, backward = sides
+
+    while forward['heap'] and backward['heap']:
+        forward_min = forward['heap'].peek()[1]
+        backward_min = backward['heap'].peek()[1]
+        if forward_min + backward_min >= best:
+            break
+
+        side, other = (forward, backward) if forward_min <= backward_min else (backward, forward)
+        current, current_distance = side['heap'].pop()
+        side['settled'][current] = 1
+        expanded += 1
+
+        offsets, targets, weights = side['edges']
+        lo, hi = offsets[current], offsets[current + 1]
+        for neighbor, weight in zip(targets[lo:hi].tolist(), weights[lo:hi].tolist()):
+            new_distance = current_distance + weight
+            if not side['settled'][neighbor] and new_distance < side['distance'].get(neighbor, math.inf):
+                side['distance'][neighbor] = new_distance
+                side['previous'][neighbor] = current
+                side['heap'].push_or_decrease(neighbor, new_distance)
+            if neighbor in other['distance'] and new_distance + other['distance'][neighbor] < best:
+                best = new_distance + other['distance'][neighbor]
+                meeting = (current, neighbor) if side is forward else (neighbor, current)
+
+    if meeting is None:
+        return math.inf, [], expanded
+
+    path = _walk_back(forward['previous'], source, meeting[0])
+    node = meeting[1]
+    path.append(node)
+    while node != target:
+        node = backward['previous'][node]
+        path.append(node)
+    return best, path, expanded
+
+def astar_trace(graph, start_node, goal_node, positions=None, heuristic='euclidean'):
+    """
+    Generate a compact A* trace in the dijkstra_trace format. Heap priorities are
+    f = g + h; every distance update also reports g, h and f. Without positions
+    the heuristic is zero and the search is Dijkstra stopping at the goal.
+    """
+    csr, nodes = CSRGraph.from_weighted_dict(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    coordinates = positions_to_coordinates(positions, nodes) if positions else None
+    if coordinates is None:
+        heuristic = 'zero'
+    scale = admissible_scale(csr, coordinates, heuristic) if heuristic != 'zero' else 1.0
+    h = make_heuristic(heuristic, coordinates, index[goal_node], scale)
+
+    distances = [math.inf] * len(nodes)
+    previous = {}
+    visited = set()
+    heap = IndexedMinHeap(len(nodes))
+    steps = []
+
+    start, goal = index[start_node], index[goal_node]
+    distances[start] = 0
+    heap.push(start, h(start))
+
+    steps.append({
+        'type': 'initialization',
+        'message': f'Starting A* search from node {start_node} to node {goal_node}',
+        'current_node': start_node,
+        'examining_edge': None,
+        'heap_operation': {'op': 'push', 'node': start_node, 'priority': h(start)}
+    })
+
+    while heap:
+        current, priority = heap.pop()
+        current_node = nodes[current]
+        visited.add(current_node)
+
+        steps.append({
+            'type': 'visiting_node',
+            'message': f'Visiting node {current_node} with g = {distances[current]}, f = {priority}',
+            'current_node': current_node,
+            'examining_edge': None,
+            'heap_operation': {'op': 'pop', 'node': current_node, 'priority': priority},
+            'visited_node': current_node
+        })
+        if current == goal:
+            break
+
+        for neighbor, weight in graph[current_node]:
+            if neighbor in visited:
+                continue
+            neighbor_index = index[neighbor]
+            new_distance = distances[current] + weight
+
+            if new_distance < distances[neighbor_index]:
+                distances[neighbor_index] = new_distance
+                previous[neighbor] = current_node
+                estimate = h(neighbor_index)
+                operation = heap.push_or_decrease(neighbor_index, new_distance + estimate)
+
+                steps.append({
+                    'type': 'distance_updated',
+                    'message': f'Updated {neighbor}: g = {new_distance}, h = {estimate:g}, '
+                               f'f = {new_distance + estimate:g} (via {current_node})',
+                    'current_node': current_node,
+                    'examining_edge': [current_node, neighbor, weight],
+                    'distance_update': {'node': neighbor, 'distance': new_distance, 'previous': current_node,
+                                        'g': new_distance, 'h': estimate, 'f': new_distance + estimate},
+                    'heap_operation': {'op': operation, 'node': neighbor, 'priority': new_distance + estimate}
+                })
+            else:
+                steps.append({
+                    'type': 'distance_not_updated',
+                    'message': f'Distance to {neighbor} not updated: {new_distance} >= '
+                               f'{json_distance(distances[neighbor_index])}',
+                    'current_node': current_node,
+                    'examining_edge': [current_node, neighbor, weight]
+                })
+
+    path = _walk_back(previous, start_node, goal_node) if goal_node in visited else []
+    steps.append({
+        'type': 'completed',
+        'message': f'A* search completed - shortest path {" -> ".join(path)}' if path
+                   else f'A* search completed - {goal_node} is unreachable',
+        'current_node': None,
+        'examining_edge': None
+    })
+
+    return {
+        'algorithm': 'astar',
+        'graph': {node: [list(edge) for edge in edges] for node, edges in graph.items()},
+        'nodes': nodes,
+        'start_node': start_node,
+        'goal_node': goal_node,
+        'heuristic': heuristic,
+        'heuristic_scale': scale,
+        'initial_distances': {node: json_distance(math.inf) for node in nodes} | {start_node: 0},
+        'final_distances': {node: json_distance(distances[i]) for i, node in enumerate(nodes)},
+        'final_previous': previous,
+        'path': path,
+        'distance': json_distance(distances[goal]),
+        'nodes_expanded': len(visited),
+        'total_steps': len(steps),
+        'steps': steps
+    }
+
+def bidirectional_dijkstra_trace(graph, start_node, goal_node):
+    """
+    Generate a compact bidirectional Dijkstra trace. Every step carries a 'direction'
+    ('forward' from the start, 'backward' from the goal over reversed edges) and
+    meeting updates report the best start-to-goal distance found so far.
+    """
+    reverse = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbor, weight in edges:
+            reverse[neighbor].append((node, weight))
+
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    sides = {}
+    for direction, adjacency, root in (('forward', graph, start_node), ('backward', reverse, goal_node)):
+        heap = IndexedMinHeap(len(nodes))
+        heap.push(index[root], 0)
+        sides[direction] = {'edges': adjacency, 'distance': {root: 0}, 'previous': {},
+                            'visited': set(), 'heap': heap}
+    forward, backward = sides['forward'], sides['backward']
+
+    steps = [{
+        'type': 'initialization',
+        'message': f'Starting bidirectional Dijkstra from {start_node} (forward) and {goal_node} (backward)',
+        'current_node': start_node,
+        'examining_edge': None,
+        'direction': 'forward',
+        'heap_operation': {'op': 'push', 'node': start_node, 'priority': 0}
+    }, {
+        'type': 'initialization',
+        'message': f'Backward search starts from {goal_node}',
+        'current_node': goal_node,
+        'examining_edge': None,
+        'direction': 'backward',
+        'heap_operation': {'op': 'push', 'node': goal_node, 'priority': 0}
+    }]
+
+    best, meeting = (0, (start_node, start_node)) if start_node == goal_node else (math.inf, None)
+    while forward['heap'] and backward['heap']:
+        forward_min = forward['heap'].peek()[1]
+        backward_min = backward['heap'].peek()[1]
+        if forward_min + backward_min >= best:
+            steps.append({
+                'type': 'frontiers_met',
+                'message': f'Frontier minimums {forward_min} + {backward_min} >= best distance {best}; stopping',
+                'current_node': None,
+                'examining_edge': None
+            })
+            break
+
+        direction = 'forward' if forward_min <= backward_min else 'backward'
+        side, other = (forward, backward) if direction == 'forward' else (backward, forward)
+        current, current_distance = side['heap'].pop()
+        current_node = nodes[current]
+        side['visited'].add(current_node)
+
+        steps.append({
+            'type': 'visiting_node',
+            'message': f'{direction.capitalize()} search visits node {current_node} with distance {current_distance}',
+            'current_node': current_node,
+            'examining_edge': None,
+            'direction': direction,
+            'heap_operation': {'op': 'pop', 'node': current_node, 'priority': current_distance},
+            'visited_node': current_node
+        })
+
+        for neighbor, weight in side['edges'][current_node]:
+            edge = [current_node, neighbor, weight] if direction == 'forward' else [neighbor, current_node, weight]
+            new_distance = current_distance + weight
+            if neighbor not in side['visited'] and new_distance < side['distance'].get(neighbor, math.inf):
+                side['distance'][neighbor] = new_distance
+                side['previous'][neighbor] = current_node
+                operation = side['heap'].push_or_decrease(index[neighbor], new_distance)
+                steps.append({
+                    'type': 'distance_updated',
+                    'message': f'{direction.capitalize()} distance of {neighbor}: {new_distance} (via {current_node})',
+                    'current_node': current_node,
+                    'examining_edge': edge,
+                    'direction': direction,
+                    'distance_update': {'node': neighbor, 'distance': new_distance, 'previous': current_node},
+                    'heap_operation': {'op': operation, 'node': neighbor, 'priority': new_distance}
+                })
+
+            if neighbor in other['distance'] and new_distance + other['distance'][neighbor] < best:
+                best = new_distance + other['distance'][neighbor]
+                meeting = (current_node, neighbor) if direction == 'forward' else (neighbor, current_node)
+                steps.append({
+                    'type': 'meeting_updated',
+                    'message': f'Searches meet on edge {edge[0]} -> {edge[1]}: best distance {best}',
+                    'current_node': current_node,
+                    'examining_edge': edge,
+                    'direction': direction,
+                    'meeting': {'edge': edge, 'distance': best}
+                })
+
+    path = []
+    if meeting is not None:
+        path = _walk_back(forward['previous'], start_node, meeting[0])
+        node = meeting[1]
+        if node != path[-1]:
+            path.append(node)
+        while node != goal_node:
+            node = backward['previous'][node]
+            path.append(node)
+
+    steps.append({
+        'type': 'completed',
+        'message': f'Bidirectional Dijkstra completed - shortest path {" -> ".join(path)}' if path
+                   else f'Bidirectional Dijkstra completed - {goal_node} is unreachable',
+        'current_node': None,
+        'examining_edge': None
+    })
+
+    return {
+        'algorithm': 'bidirectional_dijkstra',
+        'graph': {node: [list(edge) for edge in edges] for node, edges in graph.items()},
+        'nodes': nodes,
+        'start_node': start_node,
+        'goal_node': goal_node,
+        'final_distances': {
+            'forward': {node: json_distance(d) for node, d in forward['distance'].items()},
+            'backward': {node: json_distance(d) for node, d in backward['distance'].items()}
+        },
+        'path': path,
+        'distance': json_distance(best),
+        'nodes_expanded': len(forward['visited']) + len(backward['visited']),
+        'total_steps': len(steps),
+        'steps': steps
+    }
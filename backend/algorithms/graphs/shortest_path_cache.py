@@ -0,0 +1,145 @@
+"""
+Shortest-Path Tree Cache for Repeated Dijkstra Queries
+Author: Aryan Pravin Sahu
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.graphs.dijkstra import dijkstra_simple, json_distance
+
+# All-sources precomputation is only offered for graphs up to this size
+MAX_PRECOMPUTE_NODES = 200
+MAX_PRECOMPUTE_WORKERS = 4
+
+
+def graph_fingerprint(graph):
+    """Stable content hash of a weighted graph {node: [(neighbor, weight), ...]}"""
+    canonical = json.dumps(
+        {str(node): [[str(neighbor), weight] for neighbor, weight in edges] for node, edges in graph.items()},
+        sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ShortestPathTree:
+    """Dijkstra result for one source; path queries walk the predecessor links"""
+
+    def __init__(self, source, distances, previous):
+        self.source = source
+        self.distances = distances
+        self.previous = previous
+
+    def distance_to(self, target):
+        return self.distances[target]
+
+    def path_to(self, target):
+        """Shortest path from the source to target in O(path length); [] if unreachable"""
+        if target != self.source and target not in self.previous:
+            return []
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.previous[path[-1]])
+        path.reverse()
+        return path
+
+    def query(self, target):
+        path = self.path_to(target)
+        return {
+            'source': self.source,
+            'target': target,
+            'distance': json_distance(self.distances[target]),
+            'path': path,
+            'reachable': bool(path)
+        }
+
+
+# Graph shared with precompute pool workers
+_worker_graph = None
+
+
+def _init_precompute_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _compute_tree(source):
+    distances, previous = dijkstra_simple(_worker_graph, source)
+    return source, distances, previous
+
+
+class ShortestPathCache:
+    """
+    LRU cache of shortest-path trees keyed by (graph fingerprint, source).
+    The first query from a source runs Dijkstra once; later queries to any
+    target on the same graph only walk the cached tree.
+    """
+
+    def __init__(self, max_trees=1024):
+        self.max_trees = max_trees
+        self._trees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_tree(self, graph, source, fingerprint=None):
+        key = (fingerprint or graph_fingerprint(graph), source)
+        tree = self._trees.get(key)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(key)
+            return tree
+
+        self.misses += 1
+        distances, previous = dijkstra_simple(graph, source)
+        tree = ShortestPathTree(source, distances, previous)
+        self._store(key, tree)
+        return tree
+
+    def query(self, graph, source, target, fingerprint=None):
+        """Distance and path from source to target, computing the source's tree at most once"""
+        return self.get_tree(graph, source, fingerprint).query(target)
+
+    def precompute_all_sources(self, graph, workers=1):
+        """
+        Eagerly compute the tree of every source of a small graph.
+        With workers > 1 the sources are spread over a spawned process pool
+        (workers=None uses every CPU). Returns the number of trees computed.
+        """
+        if len(graph) > MAX_PRECOMPUTE_NODES:
+            raise ValueError(f'All-sources precomputation is limited to {MAX_PRECOMPUTE_NODES} nodes')
+
+        fingerprint = graph_fingerprint(graph)
+        sources = [node for node in graph if (fingerprint, node) not in self._trees]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(sources) < 2:
+            for source in sources:
+                distances, previous = dijkstra_simple(graph, source)
+                self._store((fingerprint, source), ShortestPathTree(source, distances, previous))
+            return len(sources)
+
+        chunk_size = max(1, len(sources) // (workers * 4))
+        # spawn: never fork a multi-threaded server process
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_precompute_worker, initargs=(graph,)) as pool:
+            for source, distances, previous in pool.map(_compute_tree, sources, chunksize=chunk_size):
+                self._store((fingerprint, source), ShortestPathTree(source, distances, previous))
+        return len(sources)
+
+    def _store(self, key, tree):
+        self._trees[key] = tree
+        self._trees.move_to_end(key)
+        while len(self._trees) > self.max_trees:
+            self._trees.popitem(last=False)
+
+    def stats(self):
+        return {'trees': len(self._trees), 'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide cache used by the API
+shortest_path_cache = ShortestPathCache()
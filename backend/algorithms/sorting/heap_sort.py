@@ -1,14 +1,32 @@
 """
 Heap Sort Algorithm Implementation
 Author: Aryan Pravin Sahu
-A simple and clean implementation of heap sort with step-by-step visualization
+A simple and clean implementation of heap sort with step-by-step visualization.
+Sifting is done by the shared in-place heap routines in
+algorithms.data_structures.priority_queue, so the heap may be binary or d-ary.
 """
 
-def heap_sort_steps(arr):
+import operator
+
+from algorithms.data_structures.priority_queue import (
+    COMPARE, SWAP, check_arity, heapify as heapify_in_place, sift_down, sift_down_events
+)
+
+def heap_sort(arr, arity=2):
+    """Untraced heap sort: O(n) max-heap build, then n - 1 extractions; returns a new sorted list"""
+    check_arity(arity)
+    array = heapify_in_place(list(arr), arity, operator.gt)
+    for end in range(len(array) - 1, 0, -1):
+        array[0], array[end] = array[end], array[0]
+        sift_down(array, 0, end, arity, operator.gt)
+    return array
+
+def heap_sort_steps(arr, arity=2):
     """
     Generate step-by-step heap sort visualization data
     Returns a list of steps showing the sorting process
     """
+    check_arity(arity)
     steps = []
     n = len(arr)
     array = arr.copy()
@@ -24,9 +42,9 @@ def heap_sort_steps(arr):
         'heap_size': n
     })
     
-    # Build heap (rearrange array)
-    for i in range(n // 2 - 1, -1, -1):
-        heapify_steps = heapify(array, n, i)
+    # Build heap (rearrange array), sifting down from the last parent
+    for i in range((n - 2) // arity, -1, -1):
+        heapify_steps = heapify(array, n, i, arity)
         for step in heapify_steps:
             step['heap_size'] = n
             steps.append(step)
@@ -68,7 +86,7 @@ def heap_sort_steps(arr):
         })
         
         # Call heapify on the reduced heap
-        heapify_steps = heapify(array, i, 0)
+        heapify_steps = heapify(array, i, 0, arity)
         for step in heapify_steps:
             step['sorted'] = list(range(i, n))
             step['heap_size'] = i
@@ -86,73 +104,54 @@ def heap_sort_steps(arr):
     
     return steps
 
-def heapify(arr, n, i):
+def _child_label(arity, parent, child):
+    offset = child - (arity * parent + 1)
+    if arity == 2:
+        return 'left child' if offset == 0 else 'right child'
+    return f'child {offset + 1}'
+
+def heapify(arr, n, i, arity=2):
     """
-    Heapify a subtree rooted with node i
+    Sift the subtree rooted at node i down into max-heap order (iteratively)
     Returns steps for visualization
     """
     steps = []
-    largest = i  # Initialize largest as root
-    left = 2 * i + 1     # left child
-    right = 2 * i + 2    # right child
-    
-    # See if left child exists and is greater than root
-    if left < n:
-        steps.append({
-            'type': 'comparing',
-            'message': f'Comparing parent {arr[i]} with left child {arr[left]}',
-            'array': arr.copy(),
-            'comparing': [i, left],
-            'swapping': [],
-            'sorted': []
-        })
-        
-        if arr[left] > arr[largest]:
-            largest = left
-    
-    # See if right child exists and is greater than largest so far
-    if right < n:
-        steps.append({
-            'type': 'comparing',
-            'message': f'Comparing {arr[largest]} with right child {arr[right]}',
-            'array': arr.copy(),
-            'comparing': [largest, right],
-            'swapping': [],
-            'sorted': []
-        })
-        
-        if arr[right] > arr[largest]:
-            largest = right
-    
-    # Change root, if needed
-    if largest != i:
-        steps.append({
-            'type': 'swap_needed',
-            'message': f'Swapping {arr[i]} with {arr[largest]} to maintain heap property',
-            'array': arr.copy(),
-            'comparing': [],
-            'swapping': [i, largest],
-            'sorted': []
-        })
-        
-        # Swap
-        arr[i], arr[largest] = arr[largest], arr[i]
-        
-        steps.append({
-            'type': 'swapped',
-            'message': f'Swapped! Continuing to heapify subtree at position {largest}',
-            'array': arr.copy(),
-            'comparing': [],
-            'swapping': [],
-            'sorted': []
-        })
-        
-        # Recursively heapify the affected sub-tree
-        recursive_steps = heapify(arr, n, largest)
-        steps.extend(recursive_steps)
+    for event, a, b in sift_down_events(arr, i, n, arity, operator.gt):
+        if event == COMPARE:
+            parent = (b - 1) // arity
+            if b == arity * parent + 1:
+                message = f'Comparing parent {arr[a]} with {_child_label(arity, parent, b)} {arr[b]}'
+            else:
+                message = f'Comparing {arr[a]} with {_child_label(arity, parent, b)} {arr[b]}'
+            steps.append({
+                'type': 'comparing',
+                'message': message,
+                'array': arr.copy(),
+                'comparing': [a, b],
+                'swapping': [],
+                'sorted': []
+            })
+        elif event == SWAP:
+            steps.append({
+                'type': 'swap_needed',
+                'message': f'Swapping {arr[a]} with {arr[b]} to maintain heap property',
+                'array': arr.copy(),
+                'comparing': [],
+                'swapping': [a, b],
+                'sorted': []
+            })
+        else:
+            steps.append({
+                'type': 'swapped',
+                'message': f'Swapped! Continuing to heapify subtree at position {b}',
+                'array': arr.copy(),
+                'comparing': [],
+                'swapping': [],
+                'sorted': []
+            })
     
     return steps
 
 def get_sample_data():
     """Return sample data for heap sort demonstration"""
-    return [64, 34, 25, 12, 22, 11, 90]
\ No newline at end of file
+    return [64, 34, 25, 12, 22, 11, 90]
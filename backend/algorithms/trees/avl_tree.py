@@ -0,0 +1,193 @@
+"""
+AVL Tree with Rotation Traces
+Author: Aryan Pravin Sahu
+"""
+
+from algorithms.trees.balanced_tree import BalancedTree, expand_balanced_trace
+
+
+class AVLNode:
+    __slots__ = ('uid', 'val', 'left', 'right', 'height')
+
+    def __init__(self, uid, val):
+        self.uid = uid
+        self.val = val
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+class AVLTree(BalancedTree):
+    """
+    Height-balanced BST: the subtree heights of every node differ by at most one,
+    restored with single or double rotations while walking back up the search path
+    (kept on an explicit stack) after an insert/delete. Height is at most ~1.44 log2 n.
+    """
+
+    structure = 'avl'
+    display_name = 'AVL'
+    meta_key = 'height'
+
+    def _meta(self, node):
+        return node.height
+
+    def _update_height(self, node):
+        height = 1 + max(_height(node.left), _height(node.right))
+        if height != node.height:
+            node.height = height
+            self._touch(node)
+
+    def _rotate(self, node, direction):
+        """Rotate the subtree rooted at node; returns the new subtree root"""
+        if direction == 'left':
+            pivot = node.right
+            node.right, pivot.left = pivot.left, node
+        else:
+            pivot = node.left
+            node.left, pivot.right = pivot.right, node
+        self.rotations += 1
+        self._touch(node, pivot)
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _report_rotation(self, direction, node, pivot):
+        if self._trace is not None:
+            self._emit(f'rotate_{direction}', f'Rotate {direction} at {node.val}: {pivot.val} moves up',
+                       pivot.val, rotation={'direction': direction, 'node': node.val, 'pivot': pivot.val})
+
+    def _rebalance(self, node):
+        """Restore the AVL invariant at node; returns the (possibly new) subtree root"""
+        self._update_height(node)
+        balance = _height(node.left) - _height(node.right)
+        if -1 <= balance <= 1:
+            return node
+
+        if self._trace is not None:
+            self._emit('unbalanced', f'Node {node.val} has balance factor {balance}', node.val,
+                       balance_factor=balance)
+        if balance > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                child = node.left
+                node.left = self._rotate(child, 'left')
+                self._report_rotation('left', child, node.left)
+            direction = 'right'
+        else:
+            if _height(node.right.right) < _height(node.right.left):
+                child = node.right
+                node.right = self._rotate(child, 'right')
+                self._report_rotation('right', child, node.right)
+            direction = 'left'
+        return self._rotate(node, direction)
+
+    def _link(self, path, depth, child):
+        """Hang child where path[depth] was: under its parent on the path, or as the root"""
+        if depth == 0:
+            self.root = child
+        else:
+            parent, side = path[depth - 1]
+            setattr(parent, side, child)
+            self._touch(parent)
+
+    def _retrace(self, path, stop_after_rotation):
+        """
+        Walk back up the search path rebalancing each node. The walk stops as soon as a
+        subtree keeps its old height (its ancestors cannot change), and after the first
+        rotation when inserting (one single or double rotation always suffices).
+        """
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth][0]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                self._link(path, depth, subtree)
+                self._report_rotation('left' if node is subtree.left else 'right', node, subtree)
+                if stop_after_rotation or subtree.height == old_height:
+                    return
+            elif node.height == old_height:
+                return
+
+    def insert(self, value):
+        """Insert value; returns False for duplicates"""
+        if self._trace is not None:
+            self._emit('insert_start', f'Inserting {value}', inserting_value=value)
+        if self.root is None:
+            self.root = AVLNode(self._new_uid(), value)
+            self.size += 1
+            self._touch(self.root)
+            self._emit('insert', f'Inserted {value} as root', value)
+            return True
+
+        path = []
+        node = self.root
+        while node is not None:
+            self.comparisons += 1
+            if value == node.val:
+                self._emit('duplicate', f'Value {value} already exists', node.val)
+                return False
+            side = 'left' if value < node.val else 'right'
+            if self._trace is not None:
+                self._emit('compare', f'{value} {"<" if side == "left" else ">"} {node.val}, go {side}', node.val)
+            path.append((node, side))
+            node = node.left if side == 'left' else node.right
+
+        parent, side = path[-1]
+        child = AVLNode(self._new_uid(), value)
+        setattr(parent, side, child)
+        self.size += 1
+        self._touch(parent, child)
+        if self._trace is not None:
+            self._emit('insert', f'Inserted {value} as {side} child of {parent.val}', value)
+        self._retrace(path, stop_after_rotation=True)
+        return True
+
+    def delete(self, value):
+        """Delete value; returns False when it is not present"""
+        if self._trace is not None:
+            self._emit('delete_start', f'Deleting {value}', deleting_value=value)
+        path = []
+        node = self.root
+        while node is not None:
+            self.comparisons += 1
+            if value == node.val:
+                break
+            side = 'left' if value < node.val else 'right'
+            if self._trace is not None:
+                self._emit('compare', f'{value} {"<" if side == "left" else ">"} {node.val}, go {side}', node.val)
+            path.append((node, side))
+            node = node.left if side == 'left' else node.right
+        if node is None:
+            self._emit('not_found', f'Value {value} not found')
+            return False
+        self._emit('found', f'Found {value}', node.val)
+
+        if node.left is not None and node.right is not None:
+            # Two children: take the in-order successor's value, then unlink the successor
+            path.append((node, 'right'))
+            successor = node.right
+            while successor.left is not None:
+                path.append((successor, 'left'))
+                successor = successor.left
+            node.val = successor.val
+            self._touch(node)
+            if self._trace is not None:
+                self._emit('replace', f'Replace {value} with in-order successor {successor.val}', node.val)
+            node, value = successor, successor.val
+
+        replacement = node.left if node.left is not None else node.right
+        self._link(path + [(node, None)], len(path), replacement)
+        self.size -= 1
+        if self._trace is not None:
+            self._emit('removed', f'Removed {value}' + (f', {replacement.val} takes its place' if replacement else ''),
+                       replacement.val if replacement else None)
+        self._retrace(path, stop_after_rotation=False)
+        return True
+
+
+def expand_avl_trace(trace):
+    """Per-step nested snapshots ({'val', 'height', 'left', 'right'}) of a compact AVL trace"""
+    return expand_balanced_trace(trace, 'height')
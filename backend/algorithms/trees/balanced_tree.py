@@ -0,0 +1,204 @@
+"""
+Shared Machinery for Self-Balancing Search Trees (AVL, Red-Black)
+Author: Aryan Pravin Sahu
+
+Traces follow the compact format of BinarySearchTree.insert_trace: the tree is
+sent once as node records in the header, and a step that changes the tree
+carries only the records of the nodes it touched ('node_updates') plus the new
+root id. A record is [id, val, left_id, right_id, meta], where meta is the
+height (AVL) or the colour (red-black).
+"""
+
+
+class BalancedTree:
+    """Base class: search, iterative traversal/serialisation and trace bookkeeping"""
+
+    structure = None
+    display_name = None
+    meta_key = None
+
+    def __init__(self):
+        # Empty-subtree marker: None, or a shared sentinel node in subclasses that need one
+        self.nil = None
+        self.root = None
+        self.size = 0
+        self.comparisons = 0
+        self.rotations = 0
+        self._next_uid = 0
+        self._trace = None
+        self._dirty = {}
+
+    # Hook implemented by subclasses
+    def _meta(self, node):
+        raise NotImplementedError
+
+    def _new_uid(self):
+        uid = self._next_uid
+        self._next_uid += 1
+        return uid
+
+    # Trace recording
+    def _touch(self, *nodes):
+        """Mark nodes whose value, children or meta changed since the last emitted step"""
+        if self._trace is not None:
+            for node in nodes:
+                if node is not self.nil:
+                    self._dirty[node.uid] = node
+
+    def _record(self, node):
+        left = node.left.uid if node.left is not self.nil else None
+        right = node.right.uid if node.right is not self.nil else None
+        return [node.uid, node.val, left, right, self._meta(node)]
+
+    def _emit(self, operation, description, current=None, **fields):
+        if self._trace is None:
+            return
+        step = {
+            'step': len(self._trace),
+            'operation': operation,
+            'current_node': current,
+            'description': description
+        }
+        step.update(fields)
+        if self._dirty:
+            step['node_updates'] = [self._record(node) for node in self._dirty.values()]
+            step['root'] = self.root.uid if self.root is not self.nil else None
+            self._dirty = {}
+        self._trace.append(step)
+
+    def _run_traced(self, operation, values, method):
+        """Run method(value) for each value while recording steps; returns the trace"""
+        initial_nodes = [self._record(node) for node in self._nodes()]
+        initial_root = self.root.uid if self.root is not self.nil else None
+        comparisons, rotations = self.comparisons, self.rotations
+        self._trace, self._dirty = [], {}
+        try:
+            self._emit('initial', f'{self.display_name} tree with {self.size} node(s)')
+            for value in values:
+                method(value)
+            self._emit('completed', f'{operation.capitalize()} complete: {self.size} node(s), height {self.height()}')
+            steps = self._trace
+        finally:
+            self._trace, self._dirty = None, {}
+
+        return {
+            'structure': self.structure,
+            'operation': operation,
+            'values': list(values),
+            'initial_root': initial_root,
+            'nodes': initial_nodes,
+            'comparisons': self.comparisons - comparisons,
+            'rotations': self.rotations - rotations,
+            'total_steps': len(steps),
+            'steps': steps
+        }
+
+    def insert_trace(self, values):
+        return self._run_traced('insert', values, self.insert)
+
+    def delete_trace(self, values):
+        return self._run_traced('delete', values, self.delete)
+
+    def search_trace(self, target):
+        return self._run_traced('search', [target], self.search)
+
+    # Queries
+    def search(self, value):
+        """True if value is in the tree; every comparison is counted (and traced)"""
+        node, nil = self.root, self.nil
+        if self._trace is None:
+            while node is not nil:
+                self.comparisons += 1
+                if value == node.val:
+                    return True
+                node = node.left if value < node.val else node.right
+            return False
+
+        while node is not nil:
+            self.comparisons += 1
+            self._emit('compare', f'Comparing {value} with {node.val}', node.val)
+            if value == node.val:
+                self._emit('found', f'Value {value} found!', node.val)
+                return True
+            node = node.left if value < node.val else node.right
+        self._emit('not_found', f'Value {value} not found')
+        return False
+
+    def _nodes(self):
+        """All nodes in pre-order, iteratively"""
+        stack = [self.root] if self.root is not self.nil else []
+        while stack:
+            node = stack.pop()
+            yield node
+            for child in (node.right, node.left):
+                if child is not self.nil:
+                    stack.append(child)
+
+    def inorder(self):
+        """Sorted values, iteratively"""
+        result, stack, node = [], [], self.root
+        while stack or node is not self.nil:
+            while node is not self.nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append(node.val)
+            node = node.right
+        return result
+
+    def height(self):
+        """Number of nodes on the longest root-to-leaf path (0 for an empty tree)"""
+        best = 0
+        stack = [(self.root, 1)] if self.root is not self.nil else []
+        while stack:
+            node, depth = stack.pop()
+            best = max(best, depth)
+            for child in (node.left, node.right):
+                if child is not self.nil:
+                    stack.append((child, depth + 1))
+        return best
+
+    def serialize_tree(self):
+        """Nested {'val', 'left', 'right', meta} dict, built iteratively"""
+        return expand_balanced_tree({node.uid: self._record(node) for node in self._nodes()},
+                                    self.root.uid if self.root is not self.nil else None,
+                                    self.meta_key)
+
+
+def expand_balanced_tree(records, root_id, meta_key):
+    """Nested dict tree from {id: [id, val, left_id, right_id, meta]} records (iterative)"""
+    if root_id is None:
+        return None
+    built = {}
+    stack = [root_id]
+    while stack:
+        uid = stack[-1]
+        _, val, left, right, meta = records[uid]
+        missing = [child for child in (left, right) if child is not None and child not in built]
+        if missing:
+            stack.extend(missing)
+            continue
+        stack.pop()
+        built[uid] = {
+            'val': val,
+            meta_key: meta,
+            'left': built.pop(left) if left is not None else None,
+            'right': built.pop(right) if right is not None else None
+        }
+    return built[root_id]
+
+
+def expand_balanced_trace(trace, meta_key):
+    """Replay a compact AVL/red-black trace into per-step nested tree snapshots"""
+    records = {record[0]: record for record in trace['nodes']}
+    root_id = trace['initial_root']
+    snapshots = []
+    for step in trace['steps']:
+        if 'node_updates' in step:
+            for record in step['node_updates']:
+                records[record[0]] = record
+            root_id = step['root']
+        snapshot = {key: value for key, value in step.items() if key not in ('node_updates', 'root')}
+        snapshot['tree'] = expand_balanced_tree(records, root_id, meta_key)
+        snapshots.append(snapshot)
+    return snapshots
@@ -3,349 +3,458 @@ Binary Search Tree Implementation with Tree Visualization
 Author: Aryan Pravin Sahu
 """
 
-class TreeNode:
-    def __init__(self, val=0):
-        self.val = val
-        self.left = None
-        self.right = None
+from array import array
+
+from algorithms.trees.node_store import NodeStore, NIL
+from algorithms.trees.persistent_tree import PersistentTree, SnapshotExpander
+from algorithms.trees.tree_traversal import VISIT, walk, traversal_trace, expand_traversal_steps
 
 class BinarySearchTree:
+    """
+    Unbalanced BST over struct-of-arrays node storage: nodes are slot indices into
+    self.nodes (see NodeStore) and self.root is NIL for an empty tree.
+    """
+    
     def __init__(self):
-        self.root = None
+        self.nodes = NodeStore()
+        self.root = NIL
+        self.comparisons = 0
+    
+    def __len__(self):
+        return len(self.nodes)
+    
+    @classmethod
+    def from_values(cls, values, max_comparisons=None):
+        """
+        Untraced bulk insert in the given order: same shape as insert_steps(values), no steps.
+        Raises ValueError once the build exceeds max_comparisons (sorted input costs O(n^2)).
+        """
+        tree = cls()
+        for value in values:
+            tree.insert(value)
+            if max_comparisons is not None and tree.comparisons > max_comparisons:
+                raise ValueError(f'Insertion build exceeded {max_comparisons} comparisons '
+                                 '(the values are too close to sorted order)')
+        return tree
+    
+    @classmethod
+    def from_sorted(cls, values):
+        """
+        Perfectly balanced tree over the distinct values. Slots are laid out in sorted
+        order and linked by range midpoints, so the build is O(n) after the sort.
+        """
+        tree = cls()
+        ordered = sorted(set(values))
+        size = len(ordered)
+        if not size:
+            return tree
+        nodes = tree.nodes
+        nodes.vals = ordered
+        nodes.left = array('i', [NIL]) * size
+        nodes.right = array('i', [NIL]) * size
+        tree.root = (size - 1) // 2
+        # (lo, hi, parent): the slots of a subtree are the contiguous range lo..hi
+        stack = [(0, tree.root - 1, tree.root, nodes.left), (tree.root + 1, size - 1, tree.root, nodes.right)]
+        while stack:
+            lo, hi, parent, links = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            links[parent] = mid
+            stack.append((lo, mid - 1, mid, nodes.left))
+            stack.append((mid + 1, hi, mid, nodes.right))
+        return tree
+    
+    def copy(self):
+        """Independent tree (the columns are copied, values are shared)"""
+        tree = BinarySearchTree()
+        tree.nodes.vals = list(self.nodes.vals)
+        tree.nodes.left = array('i', self.nodes.left)
+        tree.nodes.right = array('i', self.nodes.right)
+        tree.nodes.free = array('i', self.nodes.free)
+        tree.root = self.root
+        return tree
+    
+    def insert(self, value):
+        """Untraced iterative insert; returns False for duplicates"""
+        nodes = self.nodes
+        if self.root == NIL:
+            self.root = nodes.alloc(value)
+            return True
+        vals, left, right = nodes.vals, nodes.left, nodes.right
+        current = self.root
+        comparisons = 0
+        while True:
+            comparisons += 1
+            current_val = vals[current]
+            if value == current_val:
+                self.comparisons += comparisons
+                return False
+            links = left if value < current_val else right
+            child = links[current]
+            if child == NIL:
+                links[current] = nodes.alloc(value)
+                self.comparisons += comparisons
+                return True
+            current = child
+    
+    def search(self, value):
+        """Untraced iterative search"""
+        vals, left, right = self.nodes.vals, self.nodes.left, self.nodes.right
+        current = self.root
+        comparisons = 0
+        while current != NIL:
+            comparisons += 1
+            current_val = vals[current]
+            if value == current_val:
+                break
+            current = left[current] if value < current_val else right[current]
+        self.comparisons += comparisons
+        return current != NIL
+    
+    def delete(self, value):
+        """
+        Untraced iterative delete; returns False when value is absent. A node with two
+        children takes its in-order successor's value and the successor's slot is freed.
+        """
+        vals, left, right = self.nodes.vals, self.nodes.left, self.nodes.right
+        parent, links, current = NIL, None, self.root
+        while current != NIL:
+            self.comparisons += 1
+            if value == vals[current]:
+                break
+            parent = current
+            links = left if value < vals[current] else right
+            current = links[current]
+        if current == NIL:
+            return False
+        
+        if left[current] != NIL and right[current] != NIL:
+            target = current
+            parent, links, current = current, right, right[current]
+            while left[current] != NIL:
+                parent, links, current = current, left, left[current]
+            vals[target] = vals[current]
+        
+        child = left[current] if left[current] != NIL else right[current]
+        if parent == NIL:
+            self.root = child
+        else:
+            links[parent] = child
+        self.nodes.release(current)
+        return True
+    
+    def traverse(self, order='inorder', method='stack'):
+        """
+        Yield values in 'inorder', 'preorder', 'postorder' or 'level' order without
+        recursion (see tree_traversal.walk; method='morris' uses O(1) extra memory).
+        """
+        vals = self.nodes.vals
+        for event, slot, _ in walk(self.nodes, self.root, order, method):
+            if event == VISIT:
+                yield vals[slot]
+    
+    def height(self):
+        """Number of nodes on the longest root-to-leaf path, computed iteratively"""
+        left, right = self.nodes.left, self.nodes.right
+        best = 0
+        stack = [(self.root, 1)] if self.root != NIL else []
+        while stack:
+            node, depth = stack.pop()
+            if depth > best:
+                best = depth
+            if left[node] != NIL:
+                stack.append((left[node], depth + 1))
+            if right[node] != NIL:
+                stack.append((right[node], depth + 1))
+        return best
     
     def insert_steps(self, values):
-        """Generate step-by-step BST insertion"""
+        """Generate step-by-step BST insertion (full tree snapshot per step)"""
+        return expand_tree_trace(self.insert_trace(values))
+    
+    def search_steps(self, target):
+        """Generate step-by-step BST search (full tree snapshot per step)"""
+        return expand_tree_trace(self.search_trace(target))
+    
+    def insert_trace(self, values):
+        """
+        Generate a compact BST insertion trace. Tree versions are persistent: a step
+        that changes the tree carries the new root id plus only the path-copied node
+        records ('new_nodes'); 'path' holds the single value appended to the path.
+        """
+        snapshots = PersistentTree.from_store(self.nodes, self.root)
+        initial_nodes = snapshots.take_new_records()
+        initial_tree = snapshots.root_id
         steps = []
         
         # Initial empty tree
         steps.append({
             'step': 0,
-            'tree': self.serialize_tree(),
             'operation': 'initial',
             'current_node': None,
             'inserting_value': None,
-            'path': [],
             'comparing': [],
             'description': 'Empty Binary Search Tree - ready for insertions'
         })
         
-        step_count = 1
-        
         for value in values:
-            insertion_steps = self._insert_value_steps(value, step_count)
-            steps.extend(insertion_steps)
-            step_count += len(insertion_steps)
+            self._insert_value_trace(value, snapshots, steps)
         
-        return steps
+        return {
+            'structure': 'bst',
+            'operation': 'insert',
+            'initial_tree': initial_tree,
+            'nodes': initial_nodes,
+            'total_steps': len(steps),
+            'steps': steps
+        }
     
-    def _insert_value_steps(self, value, start_step):
-        """Generate steps for inserting a single value"""
-        steps = []
-        step_count = start_step
-        
-        # Show value being inserted
+    def _insert_value_trace(self, value, snapshots, steps):
+        """Append the trace steps for inserting a single value"""
+        # Show value being inserted (the path starts over)
         steps.append({
-            'step': step_count,
-            'tree': self.serialize_tree(),
+            'step': len(steps),
             'operation': 'insert_start',
             'current_node': None,
             'inserting_value': value,
-            'path': [],
             'comparing': [],
             'description': f'Inserting value {value} into BST'
         })
-        step_count += 1
         
-        if self.root is None:
+        nodes = self.nodes
+        if self.root == NIL:
             # First node becomes root
-            self.root = TreeNode(value)
+            self.root = nodes.alloc(value)
+            snapshots.insert(value)
             steps.append({
-                'step': step_count,
-                'tree': self.serialize_tree(),
+                'step': len(steps),
                 'operation': 'insert_root',
                 'current_node': value,
                 'inserting_value': value,
-                'path': [value],
                 'comparing': [],
+                'path': value,
+                'tree': snapshots.root_id,
+                'new_nodes': snapshots.take_new_records(),
                 'description': f'Tree is empty. {value} becomes the root node'
             })
-            return steps
+            return
         
         # Traverse to find insertion point
         current = self.root
-        path = []
         
         while True:
-            path.append(current.val)
-            
+            current_val = nodes.vals[current]
             # Show comparison
             steps.append({
-                'step': step_count,
-                'tree': self.serialize_tree(),
+                'step': len(steps),
                 'operation': 'compare',
-                'current_node': current.val,
+                'current_node': current_val,
                 'inserting_value': value,
-                'path': path.copy(),
-                'comparing': [current.val],
-                'description': f'Comparing {value} with {current.val}'
+                'comparing': [current_val],
+                'path': current_val,
+                'description': f'Comparing {value} with {current_val}'
             })
-            step_count += 1
             
-            if value < current.val:
-                # Go left
-                steps.append({
-                    'step': step_count,
-                    'tree': self.serialize_tree(),
-                    'operation': 'go_left',
-                    'current_node': current.val,
-                    'inserting_value': value,
-                    'path': path.copy(),
-                    'comparing': [],
-                    'description': f'{value} < {current.val}, go to left subtree'
-                })
-                step_count += 1
-                
-                if current.left is None:
-                    # Insert here
-                    current.left = TreeNode(value)
-                    path.append(value)
-                    steps.append({
-                        'step': step_count,
-                        'tree': self.serialize_tree(),
-                        'operation': 'insert_complete',
-                        'current_node': value,
-                        'inserting_value': value,
-                        'path': path.copy(),
-                        'comparing': [],
-                        'description': f'Inserted {value} as left child of {current.val}'
-                    })
-                    break
-                else:
-                    current = current.left
-                    
-            elif value > current.val:
-                # Go right
-                steps.append({
-                    'step': step_count,
-                    'tree': self.serialize_tree(),
-                    'operation': 'go_right',
-                    'current_node': current.val,
-                    'inserting_value': value,
-                    'path': path.copy(),
-                    'comparing': [],
-                    'description': f'{value} > {current.val}, go to right subtree'
-                })
-                step_count += 1
-                
-                if current.right is None:
-                    # Insert here
-                    current.right = TreeNode(value)
-                    path.append(value)
-                    steps.append({
-                        'step': step_count,
-                        'tree': self.serialize_tree(),
-                        'operation': 'insert_complete',
-                        'current_node': value,
-                        'inserting_value': value,
-                        'path': path.copy(),
-                        'comparing': [],
-                        'description': f'Inserted {value} as right child of {current.val}'
-                    })
-                    break
-                else:
-                    current = current.right
-            else:
+            if value == current_val:
                 # Duplicate value
                 steps.append({
-                    'step': step_count,
-                    'tree': self.serialize_tree(),
+                    'step': len(steps),
                     'operation': 'duplicate',
-                    'current_node': current.val,
+                    'current_node': current_val,
                     'inserting_value': value,
-                    'path': path.copy(),
-                    'comparing': [current.val],
+                    'comparing': [current_val],
                     'description': f'Value {value} already exists in BST. Skipping insertion.'
                 })
-                break
-        
-        return steps
+                return
+            
+            side = 'left' if value < current_val else 'right'
+            steps.append({
+                'step': len(steps),
+                'operation': f'go_{side}',
+                'current_node': current_val,
+                'inserting_value': value,
+                'comparing': [],
+                'description': f'{value} {"<" if side == "left" else ">"} {current_val}, go to {side} subtree'
+            })
+            
+            links = nodes.left if side == 'left' else nodes.right
+            if links[current] != NIL:
+                current = links[current]
+                continue
+            
+            # Insert here
+            links[current] = nodes.alloc(value)
+            snapshots.insert(value)
+            steps.append({
+                'step': len(steps),
+                'operation': 'insert_complete',
+                'current_node': value,
+                'inserting_value': value,
+                'comparing': [],
+                'path': value,
+                'tree': snapshots.root_id,
+                'new_nodes': snapshots.take_new_records(),
+                'description': f'Inserted {value} as {side} child of {current_val}'
+            })
+            return
     
-    def search_steps(self, target):
-        """Generate step-by-step BST search"""
+    def search_trace(self, target):
+        """Generate a compact BST search trace (the tree is sent once in the header)"""
+        snapshots = PersistentTree.from_store(self.nodes, self.root)
         steps = []
         
         # Initial state
         steps.append({
             'step': 0,
-            'tree': self.serialize_tree(),
             'operation': 'search_start',
             'current_node': None,
             'target': target,
-            'path': [],
             'comparing': [],
             'found': False,
             'description': f'Searching for {target} in BST'
         })
         
-        if self.root is None:
+        vals, left, right = self.nodes.vals, self.nodes.left, self.nodes.right
+        current = self.root
+        if current == NIL:
             steps.append({
                 'step': 1,
-                'tree': self.serialize_tree(),
                 'operation': 'not_found',
                 'current_node': None,
                 'target': target,
-                'path': [],
                 'comparing': [],
                 'found': False,
                 'description': f'Tree is empty. {target} not found.'
             })
-            return steps
         
-        step_count = 1
-        current = self.root
-        path = []
-        
-        while current is not None:
-            path.append(current.val)
-            
+        while current != NIL:
+            current_val = vals[current]
             # Show comparison
             steps.append({
-                'step': step_count,
-                'tree': self.serialize_tree(),
+                'step': len(steps),
                 'operation': 'compare',
-                'current_node': current.val,
+                'current_node': current_val,
                 'target': target,
-                'path': path.copy(),
-                'comparing': [current.val],
+                'comparing': [current_val],
                 'found': False,
-                'description': f'Comparing target {target} with {current.val}'
+                'path': current_val,
+                'description': f'Comparing target {target} with {current_val}'
             })
-            step_count += 1
             
-            if target == current.val:
+            if target == current_val:
                 # Found
                 steps.append({
-                    'step': step_count,
-                    'tree': self.serialize_tree(),
+                    'step': len(steps),
                     'operation': 'found',
-                    'current_node': current.val,
+                    'current_node': current_val,
                     'target': target,
-                    'path': path.copy(),
-                    'comparing': [current.val],
+                    'comparing': [current_val],
                     'found': True,
                     'description': f'Target {target} found!'
                 })
                 break
-            elif target < current.val:
-                # Go left
-                steps.append({
-                    'step': step_count,
-                    'tree': self.serialize_tree(),
-                    'operation': 'go_left',
-                    'current_node': current.val,
-                    'target': target,
-                    'path': path.copy(),
-                    'comparing': [],
-                    'found': False,
-                    'description': f'{target} < {current.val}, search left subtree'
-                })
-                step_count += 1
-                current = current.left
-            else:
-                # Go right
-                steps.append({
-                    'step': step_count,
-                    'tree': self.serialize_tree(),
-                    'operation': 'go_right',
-                    'current_node': current.val,
-                    'target': target,
-                    'path': path.copy(),
-                    'comparing': [],
-                    'found': False,
-                    'description': f'{target} > {current.val}, search right subtree'
-                })
-                step_count += 1
-                current = current.right
-        
-        # Not found
-        if current is None:
+            
+            side = 'left' if target < current_val else 'right'
             steps.append({
-                'step': step_count,
-                'tree': self.serialize_tree(),
-                'operation': 'not_found',
-                'current_node': None,
+                'step': len(steps),
+                'operation': f'go_{side}',
+                'current_node': current_val,
                 'target': target,
-                'path': path.copy(),
                 'comparing': [],
                 'found': False,
-                'description': f'Target {target} not found in BST'
+                'description': f'{target} {"<" if side == "left" else ">"} {current_val}, search {side} subtree'
             })
+            current = left[current] if side == 'left' else right[current]
+            
+            # Not found
+            if current == NIL:
+                steps.append({
+                    'step': len(steps),
+                    'operation': 'not_found',
+                    'current_node': None,
+                    'target': target,
+                    'comparing': [],
+                    'found': False,
+                    'description': f'Target {target} not found in BST'
+                })
         
-        return steps
+        return {
+            'structure': 'bst',
+            'operation': 'search',
+            'initial_tree': snapshots.root_id,
+            'nodes': snapshots.take_new_records(),
+            'total_steps': len(steps),
+            'steps': steps
+        }
     
-    def traversal_steps(self, traversal_type='inorder'):
-        """Generate step-by-step tree traversal"""
-        steps = []
-        visited = []
-        
-        steps.append({
-            'step': 0,
-            'tree': self.serialize_tree(),
-            'operation': f'{traversal_type}_start',
-            'current_node': None,
-            'visited': [],
-            'stack': [],
-            'result': [],
-            'description': f'Starting {traversal_type} traversal'
-        })
-        
-        if traversal_type == 'inorder':
-            self._inorder_steps(self.root, steps, visited, [])
-        elif traversal_type == 'preorder':
-            self._preorder_steps(self.root, steps, visited, [])
-        elif traversal_type == 'postorder':
-            self._postorder_steps(self.root, steps, visited, [])
-        
-        return steps
+    def traversal_steps(self, traversal_type='inorder', method='stack'):
+        """Generate step-by-step tree traversal (full tree and visited list per step)"""
+        return expand_traversal_steps(self.traversal_trace(traversal_type, method), self.serialize_tree())
     
-    def _inorder_steps(self, node, steps, visited, result):
-        """Inorder traversal with steps"""
-        if node is not None:
-            # Visit left
-            self._inorder_steps(node.left, steps, visited, result)
-            
-            # Visit root
-            visited.append(node.val)
-            result.append(node.val)
-            steps.append({
-                'step': len(steps),
-                'tree': self.serialize_tree(),
-                'operation': 'visit',
-                'current_node': node.val,
-                'visited': visited.copy(),
-                'stack': [],
-                'result': result.copy(),
-                'description': f'Visit node {node.val} (Inorder: Left → Root → Right)'
-            })
-            
-            # Visit right
-            self._inorder_steps(node.right, steps, visited, result)
+    def traversal_trace(self, order='inorder', method='stack'):
+        """Compact traversal trace: the tree once, then only the newly visited node per step"""
+        return traversal_trace(self, order, method)
     
     def serialize_tree(self):
-        """Convert tree to serializable format for frontend"""
-        if self.root is None:
+        """Convert tree to serializable format for frontend (iterative post-order over slots)"""
+        if self.root == NIL:
             return None
         
-        def serialize_node(node):
-            if node is None:
-                return None
-            return {
-                'val': node.val,
-                'left': serialize_node(node.left),
-                'right': serialize_node(node.right)
-            }
+        vals, left, right = self.nodes.vals, self.nodes.left, self.nodes.right
+        built = {}
+        stack = [(self.root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                built[node] = {
+                    'val': vals[node],
+                    'left': built.pop(left[node]) if left[node] != NIL else None,
+                    'right': built.pop(right[node]) if right[node] != NIL else None
+                }
+                continue
+            stack.append((node, True))
+            for child in (right[node], left[node]):
+                if child != NIL:
+                    stack.append((child, False))
+        return built[self.root]
+
+def expand_tree_trace(trace):
+    """
+    Replay a compact insert/search trace into full per-step snapshots
+    (nested tree and path on every step). Unchanged subtrees are shared dict objects.
+    """
+    expander = SnapshotExpander()
+    expander.add_records(trace['nodes'])
+    tree_id = trace['initial_tree']
+    value_key = 'inserting_value' if trace['operation'] == 'insert' else 'target'
+    path = []
+    
+    snapshots = []
+    for step in trace['steps']:
+        if step['operation'] == 'insert_start':
+            path = []
+        if 'path' in step:
+            path.append(step['path'])
+        if 'tree' in step:
+            expander.add_records(step['new_nodes'])
+            tree_id = step['tree']
         
-        return serialize_node(self.root)
+        snapshot = {
+            'step': step['step'],
+            'tree': expander.tree(tree_id),
+            'operation': step['operation'],
+            'current_node': step['current_node'],
+            value_key: step[value_key],
+            'path': path.copy(),
+            'comparing': step['comparing']
+        }
+        if 'found' in step:
+            snapshot['found'] = step['found']
+        snapshot['description'] = step['description']
+        snapshots.append(snapshot)
+    
+    return snapshots
 
 def get_sample_data():
     """Return sample values for BST demonstration"""
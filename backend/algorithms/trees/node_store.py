@@ -0,0 +1,55 @@
+"""
+Struct-of-Arrays Storage for Binary Tree Nodes
+Author: Aryan Pravin Sahu
+
+A node is an integer slot index instead of an object: its value lives in a
+plain list and its children in two array('i') columns, with NIL (-1) for a
+missing child. Deleted slots go on a free list and are reused by the next
+allocation. A million-node tree costs 8 bytes of links plus one list pointer
+per node (values themselves aside), against roughly 50-150 bytes per node
+object.
+"""
+
+import sys
+from array import array
+
+NIL = -1
+
+
+class NodeStore:
+    """Parallel value/left/right columns indexed by node slot"""
+
+    def __init__(self):
+        self.vals = []
+        self.left = array('i')
+        self.right = array('i')
+        self.free = array('i')
+
+    def alloc(self, val):
+        """Slot index for a new childless node holding val"""
+        if self.free:
+            index = self.free.pop()
+            self.vals[index] = val
+            self.left[index] = NIL
+            self.right[index] = NIL
+            return index
+        self.vals.append(val)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        return len(self.vals) - 1
+
+    def release(self, index):
+        """Return a slot to the free list (its value reference is dropped)"""
+        self.vals[index] = None
+        self.left[index] = NIL
+        self.right[index] = NIL
+        self.free.append(index)
+
+    def __len__(self):
+        """Number of live nodes"""
+        return len(self.vals) - len(self.free)
+
+    def memory_bytes(self):
+        """Bytes held by the columns and free list (excluding the value objects)"""
+        return (sys.getsizeof(self.vals) + sys.getsizeof(self.left) +
+                sys.getsizeof(self.right) + sys.getsizeof(self.free))
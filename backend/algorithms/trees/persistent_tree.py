@@ -0,0 +1,143 @@
+"""
+Persistent (Path-Copying) Tree Snapshots for BST Traces
+Author: Aryan Pravin Sahu
+
+A trace step refers to a tree version by the id of its root node. An insert
+copies only the nodes on the root-to-leaf path; every other subtree is shared
+with the previous version. Each node is therefore serialised once, as an
+[id, val, left_id, right_id] record, and a trace of n balanced inserts holds
+O(n log n) records instead of n full nested trees.
+"""
+
+from algorithms.trees.node_store import NIL
+
+
+class PersistentNode:
+    """Immutable tree node; children are other PersistentNodes or None"""
+    __slots__ = ('uid', 'val', 'left', 'right')
+
+    def __init__(self, uid, val, left=None, right=None):
+        self.uid = uid
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+class PersistentTree:
+    """
+    Versioned binary search tree. Old roots stay valid forever; new versions
+    are created by path copying, and nodes created since the last call to
+    take_new_records() are reported as delta records.
+    """
+
+    def __init__(self):
+        self.root = None
+        self._next_uid = 0
+        self._pending = []
+
+    def _node(self, val, left=None, right=None):
+        node = PersistentNode(self._next_uid, val, left, right)
+        self._next_uid += 1
+        self._pending.append(node)
+        return node
+
+    @classmethod
+    def from_store(cls, store, root):
+        """Copy the tree rooted at slot root of a NodeStore into a persistent version"""
+        tree = cls()
+        if root == NIL:
+            return tree
+        vals, left, right = store.vals, store.left, store.right
+        # Iterative post-order so degenerate trees do not hit the recursion limit
+        built = {}
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                built[node] = tree._node(
+                    vals[node],
+                    built.pop(left[node]) if left[node] != NIL else None,
+                    built.pop(right[node]) if right[node] != NIL else None
+                )
+                continue
+            stack.append((node, True))
+            for child in (right[node], left[node]):
+                if child != NIL:
+                    stack.append((child, False))
+        tree.root = built[root]
+        return tree
+
+    def insert(self, value):
+        """
+        Insert value as a new version; returns False (and keeps the version) for duplicates.
+        Only the nodes on the search path are copied.
+        """
+        path = []
+        node = self.root
+        while node is not None:
+            if value == node.val:
+                return False
+            path.append(node)
+            node = node.left if value < node.val else node.right
+
+        child = self._node(value)
+        for parent in reversed(path):
+            if value < parent.val:
+                child = self._node(parent.val, child, parent.right)
+            else:
+                child = self._node(parent.val, parent.left, child)
+        self.root = child
+        return True
+
+    @property
+    def root_id(self):
+        return self.root.uid if self.root is not None else None
+
+    def take_new_records(self):
+        """[id, val, left_id, right_id] records of nodes created since the previous call"""
+        records = [
+            [node.uid, node.val,
+             node.left.uid if node.left is not None else None,
+             node.right.uid if node.right is not None else None]
+            for node in self._pending
+        ]
+        self._pending = []
+        return records
+
+
+class SnapshotExpander:
+    """
+    Rebuilds nested {'val', 'left', 'right'} dicts from node records.
+    Each node id is materialised once and the same dict object is reused by
+    every version that shares the subtree.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self._built = {}
+
+    def add_records(self, records):
+        for uid, val, left, right in records:
+            self.records[uid] = (val, left, right)
+
+    def tree(self, root_id):
+        if root_id is None:
+            return None
+        stack = [root_id]
+        while stack:
+            uid = stack[-1]
+            if uid in self._built:
+                stack.pop()
+                continue
+            val, left, right = self.records[uid]
+            missing = [child for child in (left, right) if child is not None and child not in self._built]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            self._built[uid] = {
+                'val': val,
+                'left': self._built[left] if left is not None else None,
+                'right': self._built[right] if right is not None else None
+            }
+        return self._built[root_id]
@@ -0,0 +1,258 @@
+"""
+Red-Black Tree with Recolouring and Rotation Traces
+Author: Aryan Pravin Sahu
+"""
+
+from algorithms.trees.balanced_tree import BalancedTree, expand_balanced_trace
+
+RED = 'red'
+BLACK = 'black'
+
+
+class RBNode:
+    __slots__ = ('uid', 'val', 'left', 'right', 'parent', 'color')
+
+    def __init__(self, uid, val, nil, color=RED):
+        self.uid = uid
+        self.val = val
+        self.left = nil
+        self.right = nil
+        self.parent = nil
+        self.color = color
+
+
+class RedBlackTree(BalancedTree):
+    """
+    Red-black tree with parent pointers and a shared black NIL sentinel
+    (the classic CLRS formulation). Insert and delete fix-ups are iterative.
+    """
+
+    structure = 'red_black'
+    display_name = 'Red-black'
+    meta_key = 'color'
+
+    def __init__(self):
+        super().__init__()
+        self.nil = RBNode(None, None, None, BLACK)
+        self.nil.left = self.nil.right = self.nil.parent = self.nil
+        self.root = self.nil
+
+    def _meta(self, node):
+        return node.color
+
+    def _recolor(self, node, color):
+        if node is not self.nil and node.color != color:
+            node.color = color
+            self._touch(node)
+
+    def _rotate(self, node, direction):
+        """Rotate at node, keeping parent pointers consistent"""
+        if direction == 'left':
+            pivot = node.right
+            node.right = pivot.left
+            if pivot.left is not self.nil:
+                pivot.left.parent = node
+        else:
+            pivot = node.left
+            node.left = pivot.right
+            if pivot.right is not self.nil:
+                pivot.right.parent = node
+        self._replace(node, pivot)
+        if direction == 'left':
+            pivot.left = node
+        else:
+            pivot.right = node
+        node.parent = pivot
+        self.rotations += 1
+        self._touch(node, pivot)
+        self._emit(f'rotate_{direction}', f'Rotate {direction} at {node.val}: {pivot.val} moves up',
+                   pivot.val, rotation={'direction': direction, 'node': node.val, 'pivot': pivot.val})
+
+    def _replace(self, old, new):
+        """Hang new where old was (CLRS transplant)"""
+        parent = old.parent
+        if parent is self.nil:
+            self.root = new
+        elif old is parent.left:
+            parent.left = new
+        else:
+            parent.right = new
+        new.parent = parent
+        self._touch(parent)
+
+    def insert(self, value):
+        """Insert value; returns False for duplicates"""
+        self._emit('insert_start', f'Inserting {value}', inserting_value=value)
+        parent, node = self.nil, self.root
+        while node is not self.nil:
+            self.comparisons += 1
+            if value == node.val:
+                self._emit('duplicate', f'Value {value} already exists', node.val)
+                return False
+            parent = node
+            side = 'left' if value < node.val else 'right'
+            if self._trace is not None:
+                self._emit('compare', f'{value} {"<" if side == "left" else ">"} {node.val}, go {side}', node.val)
+            node = node.left if side == 'left' else node.right
+
+        node = RBNode(self._new_uid(), value, self.nil)
+        node.parent = parent
+        if parent is self.nil:
+            self.root = node
+        elif value < parent.val:
+            parent.left = node
+        else:
+            parent.right = node
+        self.size += 1
+        self._touch(node, parent)
+        self._emit('insert', f'Inserted {value} as a red node', value)
+        self._insert_fixup(node)
+        return True
+
+    def _insert_fixup(self, node):
+        while node.parent.color == RED:
+            parent = node.parent
+            grandparent = parent.parent
+            side = 'left' if parent is grandparent.left else 'right'
+            other = 'right' if side == 'left' else 'left'
+            uncle = grandparent.right if side == 'left' else grandparent.left
+
+            if uncle.color == RED:
+                self._recolor(parent, BLACK)
+                self._recolor(uncle, BLACK)
+                self._recolor(grandparent, RED)
+                self._emit('recolor', f'Red uncle {uncle.val}: recolour {parent.val}, {uncle.val} black '
+                                      f'and {grandparent.val} red', grandparent.val)
+                node = grandparent
+                continue
+
+            if node is getattr(parent, other):
+                # Inner grandchild: rotate it to the outside first
+                node = parent
+                self._rotate(node, side)
+                parent = node.parent
+            self._recolor(parent, BLACK)
+            self._recolor(grandparent, RED)
+            self._emit('recolor', f'Recolour {parent.val} black and {grandparent.val} red', parent.val)
+            self._rotate(grandparent, other)
+
+        if self.root.color == RED:
+            self._recolor(self.root, BLACK)
+            self._emit('recolor', f'Root {self.root.val} recoloured black', self.root.val)
+
+    def delete(self, value):
+        """Delete value; returns False when it is not present"""
+        self._emit('delete_start', f'Deleting {value}', deleting_value=value)
+        node = self.root
+        while node is not self.nil:
+            self.comparisons += 1
+            if value == node.val:
+                break
+            side = 'left' if value < node.val else 'right'
+            if self._trace is not None:
+                self._emit('compare', f'{value} {"<" if side == "left" else ">"} {node.val}, go {side}', node.val)
+            node = node.left if side == 'left' else node.right
+        if node is self.nil:
+            self._emit('not_found', f'Value {value} not found')
+            return False
+        self._emit('found', f'Found {value}', node.val)
+
+        removed_color = node.color
+        if node.left is self.nil:
+            child = node.right
+            self._replace(node, child)
+        elif node.right is self.nil:
+            child = node.left
+            self._replace(node, child)
+        else:
+            successor = node.right
+            while successor.left is not self.nil:
+                successor = successor.left
+            removed_color = successor.color
+            child = successor.right
+            if successor.parent is node:
+                child.parent = successor
+            else:
+                self._replace(successor, child)
+                successor.right = node.right
+                successor.right.parent = successor
+            self._replace(node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.color = node.color
+            self._touch(successor)
+        self.size -= 1
+        self._emit('removed', f'Removed {value}', None)
+
+        if removed_color == BLACK:
+            self._delete_fixup(child)
+        # The sentinel's parent pointer is scratch space for the fix-up
+        self.nil.parent = self.nil
+        return True
+
+    def _delete_fixup(self, node):
+        while node is not self.root and node.color == BLACK:
+            parent = node.parent
+            side = 'left' if node is parent.left else 'right'
+            other = 'right' if side == 'left' else 'left'
+            sibling = getattr(parent, other)
+
+            if sibling.color == RED:
+                self._recolor(sibling, BLACK)
+                self._recolor(parent, RED)
+                self._emit('recolor', f'Red sibling {sibling.val}: recolour it black and {parent.val} red',
+                           sibling.val)
+                self._rotate(parent, side)
+                sibling = getattr(parent, other)
+
+            near, far = getattr(sibling, side), getattr(sibling, other)
+            if near.color == BLACK and far.color == BLACK:
+                self._recolor(sibling, RED)
+                self._emit('recolor', f'Sibling {sibling.val} has black children: recolour it red',
+                           sibling.val)
+                node = parent
+                continue
+
+            if far.color == BLACK:
+                self._recolor(near, BLACK)
+                self._recolor(sibling, RED)
+                self._emit('recolor', f'Recolour {near.val} black and {sibling.val} red', near.val)
+                self._rotate(sibling, other)
+                sibling = getattr(parent, other)
+                far = getattr(sibling, other)
+            self._recolor(sibling, parent.color)
+            self._recolor(parent, BLACK)
+            self._recolor(far, BLACK)
+            self._emit('recolor', f'Sibling {sibling.val} takes colour of {parent.val}; '
+                                  f'{parent.val} and {far.val} become black', sibling.val)
+            self._rotate(parent, side)
+            node = self.root
+
+        if node.color == RED:
+            self._recolor(node, BLACK)
+            self._emit('recolor', f'Recolour {node.val} black', node.val)
+
+    def black_height(self):
+        """Black nodes on every root-to-leaf path; raises ValueError if the invariants are broken"""
+        if self.root.color != BLACK:
+            raise ValueError('Root must be black')
+        heights = set()
+        stack = [(self.root, 0)]
+        while stack:
+            node, blacks = stack.pop()
+            if node is self.nil:
+                heights.add(blacks)
+                continue
+            if node.color == RED and RED in (node.left.color, node.right.color):
+                raise ValueError(f'Red node {node.val} has a red child')
+            blacks += node.color == BLACK
+            stack.append((node.left, blacks))
+            stack.append((node.right, blacks))
+        if len(heights) > 1:
+            raise ValueError('Root-to-leaf paths have different black heights')
+        return heights.pop()
+
+
+def expand_red_black_trace(trace):
+    """Per-step nested snapshots ({'val', 'color', 'left', 'right'}) of a compact red-black trace"""
+    return expand_balanced_trace(trace, 'color')
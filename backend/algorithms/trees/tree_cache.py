@@ -0,0 +1,70 @@
+"""
+Cache of Untraced Bulk-Loaded Binary Search Trees
+Author: Aryan Pravin Sahu
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+
+from algorithms.trees.binary_search_tree import BinarySearchTree
+
+BUILD_MODES = ('insertion', 'balanced')
+# Work bound for 'insertion' builds: random order stays near 2n ln n comparisons
+# (~2.3M for 100,000 values), but sorted input needs n^2 / 2 and would hold a worker for minutes
+MAX_INSERTION_COMPARISONS = 4_000_000
+
+
+def values_fingerprint(values):
+    """Stable content hash of a value sequence (order matters)"""
+    canonical = json.dumps(list(values), separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class TreeCache:
+    """
+    LRU cache of BinarySearchTrees keyed by (value fingerprint, build mode).
+    'insertion' inserts the values in order without recording steps, giving the
+    same shape as an insertion trace; 'balanced' bulk-loads the distinct values
+    in O(n) after sorting, so the key is the sorted set. Insertion builds that
+    exceed MAX_INSERTION_COMPARISONS raise ValueError. Cached trees are shared:
+    callers that modify one (e.g. delete) must work on tree.copy().
+    """
+
+    def __init__(self, max_trees=64):
+        self.max_trees = max_trees
+        self._trees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_tree(self, values, build='insertion'):
+        if build not in BUILD_MODES:
+            raise ValueError(f"build must be one of {', '.join(BUILD_MODES)}")
+        if build == 'balanced':
+            values = sorted(set(values))
+        key = (values_fingerprint(values), build)
+        tree = self._trees.get(key)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(key)
+            return tree
+
+        self.misses += 1
+        if build == 'balanced':
+            tree = BinarySearchTree.from_sorted(values)
+        else:
+            try:
+                tree = BinarySearchTree.from_values(values, MAX_INSERTION_COMPARISONS)
+            except ValueError as e:
+                raise ValueError(f"{e}; use build=balanced for large or sorted value lists") from None
+        self._trees[key] = tree
+        while len(self._trees) > self.max_trees:
+            self._trees.popitem(last=False)
+        return tree
+
+    def stats(self):
+        return {'trees': len(self._trees), 'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide cache used by the API
+tree_cache = TreeCache()
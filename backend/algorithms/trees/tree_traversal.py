@@ -0,0 +1,225 @@
+"""
+Iterative Binary Tree Traversal Engine
+Author: Aryan Pravin Sahu
+
+Traversals run over NodeStore slot indices with an explicit stack (or a queue
+for level order), so a degenerate tree of any depth never touches the Python
+recursion limit. Morris traversal threads spare right links to predecessors
+instead, using O(1) extra memory for in-order and pre-order; the links are
+restored before the walk finishes.
+
+A trace sends the tree once as [slot, val, left_slot, right_slot] records and
+each step records only the node it newly visits (Morris adds thread/unthread
+steps for the temporary links).
+"""
+
+from collections import deque
+
+from algorithms.trees.node_store import NIL
+
+TRAVERSAL_ORDERS = ('inorder', 'preorder', 'postorder', 'level')
+TRAVERSAL_METHODS = ('stack', 'morris')
+MORRIS_ORDERS = ('inorder', 'preorder')
+
+# Walk events
+VISIT = 'visit'
+THREAD = 'thread'
+UNTHREAD = 'unthread'
+
+ORDER_DESCRIPTIONS = {
+    'inorder': 'Inorder: Left → Root → Right',
+    'preorder': 'Preorder: Root → Left → Right',
+    'postorder': 'Postorder: Left → Right → Root',
+    'level': 'Level order: top to bottom, left to right',
+}
+
+
+def check_traversal(order, method):
+    if order not in TRAVERSAL_ORDERS:
+        raise ValueError(f"order must be one of {', '.join(TRAVERSAL_ORDERS)}")
+    if method not in TRAVERSAL_METHODS:
+        raise ValueError(f"method must be one of {', '.join(TRAVERSAL_METHODS)}")
+    if method == 'morris' and order not in MORRIS_ORDERS:
+        raise ValueError('Morris traversal supports inorder and preorder only')
+
+
+def walk(nodes, root, order='inorder', method='stack'):
+    """
+    Yield (event, slot, other) tuples: (VISIT, slot, stack_size) for every node in
+    order, and for Morris also (THREAD, predecessor, slot) / (UNTHREAD, predecessor, slot).
+    stack_size is the number of pending stack/queue entries (0 for Morris).
+    """
+    check_traversal(order, method)
+    if root == NIL:
+        return
+    if method == 'morris':
+        yield from _morris(nodes, root, order)
+        return
+
+    left, right = nodes.left, nodes.right
+    if order == 'inorder':
+        stack, current = [], root
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            current = stack.pop()
+            yield VISIT, current, len(stack)
+            current = right[current]
+    elif order == 'preorder':
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            if right[current] != NIL:
+                stack.append(right[current])
+            if left[current] != NIL:
+                stack.append(left[current])
+            yield VISIT, current, len(stack)
+    elif order == 'postorder':
+        # One stack: a node is emitted once its right subtree is done (tracked by `last`)
+        stack, current, last = [], root, NIL
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            top = stack[-1]
+            if right[top] != NIL and right[top] != last:
+                current = right[top]
+                continue
+            last = stack.pop()
+            yield VISIT, last, len(stack)
+    else:
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            if left[current] != NIL:
+                queue.append(left[current])
+            if right[current] != NIL:
+                queue.append(right[current])
+            yield VISIT, current, len(queue)
+
+
+def _morris(nodes, root, order):
+    left, right = nodes.left, nodes.right
+    current = root
+    try:
+        while current != NIL:
+            if left[current] == NIL:
+                yield VISIT, current, 0
+                current = right[current]
+                continue
+
+            predecessor = left[current]
+            while right[predecessor] != NIL and right[predecessor] != current:
+                predecessor = right[predecessor]
+
+            if right[predecessor] == NIL:
+                # First arrival: thread the predecessor back to current, then go left
+                right[predecessor] = current
+                yield THREAD, predecessor, current
+                if order == 'preorder':
+                    yield VISIT, current, 0
+                current = left[current]
+            else:
+                # Second arrival through the thread: the left subtree is done
+                right[predecessor] = NIL
+                yield UNTHREAD, predecessor, current
+                if order == 'inorder':
+                    yield VISIT, current, 0
+                current = right[current]
+    finally:
+        # A walk abandoned part-way finishes silently so every thread is removed again
+        for _ in _morris_finish(nodes, current):
+            pass
+
+
+def _morris_finish(nodes, current):
+    left, right = nodes.left, nodes.right
+    while current != NIL:
+        if left[current] == NIL:
+            current = right[current]
+            continue
+        predecessor = left[current]
+        while right[predecessor] != NIL and right[predecessor] != current:
+            predecessor = right[predecessor]
+        if right[predecessor] == NIL:
+            right[predecessor] = current
+            current = left[current]
+        else:
+            right[predecessor] = NIL
+            current = right[current]
+        yield
+
+
+def traversal_trace(tree, order='inorder', method='stack'):
+    """
+    Compact traversal trace of a BinarySearchTree: node records once in the header,
+    then one small step per visit (plus Morris thread/unthread steps).
+    """
+    check_traversal(order, method)
+    nodes = tree.nodes
+    vals = nodes.vals
+    steps = []
+    for event, slot, other in walk(nodes, tree.root, order, method):
+        if event == VISIT:
+            steps.append({'step': len(steps) + 1, 'operation': VISIT, 'current_node': vals[slot],
+                          'stack_size': other})
+        else:
+            steps.append({'step': len(steps) + 1, 'operation': event, 'current_node': vals[other],
+                          'predecessor': vals[slot]})
+
+    records = [
+        [slot, vals[slot],
+         nodes.left[slot] if nodes.left[slot] != NIL else None,
+         nodes.right[slot] if nodes.right[slot] != NIL else None]
+        for _, slot, _ in walk(nodes, tree.root, 'preorder')
+    ]
+    return {
+        'structure': 'bst',
+        'operation': 'traverse',
+        'order': order,
+        'method': method,
+        'root': tree.root if tree.root != NIL else None,
+        'nodes': records,
+        'total_steps': len(steps),
+        'steps': steps
+    }
+
+
+def expand_traversal_steps(trace, tree_snapshot):
+    """
+    Legacy per-step format of BinarySearchTree.traversal_steps: every step repeats the
+    tree (one shared serialised dict) and the visited/result lists so far.
+    """
+    order = trace['order']
+    visited = []
+    steps = [{
+        'step': 0,
+        'tree': tree_snapshot,
+        'operation': f'{order}_start',
+        'current_node': None,
+        'visited': [],
+        'stack': [],
+        'result': [],
+        'description': f'Starting {order} traversal'
+    }]
+    for step in trace['steps']:
+        value = step['current_node']
+        if step['operation'] == VISIT:
+            visited.append(value)
+            description = f'Visit node {value} ({ORDER_DESCRIPTIONS[order]})'
+        elif step['operation'] == THREAD:
+            description = f'Thread {step["predecessor"]} → {value} (in-order predecessor link)'
+        else:
+            description = f'Remove thread {step["predecessor"]} → {value}; left subtree of {value} done'
+        steps.append({
+            'step': step['step'],
+            'tree': tree_snapshot,
+            'operation': step['operation'],
+            'current_node': value,
+            'visited': visited.copy(),
+            'stack': [],
+            'result': visited.copy(),
+            'description': description
+        })
+    return steps
@@ -11,7 +11,7 @@ import json
 import logging
 
 # Flask imports
-from flask import Flask, render_template, request, jsonify, has_request_context
+from flask import Flask, Response, render_template, request, jsonify, has_request_context, stream_with_context
 
 # Ensure current directory is in path for relative imports (optional)
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -39,8 +39,37 @@ from algorithms.sorting.radix_sort import radix_sort_steps
 
 from algorithms.searching.binary_search import binary_search_steps, linear_search_steps, get_sample_data as get_search_data, get_sample_target
 from algorithms.trees.binary_search_tree import BinarySearchTree, get_sample_data as get_bst_data, get_sample_search_target
-from algorithms.graphs.graph_traversal import create_sample_graph, get_sample_start_vertex
+from algorithms.trees.tree_cache import tree_cache, BUILD_MODES as BST_BUILD_MODES
+from algorithms.trees.tree_traversal import check_traversal
+from algorithms.trees.avl_tree import AVLTree
+from algorithms.trees.red_black_tree import RedBlackTree
+from algorithms.graphs.graph_traversal import create_sample_graph, create_custom_graph, get_sample_start_vertex
+from algorithms.graphs.dijkstra import dijkstra_trace, json_distance, validate_weighted_graph, get_sample_graph as get_dijkstra_graph, get_sample_positions as get_dijkstra_positions
+from algorithms.graphs.shortest_path_cache import shortest_path_cache, MAX_PRECOMPUTE_NODES, MAX_PRECOMPUTE_WORKERS
+from algorithms.graphs.generators import GENERATORS, generate_graph
+from algorithms.graphs.frontier_bfs import bfs_level_metrics
+from algorithms.graphs.point_to_point import dijkstra_point_to_point
+from algorithms.graphs.layout import layout_cache
+from algorithms.graphs.csr_graph import CSRGraph
+from algorithms.graphs.union_find import connected_components_trace
+from algorithms.graphs.minimum_spanning_tree import kruskal_trace, prim_trace
+from algorithms.graphs.topological_sort import kahn_trace
+from algorithms.graphs.implicit_grid import ImplicitGrid
+from algorithms.dynamic_programming.fibonacci import (
+    MAX_FIBONACCI_STEPS_N, MAX_FIBONACCI_TRACE_N, fibonacci_recursive_steps, fibonacci_recursive_trace,
+    fibonacci_steps, fibonacci_summary, fibonacci_trace
+)
+from algorithms.data_structures.priority_queue import check_arity
+from algorithms.data_structures.operation_stream import run_stream
 from algorithms.data_structures.stack_queue import StackOperations, QueueOperations, get_sample_stack_operations, get_sample_queue_operations
+from core.job_runner import JobRunner, InvalidJobOptionsError, JobLimitError, UnknownJobTypeError
+
+# Background analytics jobs run in their own processes; the limit keeps them from starving request workers
+job_runner = JobRunner(
+    jobs_dir=os.path.join(BASE_DIR, 'data', 'jobs'),
+    working_dir=BASE_DIR,
+    max_concurrent_jobs=int(os.environ.get('ALGOVIZARD_MAX_JOBS', 1))
+)
 
 
 def safe_request_info():
@@ -376,6 +405,12 @@ def linear_search_api():
     return jsonify(steps)
 
 
+# Search/traverse build their tree untraced, so they accept far more values than the traced insert
+MAX_BST_SEARCH_VALUES = 1000
+MAX_BST_COMPACT_VALUES = 100000
+MAX_BST_SNAPSHOT_HEIGHT = 200
+
+
 @app.route('/api/binary-search-tree', methods=['GET', 'POST'])
 def binary_search_tree_api():
     log_interaction('binary_search_tree', 'api_request')
@@ -398,38 +433,451 @@ def binary_search_tree_api():
         steps = bst.insert_steps(sample_values)
         return jsonify(steps)
     
-    elif operation == 'search':
-        bst = BinarySearchTree()
-        bst.insert_steps(get_bst_data())  # Build tree first
-        target = get_sample_search_target()
-        steps = bst.search_steps(target)
-        return jsonify(steps)
+    elif operation in ('search', 'traverse'):
+        # The tree is bulk-loaded without steps and cached per value set; only the search/walk is traced.
+        # POST {"values": [...], "target": x}; ?build=insertion|balanced, ?format=compact for large trees
+        data = request.get_json(silent=True) if request.method == 'POST' else None
+        data = data or {}
+        values = data.get('values', get_bst_data())
+        build = request.args.get('build', 'insertion')
+        compact = request.args.get('format') == 'compact'
+        limit = MAX_BST_COMPACT_VALUES if compact else MAX_BST_SEARCH_VALUES
+        if (not isinstance(values, list) or len(values) > limit or
+                not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)):
+            return jsonify({'error': f'values must be a list of at most {limit} numbers'}), 400
+        if build not in BST_BUILD_MODES:
+            return jsonify({'error': f"build must be one of {', '.join(BST_BUILD_MODES)}"}), 400
+        try:
+            bst = tree_cache.get_tree(values, build)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if not compact and bst.height() > MAX_BST_SNAPSHOT_HEIGHT:
+            # Legacy steps nest the whole tree per step; deep trees overflow the JSON encoder
+            return jsonify({'error': f'Trees deeper than {MAX_BST_SNAPSHOT_HEIGHT} levels need format=compact '
+                                     f'(this one is {bst.height()} levels deep)'}), 400
+
+        if operation == 'traverse':
+            # ?order=inorder|preorder|postorder|level&method=stack|morris
+            order = request.args.get('order', 'inorder')
+            method = request.args.get('method', 'stack')
+            try:
+                check_traversal(order, method)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            if method == 'morris':
+                # Morris threads links temporarily; keep the shared cached tree untouched
+                bst = bst.copy()
+            log_interaction('binary_search_tree', 'traverse', {'values_count': len(values), 'order': order,
+                                                               'method': method})
+            return jsonify(bst.traversal_trace(order, method) if compact else bst.traversal_steps(order, method))
+
+        target = data.get('target', get_sample_search_target())
+        if not isinstance(target, (int, float)) or isinstance(target, bool):
+            return jsonify({'error': 'target must be a number'}), 400
+        log_interaction('binary_search_tree', 'search', {'values_count': len(values), 'build': build,
+                                                         'cache': tree_cache.stats()})
+        return jsonify(bst.search_trace(target) if compact else bst.search_steps(target))
+
+
+BALANCED_TREES = {'avl': AVLTree, 'red_black': RedBlackTree}
+MAX_BALANCED_TREE_VALUES = 50
+
+
+@app.route('/api/balanced-tree', methods=['GET', 'POST'])
+def balanced_tree_api():
+    """
+    AVL / red-black insert, delete and search traces with rotation and recolouring steps.
+    Query: ?type=avl|red_black&operation=insert|delete|search.
+    POST: {"values": [...], "delete": [...], "target": x}; the tree is built from values
+    (traced for insert, untraced otherwise) before deleting or searching.
+    """
+    log_interaction('balanced_tree', 'api_request')
+    tree_type = request.args.get('type', 'avl')
+    operation = request.args.get('operation', 'insert')
+    if tree_type not in BALANCED_TREES or operation not in ('insert', 'delete', 'search'):
+        return jsonify({'error': "type must be 'avl' or 'red_black' and operation 'insert', 'delete' or 'search'"}), 400
+
+    data = request.get_json(silent=True) if request.method == 'POST' else None
+    data = data or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    def invalid_numbers(name, items):
+        if (not isinstance(items, list) or len(items) > MAX_BALANCED_TREE_VALUES or
+                not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in items)):
+            return jsonify({'error': f'{name} must be a list of at most {MAX_BALANCED_TREE_VALUES} numbers'}), 400
+        return None
+
+    values = data.get('values', get_bst_data())
+    error = invalid_numbers('values', values)
+    if error:
+        return error
+    to_delete = data.get('delete', values[:2])
+    error = invalid_numbers('delete', to_delete)
+    if error:
+        return error
+    target = data.get('target', get_sample_search_target())
+    if not isinstance(target, (int, float)) or isinstance(target, bool):
+        return jsonify({'error': 'target must be a number'}), 400
+
+    tree = BALANCED_TREES[tree_type]()
+    if operation == 'insert':
+        trace = tree.insert_trace(values)
+    else:
+        for value in values:
+            tree.insert(value)
+        trace = tree.delete_trace(to_delete) if operation == 'delete' else tree.search_trace(target)
+    log_interaction('balanced_tree', f'{tree_type}_{operation}', {'values_count': len(values)})
+    return jsonify(trace)
+
+def custom_graph_from_request(algorithm, max_vertices, max_edges):
+    """
+    Parse a custom graph POST body: {"vertices": n, "edges": [[u, v], ...], "start": s, "directed": false}.
+    Returns (graph, start_vertex, None), (None, None, None) when no custom graph was sent,
+    or (None, None, error_response) for invalid input.
+    """
+    if request.method != 'POST':
+        return None, None, None
+
+    data = request.get_json(silent=True)
+    if not data or 'vertices' not in data or 'edges' not in data:
+        return None, None, None
+
+    vertices = data['vertices']
+    edges = data['edges']
+    start_vertex = data.get('start', 0)
+    if not isinstance(edges, list) or len(edges) > max_edges:
+        return None, None, (jsonify({'error': f'edges must be a list of at most {max_edges} [u, v] pairs'}), 400)
+    if isinstance(vertices, int) and vertices > max_vertices:
+        return None, None, (jsonify({'error': f'Custom graphs are limited to {max_vertices} vertices'}), 400)
+
+    try:
+        graph = create_custom_graph(vertices, edges, directed=bool(data.get('directed', False)))
+    except ValueError as e:
+        return None, None, (jsonify({'error': str(e)}), 400)
+
+    if not isinstance(start_vertex, int) or not 0 <= start_vertex < vertices:
+        return None, None, (jsonify({'error': f'start must be a vertex between 0 and {vertices - 1}'}), 400)
+
+    log_interaction(algorithm, 'custom_graph_used', {'vertices': vertices, 'edges_count': len(edges)})
+    return graph, start_vertex, None
 
 
 @app.route('/api/graph-dfs', methods=['GET', 'POST'])
 def graph_dfs_api():
     log_interaction('graph_dfs', 'api_request')
 
-    graph = create_sample_graph()
-    start_vertex = get_sample_start_vertex()
-    steps = graph.dfs_steps(start_vertex)
-    return jsonify(steps)
+    # format=snapshots returns the legacy full-state-per-step list (small graphs only)
+    snapshots = request.args.get('format') == 'snapshots'
+    max_vertices, max_edges = (100, 500) if snapshots else (10000, 50000)
+
+    graph, start_vertex, error = custom_graph_from_request('graph_dfs', max_vertices, max_edges)
+    if error:
+        return error
+    if graph is None:
+        graph = create_sample_graph()
+        start_vertex = get_sample_start_vertex()
+
+    if snapshots:
+        return jsonify(graph.dfs_steps(start_vertex))
+    trace = graph.dfs_trace(start_vertex)
+    trace['layout'] = layout_cache.inline_layout(graph.freeze())
+    return jsonify(trace)
 
 
 @app.route('/api/graph-bfs', methods=['GET', 'POST'])
 def graph_bfs_api():
     log_interaction('graph_bfs', 'api_request')
 
-    graph = create_sample_graph()
-    start_vertex = get_sample_start_vertex()
-    steps = graph.bfs_steps(start_vertex)
-    return jsonify(steps)
+    # format=snapshots returns the legacy full-state-per-step list (small graphs only);
+    # format=levels returns untraced per-level frontier sizes for large graphs
+    output_format = request.args.get('format')
+    snapshots = output_format == 'snapshots'
+    limits = {'snapshots': (100, 500), 'levels': (200000, 1000000)}
+    max_vertices, max_edges = limits.get(output_format, (10000, 50000))
+
+    graph, start_vertex, error = custom_graph_from_request('graph_bfs', max_vertices, max_edges)
+    if error:
+        return error
+    if graph is None:
+        graph = create_sample_graph()
+        start_vertex = get_sample_start_vertex()
+
+    if output_format == 'levels':
+        return jsonify(graph.bfs_levels(start_vertex))
+    if snapshots:
+        return jsonify(graph.bfs_steps(start_vertex))
+    trace = graph.bfs_trace(start_vertex)
+    trace['layout'] = layout_cache.inline_layout(graph.freeze())
+    return jsonify(trace)
+
+
+@app.route('/api/dijkstra', methods=['GET', 'POST'])
+def dijkstra_api():
+    """
+    Compact Dijkstra trace. ?arity=N runs it on an N-ary indexed heap (default binary);
+    ?trace_heap=1 adds the heap slot moves of every push, pop and decrease-key.
+    """
+    log_interaction('dijkstra', 'api_request')
+    trace_heap = request.args.get('trace_heap') == '1'
+    try:
+        arity = int(request.args.get('arity', 2))
+        check_arity(arity)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    if request.method == 'POST':
+        data = request.get_json(silent=True)
+        if data and 'graph' in data:
+            graph = data['graph']
+            start_node = data.get('start')
+            if not isinstance(graph, dict) or len(graph) > 1000:
+                return jsonify({'error': 'graph must be an object with at most 1000 nodes'}), 400
+            if sum(len(edges) for edges in graph.values() if isinstance(edges, list)) > 10000:
+                return jsonify({'error': 'Custom graphs are limited to 10000 edges'}), 400
+            try:
+                validate_weighted_graph(graph, start_node)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+            trace = dijkstra_trace(graph, start_node, arity, trace_heap)
+            csr, nodes = CSRGraph.from_weighted_dict(graph)
+            layout = layout_cache.inline_layout(csr, nodes)
+            trace['positions'] = layout['positions']
+            trace['layout_method'] = layout['method']
+            log_interaction('dijkstra', 'custom_graph_used', {'nodes': len(graph)})
+            return jsonify(trace)
+
+    trace = dijkstra_trace(get_dijkstra_graph(), 'A', arity, trace_heap)
+    trace['positions'] = get_dijkstra_positions()
+    return jsonify(trace)
+
+
+@app.route('/api/dijkstra/path', methods=['GET', 'POST'])
+def dijkstra_path_api():
+    """
+    Shortest distance and path between two nodes, served from the shortest-path tree cache.
+    POST: {"graph": {...}, "source": s, "target": t, "precompute": true, "workers": n}; precompute
+    fills the cache for every source, over a process pool of up to MAX_PRECOMPUTE_WORKERS workers.
+    """
+    log_interaction('dijkstra', 'path_query')
+
+    data = request.get_json(silent=True) if request.method == 'POST' else None
+    data = data if isinstance(data, dict) else {}
+    graph = data.get('graph') or get_dijkstra_graph()
+    source = data.get('source', request.args.get('source', 'A'))
+    target = data.get('target', request.args.get('target', 'F'))
+
+    if not isinstance(graph, dict) or len(graph) > 1000:
+        return jsonify({'error': 'graph must be an object with at most 1000 nodes'}), 400
+    if not isinstance(source, str) or not isinstance(target, str):
+        return jsonify({'error': 'source and target must be node names (strings)'}), 400
+    try:
+        validate_weighted_graph(graph, source)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if target not in graph:
+        return jsonify({'error': f'target node {target!r} is not in the graph'}), 400
+
+    if data.get('precompute'):
+        if len(graph) > MAX_PRECOMPUTE_NODES:
+            return jsonify({'error': f'precompute is limited to graphs of {MAX_PRECOMPUTE_NODES} nodes'}), 400
+        workers = data.get('workers', 1)
+        max_workers = min(MAX_PRECOMPUTE_WORKERS, os.cpu_count() or 1)
+        if not isinstance(workers, int) or isinstance(workers, bool) or not 1 <= workers <= max_workers:
+            return jsonify({'error': f'workers must be an integer between 1 and {max_workers}'}), 400
+        shortest_path_cache.precompute_all_sources(graph, workers)
+
+    result = shortest_path_cache.query(graph, source, target)
+    result['cache'] = shortest_path_cache.stats()
+    return jsonify(result)
+
+
+# Traced union-find / MST / topological sort algorithms and whether they read edges as directed
+GRAPH_ALGORITHM_TRACES = {
+    'connected_components': (lambda csr, start, labels: connected_components_trace(csr, labels), False),
+    'kruskal': (lambda csr, start, labels: kruskal_trace(csr, labels), False),
+    'prim': (lambda csr, start, labels: prim_trace(csr, start, labels), False),
+    'topological_sort': (lambda csr, start, labels: kahn_trace(csr, labels), True)
+}
+
+
+@app.route('/api/graph-algorithms/<algorithm>', methods=['GET', 'POST'])
+def graph_algorithms_api(algorithm):
+    """
+    Traces for union-find components, Kruskal, Prim and Kahn's topological sort.
+    POST {"vertices": n, "edges": [[u, v] or [u, v, weight], ...], "start": s}; GET uses the
+    Dijkstra sample graph (or a sample DAG for topological_sort).
+    """
+    if algorithm not in GRAPH_ALGORITHM_TRACES:
+        return jsonify({'error': f"algorithm must be one of {', '.join(GRAPH_ALGORITHM_TRACES)}"}), 404
+    log_interaction(algorithm, 'api_request')
+    run_trace, directed = GRAPH_ALGORITHM_TRACES[algorithm]
+
+    data = request.get_json(silent=True) if request.method == 'POST' else None
+    if data and 'vertices' in data and 'edges' in data:
+        vertices, edges, start = data['vertices'], data['edges'], data.get('start', 0)
+        if not isinstance(vertices, int) or isinstance(vertices, bool) or not 1 <= vertices <= 1000:
+            return jsonify({'error': 'vertices must be an integer between 1 and 1000'}), 400
+        if not isinstance(edges, list) or len(edges) > 10000:
+            return jsonify({'error': 'edges must be a list of at most 10000 [u, v] or [u, v, weight] entries'}), 400
+        for edge in edges:
+            if not (isinstance(edge, list) and len(edge) in (2, 3) and
+                    all(isinstance(x, int) and not isinstance(x, bool) and 0 <= x < vertices for x in edge[:2]) and
+                    (len(edge) == 2 or (isinstance(edge[2], (int, float)) and not isinstance(edge[2], bool)
+                                        and 0 <= edge[2] < float('inf')))):
+                return jsonify({'error': f'Invalid edge {edge!r}: expected [u, v] or [u, v, weight] '
+                                         f'with 0 <= u, v < {vertices} and a finite non-negative weight'}), 400
+        if not isinstance(start, int) or not 0 <= start < vertices:
+            return jsonify({'error': f'start must be a vertex between 0 and {vertices - 1}'}), 400
+
+        weights = [edge[2] if len(edge) == 3 else 1 for edge in edges]
+        csr = CSRGraph.from_edges(vertices, [edge[0] for edge in edges], [edge[1] for edge in edges],
+                                  weights, directed=directed)
+        labels = list(range(vertices))
+        log_interaction(algorithm, 'custom_graph_used', {'vertices': vertices, 'edges_count': len(edges)})
+    elif directed:
+        labels = ['shirt', 'tie', 'jacket', 'belt', 'trousers', 'shoes', 'socks']
+        csr = CSRGraph.from_edges(7, [0, 0, 1, 3, 4, 4, 6], [1, 3, 2, 2, 3, 5, 5], directed=True)
+        start = 0
+    else:
+        csr, labels = CSRGraph.from_weighted_dict(get_dijkstra_graph())
+        start = 0
+
+    trace = run_trace(csr, start, labels)
+    trace['layout'] = layout_cache.inline_layout(csr, labels)
+    return jsonify(trace)
+
+
+@app.route('/api/maze-traversal', methods=['GET', 'POST'])
+def maze_traversal_api():
+    """
+    BFS/DFS on an implicit grid maze; the trace holds the wall bitset and visited cell indices.
+    GET: ?algorithm=bfs|dfs&rows=&cols=&wall_ratio=&seed=&encoding=list|base64 (random maze up to 1000x1000,
+    always solvable through a random open corridor from the top-left to the bottom-right cell).
+    POST: {"maze": ["..#", ...], "algorithm": "bfs", "start": 0, "goal": n - 1}.
+    """
+    log_interaction('maze_traversal', 'api_request')
+    data = request.get_json(silent=True) if request.method == 'POST' else None
+    data = data or {}
+    algorithm = data.get('algorithm', request.args.get('algorithm', 'bfs'))
+    encoding = request.args.get('encoding', 'list')
+    if algorithm not in ('bfs', 'dfs') or encoding not in ('list', 'base64'):
+        return jsonify({'error': "algorithm must be 'bfs' or 'dfs' and encoding 'list' or 'base64'"}), 400
+
+    try:
+        if 'maze' in data:
+            maze = data['maze']
+            if (not isinstance(maze, list) or len(maze) > 200 or
+                    not all(isinstance(line, str) and len(line) <= 200 for line in maze)):
+                return jsonify({'error': 'maze must be a list of at most 200 strings of up to 200 cells'}), 400
+            grid = ImplicitGrid.from_strings(maze)
+            start = data.get('start', 0)
+            goal = data.get('goal', grid.num_cells - 1)
+        else:
+            rows = int(request.args.get('rows', 50))
+            cols = int(request.args.get('cols', 50))
+            wall_ratio = float(request.args.get('wall_ratio', 0.3))
+            seed = int(request.args.get('seed', 0))
+            if not (1 <= rows <= 1000 and 1 <= cols <= 1000 and 0 <= wall_ratio < 1):
+                return jsonify({'error': 'rows and cols must be 1-1000 and wall_ratio in [0, 1)'}), 400
+            start, goal = 0, rows * cols - 1
+            grid = ImplicitGrid.random_maze(rows, cols, wall_ratio, seed, keep_open=(start, goal), corridor=True)
+        return jsonify(grid.trace(algorithm, start, goal, encoding))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+# Load-test limits for generated graphs (vertices) per algorithm
+GENERATED_GRAPH_LIMITS = {'bfs': 1000000, 'dijkstra': 200000}
+
+
+@app.route('/api/graph-generator', methods=['GET'])
+def graph_generator_api():
+    """
+    Generate a synthetic graph and run an untraced algorithm on it, reporting timings.
+    Query: kind, vertices, seed, weighted (0/1), algorithm ('bfs' or 'dijkstra').
+    """
+    log_interaction('graph_generator', 'api_request')
+
+    kind = request.args.get('kind', 'erdos_renyi')
+    algorithm = request.args.get('algorithm', 'bfs')
+    weighted = request.args.get('weighted', '0') in ('1', 'true')
+    try:
+        vertices = int(request.args.get('vertices', 10000))
+        seed = int(request.args.get('seed', 0))
+    except ValueError:
+        return jsonify({'error': 'vertices and seed must be integers'}), 400
+    if seed < 0:
+        return jsonify({'error': 'seed must be a non-negative integer'}), 400
+
+    if kind not in GENERATORS:
+        return jsonify({'error': f"kind must be one of {', '.join(GENERATORS)}"}), 400
+    if algorithm not in GENERATED_GRAPH_LIMITS:
+        return jsonify({'error': f"algorithm must be one of {', '.join(GENERATED_GRAPH_LIMITS)}"}), 400
+    if not 1 <= vertices <= GENERATED_GRAPH_LIMITS[algorithm]:
+        return jsonify({'error': f'vertices must be between 1 and {GENERATED_GRAPH_LIMITS[algorithm]} for {algorithm}'}), 400
+
+    started = datetime.now()
+    csr, _ = generate_graph(kind, vertices, seed=seed, weighted=weighted)
+    generated = datetime.now()
+
+    if algorithm == 'bfs':
+        result = bfs_level_metrics(csr, 0)
+    else:
+        distance, path, expanded = dijkstra_point_to_point(csr, 0, csr.num_vertices - 1, stop_at_target=False)
+        result = {
+            'algorithm': 'dijkstra',
+            'vertices': csr.num_vertices,
+            'edges': csr.num_edges,
+            'source': 0,
+            'target': csr.num_vertices - 1,
+            'distance': json_distance(distance),
+            'path_length': len(path),
+            'nodes_expanded': expanded
+        }
+    finished = datetime.now()
+
+    result.update({
+        'kind': kind,
+        'seed': seed,
+        'weighted': weighted,
+        'generate_ms': (generated - started).total_seconds() * 1000,
+        'run_ms': (finished - generated).total_seconds() * 1000
+    })
+    return jsonify(result)
+
+
+STREAM_OPERATIONS_SAMPLE = {'stack': ('push', 'pop'), 'queue': ('enqueue', 'dequeue')}
+
+
+def operation_stream_response(structure):
+    """
+    NDJSON stream of run-length encoded stack/queue operations (?mode=stream&backend=array|linked).
+    POST {"operations": ["push 5 x100000", ["pop", null, 500], ...]}; one JSON record per line.
+    """
+    data = request.get_json(silent=True) if request.method == 'POST' else None
+    data = data if isinstance(data, dict) else {}
+    operations = data.get('operations', [f'{STREAM_OPERATIONS_SAMPLE[structure][0]} 1 x100000',
+                                         f'{STREAM_OPERATIONS_SAMPLE[structure][1]} x100000'])
+    if not isinstance(operations, list):
+        return jsonify({'error': 'operations must be a list'}), 400
+    try:
+        records = run_stream(structure, request.args.get('backend', 'array'), operations)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    log_interaction(f'{structure}_operations', 'stream', {'entries': len(operations)})
+    lines = (json.dumps(record, separators=(',', ':')) + '\n' for record in records)
+    return Response(stream_with_context(lines), mimetype='application/x-ndjson')
 
 
 @app.route('/api/stack-operations', methods=['GET', 'POST'])
 def stack_operations_api():
     log_interaction('stack_operations', 'api_request')
 
+    if request.args.get('mode') == 'stream':
+        return operation_stream_response('stack')
+
     if request.method == 'POST':
         data = request.get_json(silent=True)
         if data and 'operations' in data:
@@ -446,41 +894,69 @@ def stack_operations_api():
     return jsonify(steps)
 
 
+# Compact queue traces carry no per-step snapshot, so they accept far longer operation lists
+MAX_QUEUE_COMPACT_OPERATIONS = 10000
+
+
 @app.route('/api/queue-operations', methods=['GET', 'POST'])
 def queue_operations_api():
+    """
+    Queue operation traces. ?implementation=deque|ring&capacity=N picks the backing queue
+    (ring = fixed-capacity circular buffer that reports overflow; capacity is rejected for deque); ?format=compact returns
+    delta steps (element, slot and moved head/tail only) instead of full snapshots, and
+    ?mode=stream runs high-volume run-length encoded operations (see operation_stream_response).
+    """
     log_interaction('queue_operations', 'api_request')
+    if request.args.get('mode') == 'stream':
+        return operation_stream_response('queue')
+
+    implementation = request.args.get('implementation', 'deque')
+    compact = request.args.get('format') == 'compact'
+    try:
+        capacity = int(request.args['capacity']) if 'capacity' in request.args else None
+        queue = QueueOperations(implementation, capacity)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
+    operations = get_sample_queue_operations()
     if request.method == 'POST':
         data = request.get_json(silent=True)
         if data and 'operations' in data:
-            operations = data['operations']
-            if isinstance(operations, list) and len(operations) <= 20:
-                queue = QueueOperations()
-                steps = queue.operations_steps(operations)
+            limit = MAX_QUEUE_COMPACT_OPERATIONS if compact else 20
+            if isinstance(data['operations'], list) and len(data['operations']) <= limit:
+                operations = data['operations']
                 log_interaction('queue_operations', 'custom_operations_used', {'operations_count': len(operations)})
-                return jsonify(steps)
 
-    queue = QueueOperations()
-    operations = get_sample_queue_operations()
+    if compact:
+        try:
+            return jsonify(queue.operations_trace(operations))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
     steps = queue.operations_steps(operations)
     return jsonify(steps)
 
 
 @app.route('/api/heap-sort', methods=['GET', 'POST'])
 def heap_sort_api():
+    """Heap sort steps; ?arity=N sorts with an N-ary max-heap (default binary)"""
     log_interaction('heap_sort', 'api_request')
+    try:
+        arity = int(request.args.get('arity', 2))
+        check_arity(arity)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
     if request.method == 'POST':
         data = request.get_json(silent=True)
         if data and 'array' in data:
             custom_array = data['array']
             if isinstance(custom_array, list) and len(custom_array) <= 10:
-                steps = heap_sort_steps(custom_array)
+                steps = heap_sort_steps(custom_array, arity)
                 log_interaction('heap_sort', 'custom_array_used', {'array_size': len(custom_array)})
                 return jsonify(steps)
 
     sample_data = get_sample_data()
-    steps = heap_sort_steps(sample_data)
+    steps = heap_sort_steps(sample_data, arity)
     return jsonify(steps)
 
 
@@ -513,6 +989,50 @@ def radix_sort_api():
 
 
 
+@app.route('/api/fibonacci', methods=['GET', 'POST'])
+def fibonacci_api():
+    """
+    Fibonacci via dynamic programming. n comes from ?n= or a POST body {"n": ...}.
+    Default: legacy per-step DP-table snapshots (n <= MAX_FIBONACCI_STEPS_N);
+    ?format=compact: one newly filled cell per step (n <= MAX_FIBONACCI_TRACE_N);
+    ?mode=value: fast-doubling F(n) summarised by digit count and digest (n <= MAX_FIBONACCI_N).
+    ?method=recursive traces top-down memoised recursion instead of the bottom-up table;
+    with ?format=compact, ?summary=1 adds the repeated-subtree summary.
+    """
+    log_interaction('fibonacci', 'api_request')
+    data = request.get_json(silent=True) if request.method == 'POST' else None
+    data = data if isinstance(data, dict) else {}
+    n = data.get('n', request.args.get('n', 10))
+    try:
+        if isinstance(n, str):
+            n = int(n)
+        if not isinstance(n, int) or isinstance(n, bool):
+            raise ValueError('n must be an integer')
+        if request.args.get('mode') == 'value':
+            summary = fibonacci_summary(n)
+            log_interaction('fibonacci', 'value', {'n': n, 'digits': summary['digits']})
+            return jsonify(summary)
+        method = request.args.get('method', 'iterative')
+        if method not in ('iterative', 'recursive'):
+            raise ValueError('method must be iterative or recursive')
+        compact = request.args.get('format') == 'compact'
+        limit = MAX_FIBONACCI_TRACE_N if compact else MAX_FIBONACCI_STEPS_N
+        if n > limit:
+            raise ValueError(f'Step traces are limited to n <= {limit}; use ?mode=value for larger n')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    if method == 'recursive':
+        if compact:
+            return jsonify(fibonacci_recursive_trace(n, summarize=request.args.get('summary') == '1'))
+        steps = []
+        fibonacci_recursive_steps(n, steps=steps)
+        return jsonify(steps)
+    if compact:
+        return jsonify(fibonacci_trace(n))
+    return jsonify(fibonacci_steps(n))
+
+
 @app.route('/api/analytics')
 def analytics_api():
     try:
@@ -560,6 +1080,43 @@ def log_interaction_api():
         return jsonify({'error': 'Internal server error'}), 500
 
 
+@app.route('/api/jobs', methods=['GET', 'POST'])
+def jobs_api():
+    if request.method == 'GET':
+        return jsonify(job_runner.list_jobs())
+
+    data = request.get_json(silent=True)
+    data = data if isinstance(data, dict) else {}
+    job_type = data.get('type', 'learning_analytics')
+    options = data.get('options') or {}
+    if not isinstance(job_type, str):
+        return jsonify({'error': 'type must be a string'}), 400
+    if not isinstance(options, dict):
+        return jsonify({'error': 'options must be an object'}), 400
+
+    try:
+        job = job_runner.submit(job_type, options)
+    except (UnknownJobTypeError, InvalidJobOptionsError) as e:
+        return jsonify({'error': str(e)}), 400
+    except JobLimitError as e:
+        return jsonify({'error': str(e)}), 429
+
+    log_interaction('analytics_jobs', 'job_submitted', {'job_id': job['id'], 'job_type': job_type})
+    return jsonify(job), 202
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET', 'DELETE'])
+def job_status_api(job_id):
+    if request.method == 'DELETE':
+        job = job_runner.cancel(job_id)
+    else:
+        job = job_runner.get(job_id)
+
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+
 @app.route('/api/set-theme', methods=['POST'])
 def set_theme():
     data = request.get_json(silent=True)
@@ -0,0 +1,4 @@
+"""
+Algorithm Benchmarks
+Run a benchmark from the backend directory, e.g. python -m benchmarks.graph_search
+"""
@@ -0,0 +1,69 @@
+"""
+Union-Find, MST and Topological Sort Scaling Benchmark
+Author: Aryan Pravin Sahu
+
+Times the untraced connected components, Kruskal, Prim and topological sort on
+weighted Erdos-Renyi graphs of growing size. A roughly constant time per edge
+across sizes is the near-linear scaling these data structures buy.
+Run from the backend directory:
+
+    python -m benchmarks.graph_algorithms [--sizes 10000 100000 1000000] [--degree 4] [--seed 1]
+"""
+
+import argparse
+import time
+
+from algorithms.graphs.csr_graph import CSRGraph
+from algorithms.graphs.generators import erdos_renyi
+from algorithms.graphs.minimum_spanning_tree import kruskal, prim
+from algorithms.graphs.topological_sort import topological_sort
+from algorithms.graphs.union_find import connected_components
+
+
+def random_dag(csr):
+    """Orient every edge from the lower to the higher vertex id, which cannot form a cycle"""
+    us, vs, weights = csr.undirected_edges()
+    return CSRGraph.from_edges(csr.num_vertices, us, vs, weights, directed=True, dedupe=False)
+
+
+def run_benchmark(sizes=(10000, 100000, 1000000), average_degree=4.0, seed=1):
+    rows = []
+    for size in sizes:
+        graph = erdos_renyi(size, average_degree, seed=seed, weighted=True)
+        dag = random_dag(graph)
+        edges = graph.num_edges // 2
+        methods = {
+            'connected components': lambda: connected_components(graph),
+            'kruskal': lambda: kruskal(graph),
+            'prim': lambda: prim(graph, 0),
+            'topological sort': lambda: topological_sort(dag),
+        }
+        for name, method in methods.items():
+            started = time.perf_counter()
+            method()
+            elapsed = time.perf_counter() - started
+            rows.append({
+                'vertices': size,
+                'edges': edges,
+                'method': name,
+                'seconds': elapsed,
+                'ns_per_edge': elapsed / max(edges, 1) * 1e9
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--degree', type=float, default=4.0)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'vertices':>10}{'edges':>10}  {'method':<22}{'seconds':>10}{'ns/edge':>10}")
+    for row in run_benchmark(args.sizes, args.degree, args.seed):
+        print(f"{row['vertices']:>10}{row['edges']:>10}  {row['method']:<22}"
+              f"{row['seconds']:>10.3f}{row['ns_per_edge']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Graph Scaling Benchmark over the Synthetic Generators
+Author: Aryan Pravin Sahu
+
+For every generator family and size, reports the time to generate the CSR graph,
+run a level-synchronous BFS and a full untraced Dijkstra from vertex 0.
+Run from the backend directory:
+
+    python -m benchmarks.graph_scaling [--sizes 10000 100000 1000000] [--kinds grid tree] [--seed 1]
+"""
+
+import argparse
+import time
+
+from algorithms.graphs.frontier_bfs import level_synchronous_bfs
+from algorithms.graphs.generators import GENERATORS, generate_graph
+from algorithms.graphs.point_to_point import dijkstra_point_to_point
+
+
+def profile_graph(kind, num_vertices, seed=None, weighted=True, shortest_paths=True):
+    """Generate one graph and time BFS (and optionally Dijkstra) on it"""
+    started = time.perf_counter()
+    csr, _ = generate_graph(kind, num_vertices, seed=seed, weighted=weighted)
+    generated = time.perf_counter()
+    bfs = level_synchronous_bfs(csr, 0)
+    searched = time.perf_counter()
+
+    row = {
+        'kind': kind,
+        'vertices': csr.num_vertices,
+        'edges': csr.num_edges,
+        'reached': int(bfs['order'].size),
+        'depth': len(bfs['level_sizes']) - 1,
+        'generate_seconds': generated - started,
+        'bfs_seconds': searched - generated,
+        'dijkstra_seconds': None
+    }
+    if shortest_paths:
+        dijkstra_point_to_point(csr, 0, csr.num_vertices - 1, stop_at_target=False)
+        row['dijkstra_seconds'] = time.perf_counter() - searched
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--kinds', nargs='+', default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--skip-dijkstra', action='store_true')
+    args = parser.parse_args()
+
+    print(f"{'kind':<18}{'vertices':>10}{'edges':>11}{'reached':>10}{'depth':>7}"
+          f"{'generate':>10}{'bfs':>9}{'dijkstra':>10}")
+    for kind in args.kinds:
+        for size in args.sizes:
+            row = profile_graph(kind, size, args.seed, shortest_paths=not args.skip_dijkstra)
+            dijkstra = f"{row['dijkstra_seconds']:>10.3f}" if row['dijkstra_seconds'] is not None else f"{'-':>10}"
+            print(f"{row['kind']:<18}{row['vertices']:>10}{row['edges']:>11}{row['reached']:>10}{row['depth']:>7}"
+                  f"{row['generate_seconds']:>10.3f}{row['bfs_seconds']:>9.3f}{dijkstra}")
+
+
+if __name__ == "__main__":
+    main()
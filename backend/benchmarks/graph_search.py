@@ -0,0 +1,71 @@
+"""
+Point-to-Point Search Benchmark: Dijkstra vs A* vs Bidirectional Dijkstra
+Author: Aryan Pravin Sahu
+
+Runs every search on grid/maze graphs up to 1000 x 1000 cells and reports the
+number of nodes expanded and the wall time. Run from the backend directory:
+
+    python -m benchmarks.graph_search [--sizes 100 300 1000] [--obstacles 0.2] [--seed 7]
+"""
+
+import argparse
+import time
+
+from algorithms.graphs.generators import grid_graph
+from algorithms.graphs.point_to_point import (
+    astar, bidirectional_dijkstra, dijkstra_point_to_point, make_heuristic
+)
+
+
+def _timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def run_benchmark(sizes=(100, 300, 1000), obstacle_ratio=0.2, seed=7):
+    """Benchmark corner-to-corner queries; returns one row per (size, method)"""
+    rows = []
+    for size in sizes:
+        csr, coordinates = grid_graph(size, size, obstacle_ratio, seed)
+        source, target = 0, size * size - 1
+        methods = {
+            'dijkstra (full)': lambda: dijkstra_point_to_point(csr, source, target, stop_at_target=False),
+            'dijkstra (early exit)': lambda: dijkstra_point_to_point(csr, source, target),
+            'astar (manhattan)': lambda: astar(csr, source, target,
+                                               make_heuristic('manhattan', coordinates, target)),
+            'bidirectional dijkstra': lambda: bidirectional_dijkstra(csr, source, target),
+        }
+
+        distances = set()
+        for name, method in methods.items():
+            (distance, path, expanded), elapsed = _timed(method)
+            distances.add(distance)
+            rows.append({
+                'cells': size * size,
+                'method': name,
+                'distance': distance,
+                'path_length': len(path),
+                'nodes_expanded': expanded,
+                'seconds': elapsed
+            })
+        if len(distances) != 1:
+            raise AssertionError(f'Methods disagree on the {size}x{size} grid: {sorted(distances)}')
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 300, 1000])
+    parser.add_argument('--obstacles', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'cells':>9}  {'method':<24}{'distance':>10}{'expanded':>11}{'seconds':>10}")
+    for row in run_benchmark(args.sizes, args.obstacles, args.seed):
+        print(f"{row['cells']:>9}  {row['method']:<24}{row['distance']:>10g}"
+              f"{row['nodes_expanded']:>11}{row['seconds']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Binary vs 4-ary Heap Benchmark
+Author: Aryan Pravin Sahu
+
+Runs the same workloads on IndexedMinHeap and the in-place heap routines with
+arity 2 and 4: n pushes followed by n pops, an O(n) heapify, heap sort, and a
+decrease-key heavy Dijkstra over a weighted Erdos-Renyi graph. A 4-ary heap
+halves the depth, so sift-ups (push, decrease-key) get cheaper while each
+sift-down compares up to three more children per level.
+Run from the backend directory:
+
+    python -m benchmarks.heap_arity [--sizes 10000 100000 1000000] [--arities 2 4] [--degree 8] [--seed 1]
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.data_structures.priority_queue import IndexedMinHeap
+from algorithms.graphs.generators import erdos_renyi
+from algorithms.graphs.point_to_point import dijkstra_point_to_point
+from algorithms.sorting.heap_sort import heap_sort
+
+
+def push_pop(priorities, arity):
+    heap = IndexedMinHeap(len(priorities), arity)
+    for key, priority in enumerate(priorities):
+        heap.push(key, priority)
+    while heap:
+        heap.pop()
+
+
+def bulk_heapify(priorities, arity):
+    IndexedMinHeap(len(priorities), arity).heapify(enumerate(priorities))
+
+
+def timed(run):
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+def run_benchmark(sizes=(10000, 100000, 1000000), arities=(2, 4), average_degree=8.0, seed=1):
+    rows = []
+    for size in sizes:
+        rng = random.Random(seed)
+        priorities = [rng.random() for _ in range(size)]
+        graph = erdos_renyi(size, average_degree, seed=seed, weighted=True)
+        for arity in arities:
+            workloads = {
+                'push+pop': (lambda: push_pop(priorities, arity), 2 * size),
+                'heapify': (lambda: bulk_heapify(priorities, arity), size),
+                'heap sort': (lambda: heap_sort(priorities, arity), size),
+                'dijkstra': (lambda: dijkstra_point_to_point(graph, 0, size - 1, stop_at_target=False,
+                                                             arity=arity), graph.num_edges),
+            }
+            for name, (run, operations) in workloads.items():
+                seconds = timed(run)
+                rows.append({
+                    'size': size,
+                    'arity': arity,
+                    'workload': name,
+                    'seconds': seconds,
+                    'ns_per_op': seconds / operations * 1e9
+                })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--arities', type=int, nargs='+', default=[2, 4])
+    parser.add_argument('--degree', type=float, default=8.0)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    header = f"{'size':>9} {'arity':>6} {'workload':>10} {'seconds':>9} {'ns/op':>9}"
+    print(header)
+    print('-' * len(header))
+    for row in run_benchmark(args.sizes, args.arities, args.degree, args.seed):
+        print(f"{row['size']:>9} {row['arity']:>6} {row['workload']:>10} "
+              f"{row['seconds']:>9.3f} {row['ns_per_op']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Plain BST vs AVL vs Red-Black Benchmark
+Author: Aryan Pravin Sahu
+
+Builds each tree from sorted, random and adversarial (zig-zag) key orders, then
+searches every key once. Reports final height, comparisons per operation and
+time per operation. Sorted and zig-zag input degrade the plain BST to a linked
+list (height n, O(n) per operation), while both balanced trees stay logarithmic.
+Run from the backend directory:
+
+    python -m benchmarks.tree_balance [--sizes 1000 5000 20000] [--seed 1]
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.trees.avl_tree import AVLTree
+from algorithms.trees.binary_search_tree import BinarySearchTree
+from algorithms.trees.red_black_tree import RedBlackTree
+
+TREES = {
+    'bst': BinarySearchTree,
+    'avl': AVLTree,
+    'red_black': RedBlackTree,
+}
+
+
+def zigzag(size):
+    """0, n-1, 1, n-2, ...: every insert lands at the bottom of one long alternating path"""
+    keys = []
+    low, high = 0, size - 1
+    while low <= high:
+        keys.append(low)
+        if low != high:
+            keys.append(high)
+        low, high = low + 1, high - 1
+    return keys
+
+
+def input_orders(size, seed):
+    shuffled = list(range(size))
+    random.Random(seed).shuffle(shuffled)
+    return {
+        'sorted': list(range(size)),
+        'random': shuffled,
+        'zigzag': zigzag(size),
+    }
+
+
+def run_benchmark(sizes=(1000, 5000, 20000), seed=1):
+    rows = []
+    for size in sizes:
+        for order, keys in input_orders(size, seed).items():
+            for name, cls in TREES.items():
+                tree = cls()
+                started = time.perf_counter()
+                for key in keys:
+                    tree.insert(key)
+                insert_seconds = time.perf_counter() - started
+                insert_comparisons = tree.comparisons
+
+                tree.comparisons = 0
+                started = time.perf_counter()
+                for key in keys:
+                    tree.search(key)
+                search_seconds = time.perf_counter() - started
+
+                rows.append({
+                    'size': size,
+                    'order': order,
+                    'tree': name,
+                    'height': tree.height(),
+                    'insert_comparisons': insert_comparisons / size,
+                    'insert_us': insert_seconds / size * 1e6,
+                    'search_comparisons': tree.comparisons / size,
+                    'search_us': search_seconds / size * 1e6,
+                    'rotations': getattr(tree, 'rotations', 0)
+                })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    header = (f"{'size':>7} {'order':>7} {'tree':>10} {'height':>7} {'ins cmp/op':>11} "
+              f"{'ins us/op':>10} {'find cmp/op':>12} {'find us/op':>11} {'rotations':>10}")
+    print(header)
+    print('-' * len(header))
+    for row in run_benchmark(args.sizes, args.seed):
+        print(f"{row['size']:>7} {row['order']:>7} {row['tree']:>10} {row['height']:>7} "
+              f"{row['insert_comparisons']:>11.1f} {row['insert_us']:>10.2f} "
+              f"{row['search_comparisons']:>12.1f} {row['search_us']:>11.2f} {row['rotations']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Background Analytics Job Runner
+Runs the ML pipelines in separate processes so request workers never block on them
+Author: Aryan Pravin Sahu
+"""
+
+import fcntl
+import json
+import os
+import re
+import signal
+import sys
+import threading
+import traceback
+import uuid
+import multiprocessing
+from contextlib import contextmanager
+from datetime import datetime
+
+FINISHED_STATUSES = ('succeeded', 'failed', 'cancelled')
+JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{12}$')
+
+
+class JobLimitError(Exception):
+    """Raised when the concurrent job limit has been reached"""
+
+
+class UnknownJobTypeError(Exception):
+    """Raised when submitting a job type that has no registered pipeline"""
+
+
+class InvalidJobOptionsError(Exception):
+    """Raised when a job's options fail validation"""
+
+
+def _validate_learning_analytics_options(options):
+    workers = options.get('workers', 1)
+    max_workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or isinstance(workers, bool) or not 1 <= workers <= max_workers:
+        raise InvalidJobOptionsError(f'workers must be an integer between 1 and {max_workers}')
+    if not isinstance(options.get('incremental', True), bool):
+        raise InvalidJobOptionsError('incremental must be true or false')
+
+
+def _run_learning_analytics(options):
+    from ml.learning_analytics import LearningAnalytics
+
+    analytics = LearningAnalytics(
+        interactions_file='data/interactions.json',
+        output_file='data/learning_analytics.json',
+        state_file='data/learning_analytics_state.json'
+    )
+    workers = options.get('workers', 1)
+    if options.get('incremental', True):
+        results = analytics.run_incremental_pipeline(workers=workers)
+    else:
+        results = analytics.run_analytics_pipeline(workers=workers)
+
+    return {
+        'users_analyzed': len(results or {}),
+        'output_file': analytics.output_file
+    }
+
+
+def _run_user_modeling(options):
+    from ml.user_modeling import UserBehaviorModeler
+
+    modeler = UserBehaviorModeler(interactions_file='data/interactions.json')
+    results = modeler.run_complete_analysis()
+    profiles = results.get('user_profiles', {}) if isinstance(results, dict) else {}
+
+    return {
+        'user_profiles': len(profiles),
+        'output_file': 'data/user_profiles.json'
+    }
+
+
+# Job type -> pipeline function run inside the job process
+JOB_TYPES = {
+    'learning_analytics': _run_learning_analytics,
+    'user_modeling': _run_user_modeling
+}
+
+# Job type -> options check run before the job is started
+JOB_OPTION_VALIDATORS = {
+    'learning_analytics': _validate_learning_analytics_options
+}
+
+
+def _write_json_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def _terminate_group(pid):
+    """SIGTERM a job's process group (the job and its pool workers), or just the pid
+    if the job has not become a group leader yet"""
+    try:
+        os.killpg(pid, signal.SIGTERM)
+        return
+    except (ProcessLookupError, PermissionError):
+        pass
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+class _JobOutput:
+    """stdout replacement inside a job: appends to the job log and tracks the latest message"""
+
+    def __init__(self, runner, job_id, log_file):
+        self.runner = runner
+        self.job_id = job_id
+        self.log_file = log_file
+        self.buffer = ''
+
+    def write(self, text):
+        self.log_file.write(text)
+        self.buffer += text
+        while '\n' in self.buffer:
+            line, self.buffer = self.buffer.split('\n', 1)
+            if line.strip():
+                self.runner._update(self.job_id, message=line.strip())
+        return len(text)
+
+    def flush(self):
+        self.log_file.flush()
+
+
+def _job_process_main(jobs_dir, working_dir, job_id, job_type, options):
+    """Entry point of the job process"""
+    # Lead a new process group so cancel can signal the job together with its pool workers
+    os.setsid()
+    runner = JobRunner(jobs_dir, working_dir)
+
+    # Stay out of the way of request-serving processes
+    if hasattr(os, 'nice'):
+        try:
+            os.nice(10)
+        except OSError:
+            pass
+
+    def handle_cancel(signum, frame):
+        runner._update(job_id, status='cancelled', finished_at=datetime.now().isoformat(),
+                       message='Job cancelled')
+        os._exit(1)
+
+    signal.signal(signal.SIGTERM, handle_cancel)
+
+    os.chdir(working_dir)
+    with open(runner._log_path(job_id), 'a') as log_file:
+        sys.stdout = sys.stderr = _JobOutput(runner, job_id, log_file)
+        try:
+            result = JOB_TYPES[job_type](options)
+            runner._update(job_id, status='succeeded', finished_at=datetime.now().isoformat(),
+                           result=result, message='Job completed')
+        except Exception as e:
+            log_file.write(traceback.format_exc())
+            runner._update(job_id, status='failed', finished_at=datetime.now().isoformat(),
+                           error=str(e), message='Job failed')
+
+
+class JobRunner:
+    """
+    Submits analytics pipelines as separate processes and tracks them on disk.
+    Job state lives in one JSON file per job, so any app worker can answer
+    status polls and cancel requests regardless of which worker started the job.
+    """
+
+    def __init__(self, jobs_dir, working_dir, max_concurrent_jobs=1):
+        self.jobs_dir = jobs_dir
+        self.working_dir = working_dir
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self._processes = {}
+        self._thread_lock = threading.RLock()
+        self._lock_file = None
+        self._lock_depth = 0
+
+    @contextmanager
+    def _locked(self):
+        """
+        Exclusive flock on the jobs directory, shared by every app worker and job
+        process. Re-entrant within a process, so locked helpers can call each other.
+        """
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                os.makedirs(self.jobs_dir, exist_ok=True)
+                self._lock_file = open(os.path.join(self.jobs_dir, '.lock'), 'a')
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def submit(self, job_type, options=None):
+        """Start a job process and return its initial record"""
+        if not isinstance(job_type, str) or job_type not in JOB_TYPES:
+            raise UnknownJobTypeError(f"Unknown job type {job_type!r}")
+        options = options or {}
+        if not isinstance(options, dict):
+            raise InvalidJobOptionsError('options must be an object')
+        if job_type in JOB_OPTION_VALIDATORS:
+            JOB_OPTION_VALIDATORS[job_type](options)
+
+        self._reap()
+        # Count and spawn under the lock so concurrent app workers cannot all pass the limit
+        with self._locked():
+            return self._start(job_type, options)
+
+    def _start(self, job_type, options):
+        if len(self.running_jobs()) >= self.max_concurrent_jobs:
+            raise JobLimitError(f"At most {self.max_concurrent_jobs} analytics job(s) may run at once")
+
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            'id': job_id,
+            'type': job_type,
+            'options': options,
+            'status': 'running',
+            'message': 'Starting job',
+            'pid': None,
+            'submitted_at': datetime.now().isoformat(),
+            'finished_at': None,
+            'result': None,
+            'error': None
+        }
+        _write_json_atomic(self._job_path(job_id), job)
+
+        # spawn: never fork a multi-threaded server process
+        context = multiprocessing.get_context('spawn')
+        process = context.Process(
+            target=_job_process_main,
+            args=(self.jobs_dir, self.working_dir, job_id, job_type, options),
+            daemon=False
+        )
+        process.start()
+        self._processes[job_id] = process
+
+        return self._update(job_id, pid=process.pid)
+
+    def get(self, job_id):
+        """Return a job record, or None if the id is unknown"""
+        if not JOB_ID_PATTERN.match(job_id or ''):
+            return None
+        self._reap()
+        try:
+            with open(self._job_path(job_id), 'r') as f:
+                job = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # A job process that died without reporting back has failed
+        if job['status'] == 'running' and job['pid'] and not self._is_alive(job_id, job['pid']):
+            job = self._update(job_id, status='failed', finished_at=datetime.now().isoformat(),
+                               error='Job process exited unexpectedly')
+        return job
+
+    def list_jobs(self):
+        """All known jobs, most recent first"""
+        if not os.path.isdir(self.jobs_dir):
+            return []
+        jobs = [self.get(name[:-5]) for name in os.listdir(self.jobs_dir) if name.endswith('.json')]
+        return sorted((job for job in jobs if job), key=lambda job: job['submitted_at'], reverse=True)
+
+    def running_jobs(self):
+        return [job for job in self.list_jobs() if job['status'] == 'running']
+
+    def cancel(self, job_id):
+        """Terminate a running job; returns the updated record or None if unknown"""
+        job = self.get(job_id)
+        if job is None or job['status'] in FINISHED_STATUSES:
+            return job
+
+        if job['pid']:
+            _terminate_group(job['pid'])
+        process = self._processes.pop(job_id, None)
+        if process is not None:
+            process.join(timeout=5)
+        self._reap()
+
+        # The job's SIGTERM handler normally records the cancellation itself
+        return self._update(job_id, status='cancelled', finished_at=datetime.now().isoformat(),
+                            message='Job cancelled')
+
+    def _is_alive(self, job_id, pid):
+        process = self._processes.get(job_id)
+        if process is not None:
+            return process.is_alive()
+        return _pid_alive(pid)
+
+    def _reap(self):
+        """Join finished job processes started by this app worker"""
+        for job_id, process in list(self._processes.items()):
+            if not process.is_alive():
+                process.join()
+                del self._processes[job_id]
+
+    def _update(self, job_id, **changes):
+        path = self._job_path(job_id)
+        with self._locked():
+            with open(path, 'r') as f:
+                job = json.load(f)
+            # Never overwrite a final status (e.g. a late progress line after cancel)
+            if job['status'] in FINISHED_STATUSES:
+                return job
+            job.update(changes)
+            _write_json_atomic(path, job)
+            return job
+
+    def _job_path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _log_path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.log")
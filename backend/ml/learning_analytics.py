@@ -4,25 +4,170 @@ Analyzes user learning patterns, progress tracking, and knowledge retention
 """
 
 import json
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, Counter
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error
 import warnings
 warnings.filterwarnings('ignore')
 
+# Session segmentation parameters
+SESSION_GAP_MINUTES = 30
+SESSION_GAP_MICROS = SESSION_GAP_MINUTES * 60 * 1_000_000
+MIN_SESSION_INTERACTIONS = 2
+IGNORED_ALGORITHMS = ('general', 'homepage')
+
+# Action substrings in match priority order (first match wins)
+ACTION_CATEGORIES = (
+    'visualization_started',
+    'visualization_completed',
+    'visualization_stopped',
+    'theme_changed',
+    'reset',
+    'custom_array_used'
+)
+
+def _classify_action(action):
+    """Return the ACTION_CATEGORIES index an action counts towards, or None"""
+    for index, marker in enumerate(ACTION_CATEGORIES):
+        if marker in action:
+            return index
+    return None
+
+
+# (report key, session key) pairs tracked by the learning curve
+LEARNING_CURVE_METRICS = (
+    ('completion_rate', 'completion_rate'),
+    ('engagement', 'engagement_score'),
+    ('focus', 'focus_score')
+)
+
+
+def batched_linear_fit(xs, ys):
+    """
+    Closed-form least squares y = slope * x + intercept for many ragged series at once.
+    Series are concatenated and reduced per series with bincount, so no padding is needed.
+    Returns (slopes, intercepts, r_squared) arrays matching LinearRegression fit/score.
+    """
+    if len(xs) == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+    
+    lengths = np.fromiter(map(len, xs), dtype=np.int64, count=len(xs))
+    series = np.repeat(np.arange(len(xs)), lengths)
+    x = np.concatenate(xs).astype(float)
+    y = np.concatenate(ys).astype(float)
+    counts = np.maximum(lengths, 1)
+    
+    x_mean = np.bincount(series, weights=x, minlength=len(xs)) / counts
+    y_mean = np.bincount(series, weights=y, minlength=len(xs)) / counts
+    dx = x - x_mean[series]
+    dy = y - y_mean[series]
+    
+    sxx = np.bincount(series, weights=dx * dx, minlength=len(xs))
+    sxy = np.bincount(series, weights=dx * dy, minlength=len(xs))
+    syy = np.bincount(series, weights=dy * dy, minlength=len(xs))
+    
+    slopes = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx > 0)
+    intercepts = y_mean - slopes * x_mean
+    
+    residuals = dy - slopes[series] * dx
+    ss_res = np.bincount(series, weights=residuals * residuals, minlength=len(xs))
+    # Constant targets score 1.0 when fitted exactly, else 0.0 (as sklearn's r2_score)
+    r_squared = np.where(syy > 0, 1 - ss_res / np.where(syy > 0, syy, 1),
+                         np.where(ss_res == 0, 1.0, 0.0))
+    
+    return slopes, intercepts, r_squared
+
+
+# Incremental checkpoint format
+STATE_VERSION = 1
+
+
+def _empty_state():
+    return {'version': STATE_VERSION, 'offset': 0, 'last_run': None, 'skipped_lines': 0, 'users': {}}
+
+
+def _serialize_session(session):
+    return dict(session, start_time=session['start_time'].isoformat(),
+                end_time=session['end_time'].isoformat())
+
+
+def _deserialize_session(session):
+    return dict(session, start_time=datetime.fromisoformat(session['start_time']),
+                end_time=datetime.fromisoformat(session['end_time']))
+
+
+def _serialize_interaction(interaction):
+    """Keep only the fields session analysis reads"""
+    return {
+        'timestamp': interaction['timestamp'].isoformat(),
+        'action': interaction.get('action', ''),
+        'algorithm': interaction.get('algorithm', '')
+    }
+
+
+def _deserialize_interaction(interaction):
+    return dict(interaction, timestamp=datetime.fromisoformat(interaction['timestamp']))
+
+
+def _curve_parameters(report):
+    """Fitted learning and forgetting curve parameters of a progress report, as plain floats"""
+    learning = {
+        metric: {field: float(fit[field]) for field in ('slope', 'intercept', 'r_squared')}
+        for metric, fit in (report['learning_curve'] or {}).items()
+    }
+    forgetting = {
+        algorithm: {field: float(value) for field, value in entry['forgetting_curve'].items()}
+        for algorithm, entry in (report['knowledge_retention'] or {}).items()
+        if entry['forgetting_curve']
+    }
+    return {'learning_curve': learning, 'forgetting_curves': forgetting}
+
+
+def _write_json_atomic(path, data, **kwargs):
+    """Write JSON to a temp file and swap it in, so readers never see a partial file"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, default=str, **kwargs)
+    os.replace(tmp_path, path)
+
+
+# Analytics instance shared read-only with pool workers (inherited on fork)
+_worker_analytics = None
+
+
+def _init_report_worker(analytics):
+    """Pool initializer: keep the parent's session data for the worker's lifetime"""
+    global _worker_analytics
+    _worker_analytics = analytics
+
+
+def _report_batch(user_ids):
+    """Generate progress reports for one chunk of users inside a worker"""
+    return [(user_id, _worker_analytics.generate_progress_report(user_id)) for user_id in user_ids]
+
+
 class LearningAnalytics:
     """
     Advanced learning analytics system for tracking user progress and learning patterns
     """
     
-    def __init__(self, interactions_file='data/interactions.json'):
+    def __init__(self, interactions_file='data/interactions.json',
+                 output_file='data/learning_analytics.json',
+                 state_file='data/learning_analytics_state.json'):
         self.interactions_file = interactions_file
+        self.output_file = output_file
+        self.state_file = state_file
         self.learning_sessions = {}
         self.progress_metrics = {}
         self.knowledge_retention = {}
+        self._learning_curve_cache = {}
+        self._retention_cache = {}
         
     def load_interactions(self):
         """Load and parse interaction data"""
@@ -44,8 +189,12 @@ class LearningAnalytics:
             print(f"Error loading interactions: {e}")
             return []
     
-    def extract_learning_sessions(self, interactions):
+    def extract_learning_sessions(self, interactions, columnar=True):
         """Extract and analyze individual learning sessions"""
+        if columnar:
+            self.learning_sessions.update(self._segment_sessions_columnar(interactions))
+            return self.learning_sessions
+        
         sessions = defaultdict(list)
         
         for interaction in interactions:
@@ -71,15 +220,15 @@ class LearningAnalytics:
                        interactions[i-1]['timestamp']).total_seconds() / 60
             
             # Start new session if gap > 30 minutes
-            if time_gap > 30:
-                if len(current_session) > 2:  # Only keep substantial sessions
+            if time_gap > SESSION_GAP_MINUTES:
+                if len(current_session) > MIN_SESSION_INTERACTIONS:  # Only keep substantial sessions
                     sessions.append(self._analyze_session(current_session))
                 current_session = [interactions[i]]
             else:
                 current_session.append(interactions[i])
         
         # Add final session
-        if len(current_session) > 2:
+        if len(current_session) > MIN_SESSION_INTERACTIONS:
             sessions.append(self._analyze_session(current_session))
         
         return sessions
@@ -88,47 +237,114 @@ class LearningAnalytics:
         """Analyze individual learning session"""
         start_time = session_interactions[0]['timestamp']
         end_time = session_interactions[-1]['timestamp']
-        duration = (end_time - start_time).total_seconds() / 60
         
         # Extract session metrics
         algorithms_used = set()
-        visualizations_started = 0
-        visualizations_completed = 0
-        visualizations_stopped = 0
-        theme_changes = 0
-        resets = 0
-        custom_arrays = 0
+        counts = [0] * len(ACTION_CATEGORIES)
         
         for interaction in session_interactions:
             action = interaction.get('action', '')
             algorithm = interaction.get('algorithm', '')
             
-            if algorithm and algorithm not in ['general', 'homepage']:
+            if algorithm and algorithm not in IGNORED_ALGORITHMS:
                 algorithms_used.add(algorithm)
             
-            if 'visualization_started' in action:
-                visualizations_started += 1
-            elif 'visualization_completed' in action:
-                visualizations_completed += 1
-            elif 'visualization_stopped' in action:
-                visualizations_stopped += 1
-            elif 'theme_changed' in action:
-                theme_changes += 1
-            elif 'reset' in action:
-                resets += 1
-            elif 'custom_array_used' in action:
-                custom_arrays += 1
+            category = _classify_action(action)
+            if category is not None:
+                counts[category] += 1
+        
+        return self._build_session_record(start_time, end_time, len(session_interactions),
+                                          algorithms_used, counts)
+    
+    def _segment_sessions_columnar(self, interactions):
+        """
+        Segment every user's interactions in one pass over contiguous arrays.
+        Produces the same session records as _segment_sessions/_analyze_session.
+        """
+        if not interactions:
+            return {}
+        
+        # Single Python pass to turn the records into integer-coded columns
+        user_index, action_index, algorithm_index = {}, {}, {}
+        timestamps, users, actions, algorithms = [], [], [], []
+        
+        for interaction in interactions:
+            timestamps.append(interaction['timestamp'])
+            user = interaction.get('ip_address', 'anonymous')
+            action = interaction.get('action', '') or ''
+            algorithm = interaction.get('algorithm', '')
+            users.append(user_index.setdefault(user, len(user_index)))
+            actions.append(action_index.setdefault(action, len(action_index)))
+            algorithms.append(algorithm_index.setdefault(algorithm, len(algorithm_index)))
+        
+        n = len(timestamps)
+        user_codes = np.array(users, dtype=np.int64)
+        action_codes = np.array(actions, dtype=np.int64)
+        algorithm_codes = np.array(algorithms, dtype=np.int64)
+        
+        # Integer microseconds keep the gap comparison exact
+        aware = timestamps[0].tzinfo is not None
+        micros = pd.to_datetime(timestamps, utc=aware).as_unit('us').asi8
+        
+        # Classify each distinct action/algorithm once, then broadcast by code
+        no_category = len(ACTION_CATEGORIES)
+        action_categories = np.array([
+            no_category if category is None else category
+            for category in map(_classify_action, action_index)
+        ], dtype=np.int64)
+        algorithm_names = np.array(list(algorithm_index), dtype=object)
+        algorithm_valid = np.array([bool(a) and a not in IGNORED_ALGORITHMS for a in algorithm_index])
+        
+        # Stable group by user keeps each user's interactions in their original order
+        order = np.argsort(user_codes, kind='stable')
+        users = user_codes[order]
+        times = micros[order]
+        categories = action_categories[action_codes[order]]
+        algorithms = algorithm_codes[order]
+        
+        # A session starts at each user change or at a gap longer than the threshold
+        starts_session = np.ones(n, dtype=bool)
+        starts_session[1:] = (users[1:] != users[:-1]) | (np.diff(times) > SESSION_GAP_MICROS)
+        bounds = np.flatnonzero(starts_session)
+        ends = np.append(bounds[1:], n)
+        session_ids = np.cumsum(starts_session) - 1
+        
+        # Vectorised per-session categorical action counts
+        counts = np.bincount(session_ids * (no_category + 1) + categories,
+                             minlength=len(bounds) * (no_category + 1))
+        counts = counts.reshape(len(bounds), no_category + 1)[:, :no_category]
+        
+        user_ids = list(user_index)
+        results = {user_id: [] for user_id in user_ids}
+        keep = np.flatnonzero(ends - bounds > MIN_SESSION_INTERACTIONS)
+        
+        for s in keep:
+            start, end = bounds[s], ends[s]
+            segment = algorithms[start:end]
+            algorithms_used = set(algorithm_names[segment[algorithm_valid[segment]]])
+            results[user_ids[users[start]]].append(self._build_session_record(
+                timestamps[order[start]], timestamps[order[end - 1]], int(end - start),
+                algorithms_used, counts[s].tolist()
+            ))
+        
+        return results
+    
+    def _build_session_record(self, start_time, end_time, total_interactions, algorithms_used, counts):
+        """Build the session metrics record from per-category action counts"""
+        duration = (end_time - start_time).total_seconds() / 60
+        (visualizations_started, visualizations_completed, visualizations_stopped,
+         theme_changes, resets, custom_arrays) = counts
         
         # Calculate learning efficiency metrics
         completion_rate = visualizations_completed / max(visualizations_started, 1)
-        engagement_score = len(session_interactions) / max(duration, 1)
-        focus_score = 1 - (resets / max(len(session_interactions), 1))
+        engagement_score = total_interactions / max(duration, 1)
+        focus_score = 1 - (resets / max(total_interactions, 1))
         
         return {
             'start_time': start_time,
             'end_time': end_time,
             'duration_minutes': duration,
-            'total_interactions': len(session_interactions),
+            'total_interactions': total_interactions,
             'algorithms_explored': len(algorithms_used),
             'algorithms_list': list(algorithms_used),
             'visualizations_started': visualizations_started,
@@ -144,50 +360,89 @@ class LearningAnalytics:
     
     def calculate_learning_curve(self, user_id):
         """Calculate learning curve progression for a user"""
+        if user_id in self._learning_curve_cache:
+            return self._learning_curve_cache[user_id]
         if user_id not in self.learning_sessions:
             return None
-        
-        sessions = self.learning_sessions[user_id]
-        if len(sessions) < 3:
-            return None
-        
-        # Extract progression metrics
-        session_numbers = list(range(1, len(sessions) + 1))
-        completion_rates = [s['completion_rate'] for s in sessions]
-        engagement_scores = [s['engagement_score'] for s in sessions]
-        focus_scores = [s['focus_score'] for s in sessions]
-        
-        # Fit learning curves
+        return self.calculate_learning_curves([user_id])[user_id]
+    
+    def calculate_learning_curves(self, user_ids):
+        """Fit every metric's learning curve for many users in one batched regression"""
         curves = {}
+        series_keys, xs, ys = [], [], []
         
-        for metric_name, metric_values in [
-            ('completion_rate', completion_rates),
-            ('engagement', engagement_scores),
-            ('focus', focus_scores)
-        ]:
-            if len(set(metric_values)) > 1:  # Only if there's variation
-                model = LinearRegression()
-                X = np.array(session_numbers).reshape(-1, 1)
-                y = np.array(metric_values)
-                
-                model.fit(X, y)
-                
-                curves[metric_name] = {
-                    'slope': model.coef_[0],
-                    'intercept': model.intercept_,
-                    'trend': 'improving' if model.coef_[0] > 0.01 else 
-                            'declining' if model.coef_[0] < -0.01 else 'stable',
-                    'r_squared': model.score(X, y),
-                    'predicted_next': model.predict([[len(sessions) + 1]])[0]
-                }
+        for user_id in user_ids:
+            sessions = self.learning_sessions.get(user_id)
+            if sessions is None or len(sessions) < 3:
+                curves[user_id] = None
+                continue
+            
+            curves[user_id] = {}
+            session_numbers = np.arange(1, len(sessions) + 1, dtype=float)
+            
+            for metric_name, session_key in LEARNING_CURVE_METRICS:
+                metric_values = [s[session_key] for s in sessions]
+                if len(set(metric_values)) > 1:  # Only if there's variation
+                    series_keys.append((user_id, metric_name, len(sessions)))
+                    xs.append(session_numbers)
+                    ys.append(metric_values)
+        
+        slopes, intercepts, r_squared = batched_linear_fit(xs, ys)
+        
+        for (user_id, metric_name, session_count), slope, intercept, r2 in zip(
+                series_keys, slopes, intercepts, r_squared):
+            curves[user_id][metric_name] = {
+                'slope': slope,
+                'intercept': intercept,
+                'trend': 'improving' if slope > 0.01 else 
+                        'declining' if slope < -0.01 else 'stable',
+                'r_squared': r2,
+                'predicted_next': intercept + slope * (session_count + 1)
+            }
         
         return curves
     
     def analyze_knowledge_retention(self, user_id):
         """Analyze knowledge retention patterns"""
+        if user_id in self._retention_cache:
+            return self._retention_cache[user_id]
         if user_id not in self.learning_sessions:
             return None
+        return self.analyze_knowledge_retention_batch([user_id])[user_id]
+    
+    def analyze_knowledge_retention_batch(self, user_ids):
+        """Analyze retention for many users, fitting all forgetting curves in one batch"""
+        results = {}
+        pending = []
+        
+        for user_id in user_ids:
+            if user_id not in self.learning_sessions:
+                results[user_id] = None
+                continue
+            
+            results[user_id] = {}
+            for algorithm, (sessions_count, time_gaps, performance_changes) in \
+                    self._retention_series(user_id).items():
+                mean_change = np.mean(performance_changes)
+                results[user_id][algorithm] = {
+                    'sessions_count': sessions_count,
+                    'avg_gap_days': np.mean(time_gaps),
+                    'avg_performance_change': mean_change,
+                    'retention_strength': 'strong' if mean_change > 0 else
+                                        'weak' if mean_change < -0.1 else 'moderate',
+                    'forgetting_curve': None
+                }
+                if len(time_gaps) >= 3:
+                    pending.append((results[user_id][algorithm], time_gaps, performance_changes))
+        
+        curves = self._estimate_forgetting_curves([p[1] for p in pending], [p[2] for p in pending])
+        for (entry, _, _), curve in zip(pending, curves):
+            entry['forgetting_curve'] = curve
         
+        return results
+    
+    def _retention_series(self, user_id):
+        """Per-algorithm (sessions, gaps in days, performance changes) for a user"""
         sessions = self.learning_sessions[user_id]
         algorithm_performance = defaultdict(list)
         
@@ -200,8 +455,7 @@ class LearningAnalytics:
                     'focus_score': session['focus_score']
                 })
         
-        # Calculate retention metrics
-        retention_analysis = {}
+        series = {}
         
         for algorithm, performances in algorithm_performance.items():
             if len(performances) < 2:
@@ -230,40 +484,38 @@ class LearningAnalytics:
                     performance_changes.append(curr_perf - prev_perf)
             
             if time_gaps and performance_changes:
-                retention_analysis[algorithm] = {
-                    'sessions_count': len(performances),
-                    'avg_gap_days': np.mean(time_gaps),
-                    'avg_performance_change': np.mean(performance_changes),
-                    'retention_strength': 'strong' if np.mean(performance_changes) > 0 else
-                                        'weak' if np.mean(performance_changes) < -0.1 else 'moderate',
-                    'forgetting_curve': self._estimate_forgetting_curve(time_gaps, performance_changes)
-                }
+                series[algorithm] = (len(performances), time_gaps, performance_changes)
         
-        return retention_analysis
+        return series
     
     def _estimate_forgetting_curve(self, time_gaps, performance_changes):
         """Estimate forgetting curve parameters"""
         if len(time_gaps) < 3:
             return None
+        return self._estimate_forgetting_curves([time_gaps], [performance_changes])[0]
+    
+    def _estimate_forgetting_curves(self, time_gaps_list, performance_changes_list):
+        """Estimate forgetting curve parameters for many (gaps, changes) series at once"""
+        if not time_gaps_list:
+            return []
         
-        try:
-            # Simple exponential decay model
-            X = np.array(time_gaps).reshape(-1, 1)
-            y = np.array(performance_changes)
-            
-            # Transform for exponential model: log(abs(y) + 1)
-            y_transformed = np.log(np.abs(y) + 1) * np.sign(y)
-            
-            model = LinearRegression()
-            model.fit(X, y_transformed)
-            
-            return {
-                'decay_rate': -model.coef_[0] if model.coef_[0] < 0 else 0,
-                'half_life_days': np.log(2) / max(abs(model.coef_[0]), 0.001),
-                'initial_retention': model.intercept_
+        # Simple exponential decay model
+        # Transform for exponential model: log(abs(y) + 1)
+        transformed = [np.log(np.abs(y) + 1) * np.sign(y)
+                       for y in map(np.asarray, performance_changes_list)]
+        slopes, intercepts, _ = batched_linear_fit(time_gaps_list, transformed)
+        
+        decay_rates = np.where(slopes < 0, -slopes, 0)
+        half_lives = np.log(2) / np.maximum(np.abs(slopes), 0.001)
+        
+        return [
+            {
+                'decay_rate': decay_rate,
+                'half_life_days': half_life,
+                'initial_retention': intercept
             }
-        except:
-            return None
+            for decay_rate, half_life, intercept in zip(decay_rates, half_lives, intercepts)
+        ]
     
     def identify_learning_patterns(self, user_id):
         """Identify specific learning patterns and habits"""
@@ -422,8 +674,53 @@ class LearningAnalytics:
         
         return recommendations
     
-    def run_analytics_pipeline(self):
-        """Run complete learning analytics pipeline"""
+    def generate_progress_reports(self, user_ids, workers=1, chunk_size=None):
+        """
+        Generate progress reports for many users, optionally in a process pool.
+        Users are dispatched in chunks; with the fork start method the workers
+        share self.learning_sessions copy-on-write instead of receiving a pickled copy.
+        Results are merged in user_ids order regardless of completion order.
+        """
+        user_ids = list(user_ids)
+        
+        # Fit every user's regressions up front in one batch; workers inherit the results
+        self._learning_curve_cache = self.calculate_learning_curves(user_ids)
+        self._retention_cache = self.analyze_knowledge_retention_batch(user_ids)
+        try:
+            return self._generate_progress_reports(user_ids, workers, chunk_size)
+        finally:
+            self._learning_curve_cache = {}
+            self._retention_cache = {}
+    
+    def _generate_progress_reports(self, user_ids, workers, chunk_size):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(user_ids))
+        
+        if workers <= 1:
+            return {user_id: self.generate_progress_report(user_id) for user_id in user_ids}
+        
+        if chunk_size is None:
+            # A few chunks per worker balances uneven users without excess IPC
+            chunk_size = max(1, -(-len(user_ids) // (workers * 4)))
+        chunks = [user_ids[i:i + chunk_size] for i in range(0, len(user_ids), chunk_size)]
+        
+        start_methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in start_methods else None)
+        
+        reports = {}
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_report_worker, initargs=(self,)) as pool:
+            for batch in pool.map(_report_batch, chunks):
+                reports.update(batch)
+        
+        return {user_id: reports[user_id] for user_id in user_ids}
+    
+    def run_analytics_pipeline(self, workers=1, chunk_size=None):
+        """
+        Run complete learning analytics pipeline
+        workers: processes used for per-user reports (None = one per CPU core)
+        """
         print("Loading interaction data...")
         interactions = self.load_interactions()
         
@@ -436,25 +733,144 @@ class LearningAnalytics:
         
         print(f"Analyzing {len(self.learning_sessions)} users...")
         
-        results = {}
-        for user_id in self.learning_sessions:
-            if len(self.learning_sessions[user_id]) >= 2:
-                results[user_id] = self.generate_progress_report(user_id)
+        user_ids = [user_id for user_id, sessions in self.learning_sessions.items() if len(sessions) >= 2]
+        results = self.generate_progress_reports(user_ids, workers=workers, chunk_size=chunk_size)
         
         # Save results
         try:
-            with open('data/learning_analytics.json', 'w') as f:
+            with open(self.output_file, 'w') as f:
                 json.dump(results, f, indent=2, default=str)
             print(f"Analytics saved for {len(results)} users")
         except Exception as e:
             print(f"Error saving analytics: {e}")
         
         return results
+    
+    def run_incremental_pipeline(self, workers=1, chunk_size=None):
+        """
+        Update learning analytics with only the interactions logged since the last run.
+        The state file checkpoints the byte offset reached in the (append-only)
+        interactions log, a count of skipped malformed lines and, per user, the
+        closed session summaries, the raw interactions of the still-open trailing
+        session and the latest fitted learning/forgetting curve parameters. Only
+        users with new interactions are re-segmented and re-reported; their
+        reports are merged into the existing output file.
+        """
+        state = self._load_state()
+        
+        log_file = self.interactions_file
+        if os.path.exists(log_file) and os.path.getsize(log_file) < state['offset']:
+            print("Interaction log was truncated or replaced, rebuilding analytics state...")
+            state = _empty_state()
+        
+        interactions, offset, skipped = self._read_new_interactions(state['offset'])
+        if skipped:
+            print(f"Warning: skipped {skipped} malformed interaction lines")
+        state['skipped_lines'] = state.get('skipped_lines', 0) + skipped
+        
+        new_by_user = defaultdict(list)
+        for interaction in interactions:
+            new_by_user[interaction.get('ip_address', 'anonymous')].append(interaction)
+        
+        print(f"Processing {len(interactions)} new interactions from {len(new_by_user)} users...")
+        
+        for user_id, new_interactions in new_by_user.items():
+            user_state = state['users'].get(str(user_id), {'sessions': [], 'open_segment': []})
+            combined = ([_deserialize_interaction(i) for i in user_state['open_segment']] +
+                        new_interactions)
+            
+            # Only the trailing segment can still grow; everything before it is final
+            split = self._open_segment_start(combined)
+            closed_sessions = ([_deserialize_session(s) for s in user_state['sessions']] +
+                               self._segment_sessions(combined[:split]))
+            open_segment = combined[split:]
+            
+            self.learning_sessions[user_id] = closed_sessions + self._segment_sessions(open_segment)
+            state['users'][str(user_id)] = {
+                'user_id': user_id,
+                'sessions': [_serialize_session(s) for s in closed_sessions],
+                'open_segment': [_serialize_interaction(i) for i in open_segment]
+            }
+        
+        changed = [user_id for user_id in new_by_user if len(self.learning_sessions[user_id]) >= 2]
+        reports = self.generate_progress_reports(changed, workers=workers, chunk_size=chunk_size)
+        
+        for user_id, report in reports.items():
+            if report is not None:
+                state['users'][str(user_id)]['curves'] = _curve_parameters(report)
+        
+        results = {} if state['offset'] == 0 else self._load_json(self.output_file, {})
+        results.update(json.loads(json.dumps(reports, default=str)))
+        
+        state['offset'] = offset
+        state['last_run'] = datetime.now().isoformat()
+        
+        try:
+            _write_json_atomic(self.output_file, results, indent=2)
+            _write_json_atomic(self.state_file, state)
+            print(f"Analytics updated for {len(reports)} users ({len(results)} total)")
+        except Exception as e:
+            print(f"Error saving analytics: {e}")
+        
+        return reports
+    
+    def _read_new_interactions(self, offset):
+        """
+        Read complete log lines appended after offset; returns (interactions, new_offset, skipped).
+        Malformed complete lines are skipped and counted so the offset keeps advancing;
+        only a trailing line without its newline is held back for the next run.
+        """
+        interactions = []
+        skipped = 0
+        try:
+            with open(self.interactions_file, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # Partially written line, pick it up next run
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        interaction = json.loads(line)
+                        interaction['timestamp'] = datetime.fromisoformat(
+                            interaction['timestamp'].replace('Z', '+00:00')
+                        )
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        skipped += 1
+                        continue
+                    interactions.append(interaction)
+        except FileNotFoundError:
+            print(f"Warning: {self.interactions_file} not found.")
+        return sorted(interactions, key=lambda x: x['timestamp']), offset, skipped
+    
+    def _open_segment_start(self, interactions):
+        """Index where the last (possibly still open) session segment begins"""
+        for i in range(len(interactions) - 1, 0, -1):
+            time_gap = (interactions[i]['timestamp'] -
+                        interactions[i-1]['timestamp']).total_seconds() / 60
+            if time_gap > SESSION_GAP_MINUTES:
+                return i
+        return 0
+    
+    def _load_state(self):
+        """Load the incremental checkpoint, or an empty one if there is none"""
+        state = self._load_json(self.state_file, None)
+        if not state or state.get('version') != STATE_VERSION:
+            return _empty_state()
+        return state
+    
+    def _load_json(self, path, default):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return default
 
 # Example usage
 if __name__ == "__main__":
     analytics = LearningAnalytics()
-    results = analytics.run_analytics_pipeline()
+    results = analytics.run_analytics_pipeline(workers=None)
     
     if results:
         print("\n" + "="*60)